@@ -5,8 +5,8 @@ import time
 import pycozmo
 
 
-def on_camera_image(cli, image):
-    image.save("camera.png", "PNG")
+def on_camera_image(cli, frame):
+    frame.image.save("camera.png", "PNG")
 
 
 with pycozmo.connect() as cli:
@@ -121,6 +121,10 @@ class InputThread(object):
 class RCApp(object):
     """ Application class. """
 
+    # Minimum interval between wheel commands. Increased to the smoothed round-trip time on slow links, so that commands
+    # do not pile up in the send queue.
+    MIN_DRIVE_INTERVAL = 1.0 / 30.0
+
     def __init__(self, event_device=None):
         logging.info("Initializing...")
         self._stop = False
@@ -132,6 +136,9 @@ class RCApp(object):
         self.speed_left = 0.0   # 0 - 1.0
         self.speed_right = 0.0  # 0 - 1.0
         self.lift = True
+        self.drive_lock = threading.Lock()
+        self.drive_pending = None
+        self.drive_last = 0.0
 
     def init(self):
         """ Initialize application. """
@@ -167,7 +174,8 @@ class RCApp(object):
 
         while not self._stop:
             try:
-                time.sleep(1)
+                time.sleep(self.MIN_DRIVE_INTERVAL)
+                self._flush_drive_wheels()
             except KeyboardInterrupt:
                 self.stop()
 
@@ -188,7 +196,29 @@ class RCApp(object):
     def _drive_wheels(self, speed_left, speed_right):
         lw = int(speed_left * pycozmo.MAX_WHEEL_SPEED.mmps)
         rw = int(speed_right * pycozmo.MAX_WHEEL_SPEED.mmps)
-        self.cli.drive_wheels(lwheel_speed=lw, rwheel_speed=rw)
+        with self.drive_lock:
+            self.drive_pending = (lw, rw)
+        self._flush_drive_wheels()
+
+    def _get_drive_interval(self):
+        rtt = self.cli.conn.rtt
+        return max(self.MIN_DRIVE_INTERVAL, rtt.srtt or 0.0)
+
+    def _flush_drive_wheels(self):
+        """ Send the latest wheel command, limiting the command rate to what the link can sustain. """
+        # Sending under the lock keeps commands from the main and the input threads in order, so that an older
+        # command cannot follow a stop.
+        with self.drive_lock:
+            if self.drive_pending is None:
+                return
+            now = time.perf_counter()
+            # Always stop immediately.
+            if self.drive_pending != (0, 0) and now - self.drive_last < self._get_drive_interval():
+                return
+            lw, rw = self.drive_pending
+            self.drive_pending = None
+            self.drive_last = now
+            self.cli.drive_wheels(lwheel_speed=lw, rwheel_speed=rw)
 
     @staticmethod
     def get_motor_thrust(r: float, theta: float):
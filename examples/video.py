@@ -4,14 +4,14 @@ from PIL import Image
 import pycozmo
 
 
-# Last image, received from the robot.
-last_im = None
+# Last camera frame, received from the robot.
+last_frame = None
 
 
-def on_camera_image(cli, new_im):
-    """ Handle new images, coming from the robot. """
-    global last_im
-    last_im = new_im
+def on_camera_image(cli, frame):
+    """ Handle new camera frames, coming from the robot. """
+    global last_frame
+    last_frame = frame
 
 
 with pycozmo.connect(enable_procedural_face=False) as cli:
@@ -30,10 +30,10 @@ with pycozmo.connect(enable_procedural_face=False) as cli:
     timer = pycozmo.util.FPSTimer(14)
     while True:
 
-        if last_im:
+        if last_frame:
 
-            # Get last image.
-            im = last_im
+            # Get last image. Frames are decoded on first access.
+            im = last_frame.image
 
             # Resize from 320x240 to 68x17. Larger image sometime are too big for the robot receive buffer.
             im = im.resize((68, 17))
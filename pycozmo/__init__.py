@@ -18,6 +18,11 @@ from .event import *
 from . import exception
 from . import util
 from . import window
+from . import rtt
+from . import queues
+from . import metrics
+from . import conn
+from . import async_conn
 from . import protocol_base
 from . import protocol_declaration
 from . import protocol_generator
@@ -25,6 +30,7 @@ from . import protocol_encoder
 from . import protocol_utils
 from . import lights
 from . import camera
+from . import camera_recording
 from . import object
 from . import filter
 from . import anim
@@ -75,18 +75,19 @@ class PreprocessedClip(object):
                 pkt = protocol_encoder.TurnToRecordedHeading()
                 keyframes[keyframe.trigger_time_ms].append(pkt)
             elif isinstance(keyframe, anim_encoder.AnimBodyMotion):
+                # Speeds come from animation files. Only the stop packet is constructed without validation.
                 if keyframe.radius_mm == "STRAIGHT":
                     pkt = protocol_encoder.AnimBody(speed=keyframe.speed, unknown=32767)
                 elif keyframe.radius_mm == "TURN_IN_PLACE":
-                    pkt = protocol_encoder.TurnInPlaceAtSpeed(wheel_speed_mmps=keyframe.speed,
-                                                              direction=math.copysign(1.0, keyframe.speed))
+                    pkt = protocol_encoder.TurnInPlaceAtSpeed(
+                        wheel_speed_mmps=float(keyframe.speed), direction=int(math.copysign(1.0, keyframe.speed)))
                 else:
                     assert isinstance(keyframe.radius_mm, float)
                     vl = keyframe.speed * (keyframe.radius_mm - robot.TRACK_WIDTH.mm / 2.0)
                     vr = keyframe.speed * (keyframe.radius_mm + robot.TRACK_WIDTH.mm / 2.0)
                     pkt = protocol_encoder.DriveWheels(lwheel_speed_mmps=vl, rwheel_speed_mmps=vr)
                 keyframes[keyframe.trigger_time_ms].append(pkt)
-                pkt = protocol_encoder.DriveWheels()
+                pkt = protocol_encoder.DriveWheels.unchecked()
                 keyframes[keyframe.trigger_time_ms + keyframe.duration_ms].append(pkt)
             elif isinstance(keyframe, anim_encoder.AnimBackpackLights):
                 left = lights.Color(rgb=(keyframe.left.red, keyframe.left.green, keyframe.left.blue))
@@ -94,14 +95,12 @@ class PreprocessedClip(object):
                 middle = lights.Color(rgb=(keyframe.middle.red, keyframe.middle.green, keyframe.middle.blue))
                 back = lights.Color(rgb=(keyframe.back.red, keyframe.back.green, keyframe.back.blue))
                 right = lights.Color(rgb=(keyframe.right.red, keyframe.right.green, keyframe.right.blue))
-                pkt = protocol_encoder.AnimBackpackLights(colors=(left.to_int16(),
-                                                                  front.to_int16(), middle.to_int16(), back.to_int16(),
-                                                                  right.to_int16()))
+                pkt = protocol_encoder.AnimBackpackLights.unchecked(colors=(
+                    left.to_int16(), front.to_int16(), middle.to_int16(), back.to_int16(), right.to_int16()))
                 keyframes[keyframe.trigger_time_ms].append(pkt)
                 off_light = lights.off.to_int16()
-                pkt = protocol_encoder.AnimBackpackLights(colors=(off_light,
-                                                                  off_light, off_light, off_light,
-                                                                  off_light))
+                pkt = protocol_encoder.AnimBackpackLights.unchecked(colors=(
+                    off_light, off_light, off_light, off_light, off_light))
                 keyframes[keyframe.trigger_time_ms + keyframe.duration_ms].append(pkt)
             elif isinstance(keyframe, anim_encoder.AnimFaceAnimation):
                 # TODO
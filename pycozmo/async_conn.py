@@ -0,0 +1,292 @@
+"""
+
+Cozmo protocol low-level client and server connection, based on asyncio.
+
+All protocol processing happens in a single event loop, without per-connection threads.
+
+"""
+
+from typing import Optional, Tuple, List, Union, Any
+import asyncio
+import functools
+import time
+
+from .logger import logger, logger_protocol
+from .protocol_base import Packet
+from .queues import Priority
+from . import conn
+from . import event
+
+
+__all__ = [
+    "DatagramSender",
+    "ConnectionProtocol",
+    "AsyncConnection",
+    "HubProtocol",
+    "ConnectionHub",
+]
+
+
+class DatagramSender(conn.Sender):
+    """ Cozmo protocol connection send side, driven by an asyncio event loop. """
+
+    def __init__(self, receiver_address: Optional[Tuple[str, int]]) -> None:
+        super().__init__(receiver_address)
+        self.loop = None     # type: Optional[asyncio.AbstractEventLoop]
+        self.transport = None   # type: Optional[asyncio.DatagramTransport]
+        self.flush_scheduled = False
+        self.resend_handle = None     # type: Optional[asyncio.TimerHandle]
+
+    def attach(self, loop: asyncio.AbstractEventLoop, transport: asyncio.DatagramTransport) -> None:
+        self.loop = loop
+        self.transport = transport
+
+    def detach(self) -> None:
+        if self.resend_handle:
+            self.resend_handle.cancel()
+            self.resend_handle = None
+        self.transport = None
+
+    def send(self, data: Any, priority: Optional[Priority] = None) -> None:
+        # May be called from any thread.
+        with self.lock:
+            self._enqueue(data, priority)
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self.flush_scheduled or self.loop is None:
+            return
+        self.flush_scheduled = True
+        self.loop.call_soon_threadsafe(self.flush)
+
+    def flush(self) -> None:
+        """ Resend unacknowledged packets and frame queued packets that fit in the window, if due. """
+        self.flush_scheduled = False
+        if self.transport is None:
+            return
+        try:
+            with self.lock:
+                frame_due = self._get_frame_delay(self.clock()) == 0.0
+            self._send_due_packets(frame_due)
+        except Exception as e:
+            logger_protocol.error("Failed to send packets. {}".format(e))
+        self._schedule_resend()
+
+    def _schedule_resend(self) -> None:
+        if self.resend_handle:
+            self.resend_handle.cancel()
+            self.resend_handle = None
+        with self.lock:
+            timeout = self._get_send_timeout(self.clock())
+        if timeout is not None:
+            self.resend_handle = self.loop.call_later(timeout, self.flush)
+
+    def _sendto(self, raw_frame: Union[bytes, memoryview], address: Tuple[str, int]) -> None:
+        self.transport.sendto(raw_frame, address)
+
+    def ack(self, seq: int, last_ack: int) -> None:
+        super().ack(seq, last_ack)
+        with self.lock:
+            needs_flush = self._has_new_messages() or self.fast_retransmit or \
+                (self.resend_handle is None and not self.window.is_empty())
+        if needs_flush:
+            # Acknowledgements free up window space, start resend timeouts, and trigger fast retransmits.
+            self._schedule_flush()
+
+
+class ConnectionProtocol(asyncio.DatagramProtocol):
+    """ asyncio datagram protocol that feeds received datagrams to a receiver. """
+
+    def __init__(self, receiver: conn.Receiver) -> None:
+        super().__init__()
+        self.receiver = receiver
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        self.receiver.handle_datagram(data, addr)
+
+    def error_received(self, exc: Exception) -> None:
+        self.receiver.discarded_frames += 1
+        logger_protocol.error("Failed to receive frame. {}".format(exc))
+
+
+class AsyncConnection(conn.BaseConnection):
+    """
+    Cozmo protocol low-level connection implementing bot client and server sides on top of asyncio.
+
+    Provides the same send(), post_event(), and handler API as pycozmo.conn.Connection. Handlers are called from the
+    event loop.
+    """
+
+    def __init__(self,
+                 robot_addr: Optional[Tuple[str, int]] = None,
+                 protocol_log_messages: Optional[list] = None,
+                 server: bool = False) -> None:
+        super().__init__(robot_addr, protocol_log_messages, server)
+        self.loop = None    # type: Optional[asyncio.AbstractEventLoop]
+        self.transport = None   # type: Optional[asyncio.DatagramTransport]
+        self._sender = DatagramSender(None if server else self.robot_addr)
+        self._receiver = conn.Receiver(self._sender, None if server else self.robot_addr, self._on_packet)
+        self.timer_handle = None     # type: Optional[asyncio.TimerHandle]
+        # Whether the transport is owned by the connection or shared (e.g. by a ConnectionHub).
+        self.owns_transport = False
+
+    @property
+    def sender(self) -> DatagramSender:
+        return self._sender
+
+    @property
+    def receiver(self) -> conn.Receiver:
+        return self._receiver
+
+    async def start(self) -> None:
+        logger.debug("Starting...")
+        loop = asyncio.get_event_loop()
+        local_addr = self.robot_addr if self.server else ("0.0.0.0", 0)
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: ConnectionProtocol(self._receiver), local_addr=local_addr)
+        self.owns_transport = True
+        self.attach(loop, transport)
+        self._schedule_timers()
+
+    def stop(self) -> None:
+        logger.debug("Stopping...")
+        if self.timer_handle:
+            self.timer_handle.cancel()
+            self.timer_handle = None
+        transport = self.transport
+        self.detach()
+        if transport and self.owns_transport:
+            transport.close()
+        self.del_all_handlers()
+
+    def attach(self, loop: asyncio.AbstractEventLoop, transport: asyncio.DatagramTransport) -> None:
+        """ Attach the connection to an event loop and a datagram transport. """
+        self.loop = loop
+        self.transport = transport
+        self._add_protocol_handlers()
+        self._sender.attach(loop, transport)
+
+    def detach(self) -> None:
+        """ Detach the connection from its datagram transport. """
+        self._sender.detach()
+        self.transport = None
+
+    def _schedule_timers(self) -> None:
+        self._check_timers(time.perf_counter())
+        self.timer_handle = self.loop.call_later(self.PING_INTERVAL / 5, self._schedule_timers)
+
+    def _on_packet(self, pkt: Packet) -> None:
+        if self._filter_packet(pkt):
+            return
+        self._process_event(event.EvtPacketReceived, pkt)
+
+    def _process_event(self, evt, *args, **kwargs) -> None:
+        try:
+            self._dispatch_event(evt, *args, **kwargs)
+        except Exception as e:
+            logger.error("Failed to process event {}. {}".format(evt, e))
+
+    def _send_raw_frame(self, raw_frame: bytes) -> None:
+        if self.transport is None:
+            return
+        self.transport.sendto(raw_frame, self.robot_addr)
+
+    def post_event(self, evt, *args, **kwargs) -> None:
+        # May be called from any thread.
+        self.loop.call_soon_threadsafe(functools.partial(self._process_event, evt, *args, **kwargs))
+
+
+class HubProtocol(asyncio.DatagramProtocol):
+    """ asyncio datagram protocol that feeds received datagrams to a connection hub. """
+
+    def __init__(self, hub: "ConnectionHub") -> None:
+        super().__init__()
+        self.hub = hub
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        self.hub.datagram_received(data, addr)
+
+    def error_received(self, exc: Exception) -> None:
+        self.hub.discarded_frames += 1
+        logger_protocol.error("Failed to receive frame. {}".format(exc))
+
+
+class ConnectionHub(object):
+    """
+    Multi-robot connection hub.
+
+    Multiplexes client connections to many robots over a single UDP socket and a single event loop. Incoming
+    datagrams are demultiplexed by source address and ping and statistics timers for all connections are driven by a
+    single scheduler.
+    """
+
+    TIMER_INTERVAL = 0.1
+
+    def __init__(self, local_addr: Tuple[str, int] = ("0.0.0.0", 0)) -> None:
+        self.local_addr = local_addr
+        self.loop = None    # type: Optional[asyncio.AbstractEventLoop]
+        self.transport = None   # type: Optional[asyncio.DatagramTransport]
+        # Robot address -> connection.
+        self.connections = {}
+        self.timer_handle = None     # type: Optional[asyncio.TimerHandle]
+        # Number of discarded frames (e.g. unknown source address).
+        self.discarded_frames = 0
+
+    async def start(self) -> None:
+        logger.debug("Starting connection hub...")
+        self.loop = asyncio.get_event_loop()
+        self.transport, _ = await self.loop.create_datagram_endpoint(
+            lambda: HubProtocol(self), local_addr=self.local_addr)
+        for connection in self.connections.values():
+            connection.attach(self.loop, self.transport)
+        self._on_timer()
+
+    def stop(self) -> None:
+        logger.debug("Stopping connection hub...")
+        if self.timer_handle:
+            self.timer_handle.cancel()
+            self.timer_handle = None
+        for connection in list(self.connections.values()):
+            self.remove_connection(connection)
+        if self.transport:
+            self.transport.close()
+            self.transport = None
+
+    def add_connection(self,
+                       robot_addr: Tuple[str, int],
+                       protocol_log_messages: Optional[list] = None) -> AsyncConnection:
+        """ Create a new client connection to a robot with the given address. """
+        if robot_addr in self.connections:
+            raise ValueError("Connection to {} already exists.".format(robot_addr))
+        connection = AsyncConnection(robot_addr, protocol_log_messages)
+        self.connections[connection.robot_addr] = connection
+        if self.transport:
+            connection.attach(self.loop, self.transport)
+        return connection
+
+    def remove_connection(self, connection: AsyncConnection) -> None:
+        """ Remove a connection from the hub. """
+        if self.connections.get(connection.robot_addr) is not connection:
+            return
+        del self.connections[connection.robot_addr]
+        connection.stop()
+
+    def get_connections(self) -> List[AsyncConnection]:
+        return list(self.connections.values())
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        connection = self.connections.get(addr)
+        if connection is None:
+            self.discarded_frames += 1
+            logger_protocol.debug("Received a UDP datagram from unexpected address {}.".format(addr))
+            return
+        connection.receiver.handle_datagram(data, addr)
+
+    def _on_timer(self) -> None:
+        now = time.perf_counter()
+        for connection in self.connections.values():
+            try:
+                connection._check_timers(now)
+            except Exception as e:
+                logger.error("Failed to process timers for {}. {}".format(connection.robot_addr, e))
+        self.timer_handle = self.loop.call_later(self.TIMER_INTERVAL, self._on_timer)
@@ -47,7 +47,8 @@ def load_wav(filename: str) -> List[protocol_encoder.OutputAudio]:
             if not frame_in:
                 break
             frame_out = bytes_to_cozmo(frame_in, ratediv, channels)
-            pkt = protocol_encoder.OutputAudio(samples=frame_out)
+            # bytes_to_cozmo() always produces complete frames.
+            pkt = protocol_encoder.OutputAudio.unchecked(samples=frame_out)
             pkts.append(pkt)
 
     logger.debug("Loaded WAVE file in {:.02f} s.".format(time.perf_counter() - start_time))
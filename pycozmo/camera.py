@@ -4,13 +4,30 @@ Camera image decoding.
 
 """
 
+from collections import defaultdict
+from enum import Enum
+from threading import Lock, RLock, Condition, Thread
+from typing import Optional, Callable, Any
+import io
+import time
+
 import numpy as np
+from PIL import Image
 
+from .logger import logger
 from . import protocol_encoder
 
 
 __all__ = [
     "RESOLUTIONS",
+    "MINIGRAY_HEADER",
+    "MINICOLOR_HEADER",
+
+    "ImageFormat",
+    "BufferPool",
+    "RawImage",
+    "CameraFrame",
+    "DecodeWorker",
 
     "minigray_to_jpeg",
     "minicolor_to_jpeg",
@@ -35,113 +52,425 @@ RESOLUTIONS = {
 }
 
 
+#: JPEG header for miniGrayToJpeg images. Image dimensions are set at HEADER_SIZE_OFFSET.
+MINIGRAY_HEADER = np.array([
+    0xFF, 0xD8, 0xFF, 0xE0, 0x00, 0x10, 0x4A, 0x46, 0x49, 0x46, 0x00, 0x01, 0x01, 0x00, 0x00, 0x01,
+    0x00, 0x01, 0x00, 0x00, 0xFF, 0xDB, 0x00, 0x43, 0x00, 0x10, 0x0B, 0x0C, 0x0E, 0x0C, 0x0A, 0x10,
+    # // 0x19 = QTable
+    0x0E, 0x0D, 0x0E, 0x12, 0x11, 0x10, 0x13, 0x18, 0x28, 0x1A, 0x18, 0x16, 0x16, 0x18, 0x31, 0x23,
+    0x25, 0x1D, 0x28, 0x3A, 0x33, 0x3D, 0x3C, 0x39, 0x33, 0x38, 0x37, 0x40, 0x48, 0x5C, 0x4E, 0x40,
+    0x44, 0x57, 0x45, 0x37, 0x38, 0x50, 0x6D, 0x51, 0x57, 0x5F, 0x62, 0x67, 0x68, 0x67, 0x3E, 0x4D,
+
+    # //0x71, 0x79, 0x70, 0x64, 0x78, 0x5C, 0x65, 0x67, 0x63, 0xFF, 0xC0, 0x00, 0x0B, 0x08, 0x00, 0xF0,
+    0x71, 0x79, 0x70, 0x64, 0x78, 0x5C, 0x65, 0x67, 0x63, 0xFF, 0xC0, 0x00, 0x0B, 0x08, 0x01, 0x28,
+    # // 0x5E = Height x Width
+
+    # //0x01, 0x40, 0x01, 0x01, 0x11, 0x00, 0xFF, 0xC4, 0x00, 0xD2, 0x00, 0x00, 0x01, 0x05, 0x01, 0x01,
+    0x01, 0x90, 0x01, 0x01, 0x11, 0x00, 0xFF, 0xC4, 0x00, 0xD2, 0x00, 0x00, 0x01, 0x05, 0x01, 0x01,
+
+    0x01, 0x01, 0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x02, 0x03, 0x04,
+    0x05, 0x06, 0x07, 0x08, 0x09, 0x0A, 0x0B, 0x10, 0x00, 0x02, 0x01, 0x03, 0x03, 0x02, 0x04, 0x03,
+    0x05, 0x05, 0x04, 0x04, 0x00, 0x00, 0x01, 0x7D, 0x01, 0x02, 0x03, 0x00, 0x04, 0x11, 0x05, 0x12,
+    0x21, 0x31, 0x41, 0x06, 0x13, 0x51, 0x61, 0x07, 0x22, 0x71, 0x14, 0x32, 0x81, 0x91, 0xA1, 0x08,
+    0x23, 0x42, 0xB1, 0xC1, 0x15, 0x52, 0xD1, 0xF0, 0x24, 0x33, 0x62, 0x72, 0x82, 0x09, 0x0A, 0x16,
+    0x17, 0x18, 0x19, 0x1A, 0x25, 0x26, 0x27, 0x28, 0x29, 0x2A, 0x34, 0x35, 0x36, 0x37, 0x38, 0x39,
+    0x3A, 0x43, 0x44, 0x45, 0x46, 0x47, 0x48, 0x49, 0x4A, 0x53, 0x54, 0x55, 0x56, 0x57, 0x58, 0x59,
+    0x5A, 0x63, 0x64, 0x65, 0x66, 0x67, 0x68, 0x69, 0x6A, 0x73, 0x74, 0x75, 0x76, 0x77, 0x78, 0x79,
+    0x7A, 0x83, 0x84, 0x85, 0x86, 0x87, 0x88, 0x89, 0x8A, 0x92, 0x93, 0x94, 0x95, 0x96, 0x97, 0x98,
+    0x99, 0x9A, 0xA2, 0xA3, 0xA4, 0xA5, 0xA6, 0xA7, 0xA8, 0xA9, 0xAA, 0xB2, 0xB3, 0xB4, 0xB5, 0xB6,
+    0xB7, 0xB8, 0xB9, 0xBA, 0xC2, 0xC3, 0xC4, 0xC5, 0xC6, 0xC7, 0xC8, 0xC9, 0xCA, 0xD2, 0xD3, 0xD4,
+    0xD5, 0xD6, 0xD7, 0xD8, 0xD9, 0xDA, 0xE1, 0xE2, 0xE3, 0xE4, 0xE5, 0xE6, 0xE7, 0xE8, 0xE9, 0xEA,
+    0xF1, 0xF2, 0xF3, 0xF4, 0xF5, 0xF6, 0xF7, 0xF8, 0xF9, 0xFA, 0xFF, 0xDA, 0x00, 0x08, 0x01, 0x01,
+    0x00, 0x00, 0x3F, 0x00
+], dtype=np.uint8)
+
+#: JPEG header for miniColorToJpeg images. Image dimensions are set at HEADER_SIZE_OFFSET.
+MINICOLOR_HEADER = np.array([
+    0xFF, 0xD8, 0xFF, 0xE0, 0x00, 0x10, 0x4A, 0x46, 0x49, 0x46, 0x00, 0x01, 0x01, 0x00, 0x00, 0x01,
+    0x00, 0x01, 0x00, 0x00, 0xFF, 0xDB, 0x00, 0x43, 0x00, 0x10, 0x0B, 0x0C, 0x0E, 0x0C, 0x0A, 0x10,
+    # 0x19 = QTable
+    0x0E, 0x0D, 0x0E, 0x12, 0x11, 0x10, 0x13, 0x18, 0x28, 0x1A, 0x18, 0x16, 0x16, 0x18, 0x31, 0x23,
+    0x25, 0x1D, 0x28, 0x3A, 0x33, 0x3D, 0x3C, 0x39, 0x33, 0x38, 0x37, 0x40, 0x48, 0x5C, 0x4E, 0x40,
+    0x44, 0x57, 0x45, 0x37, 0x38, 0x50, 0x6D, 0x51, 0x57, 0x5F, 0x62, 0x67, 0x68, 0x67, 0x3E, 0x4D,
+    0x71, 0x79, 0x70, 0x64, 0x78, 0x5C, 0x65, 0x67, 0x63, 0xFF, 0xC0, 0x00, 17,  # 8+3*components
+    0x08, 0x00, 0xF0,  # 0x5E = Height x Width
+    0x01, 0x40,
+    0x03,  # 3 components
+    0x01, 0x21, 0x00,  # Y 2x1 res
+    0x02, 0x11, 0x00,  # Cb
+    0x03, 0x11, 0x00,  # Cr
+    0xFF, 0xC4, 0x00, 0xD2, 0x00, 0x00, 0x01, 0x05, 0x01, 0x01,
+    0x01, 0x01, 0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x02, 0x03, 0x04,
+    0x05, 0x06, 0x07, 0x08, 0x09, 0x0A, 0x0B, 0x10, 0x00, 0x02, 0x01, 0x03, 0x03, 0x02, 0x04, 0x03,
+    0x05, 0x05, 0x04, 0x04, 0x00, 0x00, 0x01, 0x7D, 0x01, 0x02, 0x03, 0x00, 0x04, 0x11, 0x05, 0x12,
+    0x21, 0x31, 0x41, 0x06, 0x13, 0x51, 0x61, 0x07, 0x22, 0x71, 0x14, 0x32, 0x81, 0x91, 0xA1, 0x08,
+    0x23, 0x42, 0xB1, 0xC1, 0x15, 0x52, 0xD1, 0xF0, 0x24, 0x33, 0x62, 0x72, 0x82, 0x09, 0x0A, 0x16,
+    0x17, 0x18, 0x19, 0x1A, 0x25, 0x26, 0x27, 0x28, 0x29, 0x2A, 0x34, 0x35, 0x36, 0x37, 0x38, 0x39,
+    0x3A, 0x43, 0x44, 0x45, 0x46, 0x47, 0x48, 0x49, 0x4A, 0x53, 0x54, 0x55, 0x56, 0x57, 0x58, 0x59,
+    0x5A, 0x63, 0x64, 0x65, 0x66, 0x67, 0x68, 0x69, 0x6A, 0x73, 0x74, 0x75, 0x76, 0x77, 0x78, 0x79,
+    0x7A, 0x83, 0x84, 0x85, 0x86, 0x87, 0x88, 0x89, 0x8A, 0x92, 0x93, 0x94, 0x95, 0x96, 0x97, 0x98,
+    0x99, 0x9A, 0xA2, 0xA3, 0xA4, 0xA5, 0xA6, 0xA7, 0xA8, 0xA9, 0xAA, 0xB2, 0xB3, 0xB4, 0xB5, 0xB6,
+    0xB7, 0xB8, 0xB9, 0xBA, 0xC2, 0xC3, 0xC4, 0xC5, 0xC6, 0xC7, 0xC8, 0xC9, 0xCA, 0xD2, 0xD3, 0xD4,
+    0xD5, 0xD6, 0xD7, 0xD8, 0xD9, 0xDA, 0xE1, 0xE2, 0xE3, 0xE4, 0xE5, 0xE6, 0xE7, 0xE8, 0xE9, 0xEA,
+    0xF1, 0xF2, 0xF3, 0xF4, 0xF5, 0xF6, 0xF7, 0xF8, 0xF9, 0xFA,
+    0xFF, 0xDA, 0x00, 12,
+    0x03,  # 3 components
+    0x01, 0x00,  # Y
+    0x02, 0x00,  # Cb same AC/DC
+    0x03, 0x00,  # Cr same AC/DC
+    0x00, 0x3F, 0x00
+], dtype=np.uint8)
+
+#: Offset of image height and width in JPEG headers.
+HEADER_SIZE_OFFSET = 0x5e
+#: JPEG end of image marker.
+JPEG_EOI = np.array([0xFF, 0xD9], dtype=np.uint8)
+
+
+class ImageFormat(Enum):
+    """ Camera image formats, delivered with EvtNewRawCameraImage events. """
+    # CameraFrame object, converting to other formats on demand.
+    FRAME = 0
+    # RGB PIL image, resized to the camera resolution.
+    PIL = 1
+    # JPEG data bytes, as encoded by the robot (color images are half width).
+    JPEG = 2
+    # JPEG data as a uint8 NumPy array, as encoded by the robot (color images are half width).
+    ARRAY = 3
+
+
+class BufferPool(object):
+    """
+    Pool of preallocated camera image reassembly buffers, keyed by image resolution.
+
+    Buffers are uint8 NumPy arrays, large enough for an uncompressed RGB image of the given resolution. Taking and
+    returning buffers is safe from any thread.
+    """
+
+    def __init__(self, max_buffers: int = 2) -> None:
+        self.lock = Lock()
+        # Maximum number of free buffers, kept per resolution.
+        self.max_buffers = max_buffers
+        # Resolution -> list of free buffers.
+        self.buffers = defaultdict(list)
+        # Number of allocated and reused buffers.
+        self.allocated = 0
+        self.reused = 0
+
+    def get(self, resolution: protocol_encoder.ImageResolution) -> np.ndarray:
+        """ Take a buffer for the given resolution from the pool or allocate a new one. """
+        with self.lock:
+            free = self.buffers.get(resolution)
+            if free:
+                self.reused += 1
+                return free.pop()
+            self.allocated += 1
+        width, height = RESOLUTIONS[resolution]
+        return np.empty(width * height * 3, dtype=np.uint8)
+
+    def put(self, resolution: protocol_encoder.ImageResolution, buffer: np.ndarray) -> None:
+        """ Return a buffer to the pool. """
+        with self.lock:
+            free = self.buffers[resolution]
+            if len(free) < self.max_buffers:
+                free.append(buffer)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.buffers.clear()
+
+
+class RawImage(object):
+    """ Reassembled, not yet decoded camera image. """
+
+    __slots__ = (
+        "image_id",
+        "frame_timestamp",
+        "encoding",
+        "resolution",
+        "data",
+        "size",
+        "receive_time",
+    )
+
+    def __init__(self,
+                 image_id: int,
+                 frame_timestamp: int,
+                 encoding: protocol_encoder.ImageEncoding,
+                 resolution: protocol_encoder.ImageResolution,
+                 data: np.ndarray,
+                 size: int,
+                 receive_time: Optional[float] = None) -> None:
+        self.image_id = image_id
+        self.frame_timestamp = frame_timestamp
+        self.encoding = encoding
+        self.resolution = resolution
+        # Reassembly buffer and size of the image data in it.
+        self.data = data
+        self.size = size
+        # Time of reception of the last image chunk (time.perf_counter()).
+        self.receive_time = time.perf_counter() if receive_time is None else receive_time
+
+    def get_data(self) -> np.ndarray:
+        """ Get image data, without copying it out of the reassembly buffer. """
+        return self.data[:self.size]
+
+
+class CameraFrame(object):
+    """
+    Camera image with on-demand conversion.
+
+    Holds the image data as received from the robot and converts it to JPEG, PIL, or NumPy representations on first
+    access. Results are cached, so each representation is computed at most once, and unused representations are never
+    computed. Cached representations are shared and must not be modified - NumPy arrays are read-only.
+
+    Conversions are safe from any thread.
+    """
+
+    def __init__(self,
+                 data: np.ndarray,
+                 encoding: protocol_encoder.ImageEncoding,
+                 resolution: protocol_encoder.ImageResolution,
+                 image_id: int = 0,
+                 frame_timestamp: int = 0,
+                 receive_time: Optional[float] = None) -> None:
+        # Image data, as received from the robot.
+        self.data = data
+        self.encoding = protocol_encoder.ImageEncoding(encoding)
+        self.resolution = protocol_encoder.ImageResolution(resolution)
+        self.image_id = image_id
+        self.frame_timestamp = frame_timestamp
+        # Time of reception (time.perf_counter()).
+        self.receive_time = time.perf_counter() if receive_time is None else receive_time
+        # Time from reception to delivery to event handlers.
+        self.decode_latency = None  # type: Optional[float]
+        self._lock = RLock()
+        # Representation name -> cached value.
+        self._cache = {}
+
+    @classmethod
+    def from_raw_image(cls, raw: RawImage) -> "CameraFrame":
+        """ Construct from a raw image. Image data is copied out of the reassembly buffer. """
+        data = raw.get_data().copy()
+        data.flags.writeable = False
+        return cls(data, raw.encoding, raw.resolution, raw.image_id, raw.frame_timestamp, raw.receive_time)
+
+    @property
+    def width(self) -> int:
+        return RESOLUTIONS[self.resolution][0]
+
+    @property
+    def height(self) -> int:
+        return RESOLUTIONS[self.resolution][1]
+
+    @property
+    def is_color(self) -> bool:
+        # The first byte of the image is whether or not it is in color
+        return self.data[0] != 0
+
+    @property
+    def jpeg_array(self) -> np.ndarray:
+        """ JPEG data as a uint8 NumPy array, as encoded by the robot (color images are half width). """
+        return self._get("jpeg_array", self._to_jpeg_array)
+
+    @property
+    def jpeg(self) -> bytes:
+        """ JPEG data bytes, as encoded by the robot (color images are half width). """
+        return self._get("jpeg", lambda: self.jpeg_array.tobytes())
+
+    @property
+    def image(self) -> Image.Image:
+        """ RGB PIL image, resized to the camera resolution. """
+        return self._get("image", lambda: self._open().convert("RGB"))
+
+    @property
+    def gray(self) -> np.ndarray:
+        """ Grayscale image as a height x width uint8 NumPy array. """
+        return self._get("gray", lambda: self._to_array(self._open().convert("L")))
+
+    @property
+    def rgb(self) -> np.ndarray:
+        """ RGB image as a height x width x 3 uint8 NumPy array. """
+        return self._get("rgb", lambda: self._to_array(self.image))
+
+    def _get(self, name: str, convert: Callable[[], Any]) -> Any:
+        value = self._cache.get(name)
+        if value is None:
+            with self._lock:
+                value = self._cache.get(name)
+                if value is None:
+                    value = convert()
+                    self._cache[name] = value
+        return value
+
+    def _to_jpeg_array(self) -> np.ndarray:
+        if self.encoding != protocol_encoder.ImageEncoding.JPEGMinimizedGray:
+            return self.data
+        width, height = RESOLUTIONS[self.resolution]
+        if self.is_color:
+            # Color images are half width
+            res = minicolor_to_jpeg(self.data, width // 2, height)
+        else:
+            res = minigray_to_jpeg(self.data, width, height)
+        res.flags.writeable = False
+        return res
+
+    def _open(self) -> Image.Image:
+        """ Decode the image in its native mode. Called with the lock held. """
+        image = self._cache.get("image")
+        if image is not None:
+            return image
+        image = Image.open(io.BytesIO(self.jpeg_array))
+        # Color images need to be resized to the proper resolution
+        if self.is_color:
+            image = image.convert("RGB").resize(RESOLUTIONS[self.resolution])
+        return image
+
+    @staticmethod
+    def _to_array(image: Image.Image) -> np.ndarray:
+        res = np.asarray(image)
+        res.flags.writeable = False
+        return res
+
+    def __repr__(self) -> str:
+        return "{}(image_id={}, frame_timestamp={}, resolution={}, encoding={}, size={})".format(
+            type(self).__name__, self.image_id, self.frame_timestamp, self.resolution.name, self.encoding.name,
+            len(self.data))
+
+
+class DecodeWorker(object):
+    """
+    Camera image decoding thread.
+
+    Decodes raw images off the thread that reassembles them. Only the latest raw image is kept - a raw image that is
+    not picked up for decoding before the next one arrives is dropped, so slow decoding results in a lower frame rate
+    rather than growing latency.
+
+    decode() is called with raw images from the decoding thread. Its result is passed to deliver(), together with the
+    raw image and the decoding latency in seconds - from image reception to decoding completion. release() is called
+    with every raw image, decoded or dropped, once it is no longer used (e.g. to return its buffer to a pool).
+    """
+
+    def __init__(self,
+                 decode: Callable[[RawImage], Any],
+                 deliver: Callable[[RawImage, Any, float], None],
+                 release: Optional[Callable[[RawImage], None]] = None) -> None:
+        self.decode = decode
+        self.deliver = deliver
+        self.release = release
+        self.lock = Lock()
+        self.not_empty = Condition(self.lock)
+        self.pending = None     # type: Optional[RawImage]
+        self.thread = None      # type: Optional[Thread]
+        self.stop_flag = False
+        # Number of decoded, dropped, and failed images.
+        self.decoded = 0
+        self.dropped = 0
+        self.failed = 0
+        # Latest, maximum, and total decoding latency.
+        self.last_latency = None    # type: Optional[float]
+        self.max_latency = 0.0
+        self.total_latency = 0.0
+
+    def start(self) -> None:
+        self.stop_flag = False
+        self.thread = Thread(daemon=True, name=type(self).__name__, target=self._run)
+        self.thread.start()
+
+    def stop(self) -> None:
+        with self.lock:
+            self.stop_flag = True
+            self.not_empty.notify()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+        with self.lock:
+            raw, self.pending = self.pending, None
+        if raw is not None:
+            self._release(raw)
+
+    def is_running(self) -> bool:
+        return self.thread is not None
+
+    def put(self, raw: RawImage) -> None:
+        """ Queue a raw image for decoding, replacing any image that is still waiting. """
+        with self.lock:
+            dropped, self.pending = self.pending, raw
+            if dropped is not None:
+                self.dropped += 1
+            self.not_empty.notify()
+        if dropped is not None:
+            self._release(dropped)
+
+    def _release(self, raw: RawImage) -> None:
+        if self.release:
+            self.release(raw)
+
+    def _run(self) -> None:
+        while True:
+            with self.lock:
+                self.not_empty.wait_for(lambda: self.pending is not None or self.stop_flag)
+                if self.stop_flag:
+                    break
+                raw, self.pending = self.pending, None
+            try:
+                image = self.decode(raw)
+            except Exception as e:
+                self.failed += 1
+                logger.error("Failed to decode camera image. {}".format(e))
+                continue
+            finally:
+                self._release(raw)
+            latency = time.perf_counter() - raw.receive_time
+            self.decoded += 1
+            self.last_latency = latency
+            self.max_latency = max(self.max_latency, latency)
+            self.total_latency += latency
+            try:
+                self.deliver(raw, image, latency)
+            except Exception as e:
+                logger.error("Failed to deliver camera image. {}".format(e))
+
+    def get_average_latency(self) -> Optional[float]:
+        return self.total_latency / self.decoded if self.decoded else None
+
+
 def minigray_to_jpeg(minigray, width, height):
     """ Converts miniGrayToJpeg format to normal JPEG format. """
-    header50 = np.array([
-        0xFF, 0xD8, 0xFF, 0xE0, 0x00, 0x10, 0x4A, 0x46, 0x49, 0x46, 0x00, 0x01, 0x01, 0x00, 0x00, 0x01,
-        0x00, 0x01, 0x00, 0x00, 0xFF, 0xDB, 0x00, 0x43, 0x00, 0x10, 0x0B, 0x0C, 0x0E, 0x0C, 0x0A, 0x10,
-        # // 0x19 = QTable
-        0x0E, 0x0D, 0x0E, 0x12, 0x11, 0x10, 0x13, 0x18, 0x28, 0x1A, 0x18, 0x16, 0x16, 0x18, 0x31, 0x23,
-        0x25, 0x1D, 0x28, 0x3A, 0x33, 0x3D, 0x3C, 0x39, 0x33, 0x38, 0x37, 0x40, 0x48, 0x5C, 0x4E, 0x40,
-        0x44, 0x57, 0x45, 0x37, 0x38, 0x50, 0x6D, 0x51, 0x57, 0x5F, 0x62, 0x67, 0x68, 0x67, 0x3E, 0x4D,
-
-        # //0x71, 0x79, 0x70, 0x64, 0x78, 0x5C, 0x65, 0x67, 0x63, 0xFF, 0xC0, 0x00, 0x0B, 0x08, 0x00, 0xF0,
-        0x71, 0x79, 0x70, 0x64, 0x78, 0x5C, 0x65, 0x67, 0x63, 0xFF, 0xC0, 0x00, 0x0B, 0x08, 0x01, 0x28,
-        # // 0x5E = Height x Width
-
-        # //0x01, 0x40, 0x01, 0x01, 0x11, 0x00, 0xFF, 0xC4, 0x00, 0xD2, 0x00, 0x00, 0x01, 0x05, 0x01, 0x01,
-        0x01, 0x90, 0x01, 0x01, 0x11, 0x00, 0xFF, 0xC4, 0x00, 0xD2, 0x00, 0x00, 0x01, 0x05, 0x01, 0x01,
-
-        0x01, 0x01, 0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x02, 0x03, 0x04,
-        0x05, 0x06, 0x07, 0x08, 0x09, 0x0A, 0x0B, 0x10, 0x00, 0x02, 0x01, 0x03, 0x03, 0x02, 0x04, 0x03,
-        0x05, 0x05, 0x04, 0x04, 0x00, 0x00, 0x01, 0x7D, 0x01, 0x02, 0x03, 0x00, 0x04, 0x11, 0x05, 0x12,
-        0x21, 0x31, 0x41, 0x06, 0x13, 0x51, 0x61, 0x07, 0x22, 0x71, 0x14, 0x32, 0x81, 0x91, 0xA1, 0x08,
-        0x23, 0x42, 0xB1, 0xC1, 0x15, 0x52, 0xD1, 0xF0, 0x24, 0x33, 0x62, 0x72, 0x82, 0x09, 0x0A, 0x16,
-        0x17, 0x18, 0x19, 0x1A, 0x25, 0x26, 0x27, 0x28, 0x29, 0x2A, 0x34, 0x35, 0x36, 0x37, 0x38, 0x39,
-        0x3A, 0x43, 0x44, 0x45, 0x46, 0x47, 0x48, 0x49, 0x4A, 0x53, 0x54, 0x55, 0x56, 0x57, 0x58, 0x59,
-        0x5A, 0x63, 0x64, 0x65, 0x66, 0x67, 0x68, 0x69, 0x6A, 0x73, 0x74, 0x75, 0x76, 0x77, 0x78, 0x79,
-        0x7A, 0x83, 0x84, 0x85, 0x86, 0x87, 0x88, 0x89, 0x8A, 0x92, 0x93, 0x94, 0x95, 0x96, 0x97, 0x98,
-        0x99, 0x9A, 0xA2, 0xA3, 0xA4, 0xA5, 0xA6, 0xA7, 0xA8, 0xA9, 0xAA, 0xB2, 0xB3, 0xB4, 0xB5, 0xB6,
-        0xB7, 0xB8, 0xB9, 0xBA, 0xC2, 0xC3, 0xC4, 0xC5, 0xC6, 0xC7, 0xC8, 0xC9, 0xCA, 0xD2, 0xD3, 0xD4,
-        0xD5, 0xD6, 0xD7, 0xD8, 0xD9, 0xDA, 0xE1, 0xE2, 0xE3, 0xE4, 0xE5, 0xE6, 0xE7, 0xE8, 0xE9, 0xEA,
-        0xF1, 0xF2, 0xF3, 0xF4, 0xF5, 0xF6, 0xF7, 0xF8, 0xF9, 0xFA, 0xFF, 0xDA, 0x00, 0x08, 0x01, 0x01,
-        0x00, 0x00, 0x3F, 0x00
-    ], dtype=np.uint8)
-
-    return mini_to_jpeg_helper(minigray, width, height, header50)
+    return mini_to_jpeg_helper(minigray, width, height, MINIGRAY_HEADER)
 
 
 def minicolor_to_jpeg(minicolor, width, height):
     """ Converts miniColorToJpeg format to normal JPEG format. """
-    header = np.array([
-        0xFF, 0xD8, 0xFF, 0xE0, 0x00, 0x10, 0x4A, 0x46, 0x49, 0x46, 0x00, 0x01, 0x01, 0x00, 0x00, 0x01,
-        0x00, 0x01, 0x00, 0x00, 0xFF, 0xDB, 0x00, 0x43, 0x00, 0x10, 0x0B, 0x0C, 0x0E, 0x0C, 0x0A, 0x10,
-        # 0x19 = QTable
-        0x0E, 0x0D, 0x0E, 0x12, 0x11, 0x10, 0x13, 0x18, 0x28, 0x1A, 0x18, 0x16, 0x16, 0x18, 0x31, 0x23,
-        0x25, 0x1D, 0x28, 0x3A, 0x33, 0x3D, 0x3C, 0x39, 0x33, 0x38, 0x37, 0x40, 0x48, 0x5C, 0x4E, 0x40,
-        0x44, 0x57, 0x45, 0x37, 0x38, 0x50, 0x6D, 0x51, 0x57, 0x5F, 0x62, 0x67, 0x68, 0x67, 0x3E, 0x4D,
-        0x71, 0x79, 0x70, 0x64, 0x78, 0x5C, 0x65, 0x67, 0x63, 0xFF, 0xC0, 0x00, 17,  # 8+3*components
-        0x08, 0x00, 0xF0,  # 0x5E = Height x Width
-        0x01, 0x40,
-        0x03,  # 3 components
-        0x01, 0x21, 0x00,  # Y 2x1 res
-        0x02, 0x11, 0x00,  # Cb
-        0x03, 0x11, 0x00,  # Cr
-        0xFF, 0xC4, 0x00, 0xD2, 0x00, 0x00, 0x01, 0x05, 0x01, 0x01,
-        0x01, 0x01, 0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x02, 0x03, 0x04,
-        0x05, 0x06, 0x07, 0x08, 0x09, 0x0A, 0x0B, 0x10, 0x00, 0x02, 0x01, 0x03, 0x03, 0x02, 0x04, 0x03,
-        0x05, 0x05, 0x04, 0x04, 0x00, 0x00, 0x01, 0x7D, 0x01, 0x02, 0x03, 0x00, 0x04, 0x11, 0x05, 0x12,
-        0x21, 0x31, 0x41, 0x06, 0x13, 0x51, 0x61, 0x07, 0x22, 0x71, 0x14, 0x32, 0x81, 0x91, 0xA1, 0x08,
-        0x23, 0x42, 0xB1, 0xC1, 0x15, 0x52, 0xD1, 0xF0, 0x24, 0x33, 0x62, 0x72, 0x82, 0x09, 0x0A, 0x16,
-        0x17, 0x18, 0x19, 0x1A, 0x25, 0x26, 0x27, 0x28, 0x29, 0x2A, 0x34, 0x35, 0x36, 0x37, 0x38, 0x39,
-        0x3A, 0x43, 0x44, 0x45, 0x46, 0x47, 0x48, 0x49, 0x4A, 0x53, 0x54, 0x55, 0x56, 0x57, 0x58, 0x59,
-        0x5A, 0x63, 0x64, 0x65, 0x66, 0x67, 0x68, 0x69, 0x6A, 0x73, 0x74, 0x75, 0x76, 0x77, 0x78, 0x79,
-        0x7A, 0x83, 0x84, 0x85, 0x86, 0x87, 0x88, 0x89, 0x8A, 0x92, 0x93, 0x94, 0x95, 0x96, 0x97, 0x98,
-        0x99, 0x9A, 0xA2, 0xA3, 0xA4, 0xA5, 0xA6, 0xA7, 0xA8, 0xA9, 0xAA, 0xB2, 0xB3, 0xB4, 0xB5, 0xB6,
-        0xB7, 0xB8, 0xB9, 0xBA, 0xC2, 0xC3, 0xC4, 0xC5, 0xC6, 0xC7, 0xC8, 0xC9, 0xCA, 0xD2, 0xD3, 0xD4,
-        0xD5, 0xD6, 0xD7, 0xD8, 0xD9, 0xDA, 0xE1, 0xE2, 0xE3, 0xE4, 0xE5, 0xE6, 0xE7, 0xE8, 0xE9, 0xEA,
-        0xF1, 0xF2, 0xF3, 0xF4, 0xF5, 0xF6, 0xF7, 0xF8, 0xF9, 0xFA,
-        0xFF, 0xDA, 0x00, 12,
-        0x03,  # 3 components
-        0x01, 0x00,  # Y
-        0x02, 0x00,  # Cb same AC/DC
-        0x03, 0x00,  # Cr same AC/DC
-        0x00, 0x3F, 0x00
-    ], dtype=np.uint8)
-
-    return mini_to_jpeg_helper(minicolor, width, height, header)
+    return mini_to_jpeg_helper(minicolor, width, height, MINICOLOR_HEADER)
 
 
 def mini_to_jpeg_helper(mini, width, height, header):
-    """ Low-level mini*ToJpeg format to normal JPEG format conversion. """
-    buffer_in = mini.tolist()
-    curr_len = len(mini)
-
-    header_length = len(header)
-    # For worst case expansion
-    buffer_out = np.array([0] * (curr_len * 2 + header_length), dtype=np.uint8)
+    """
+    Low-level mini*ToJpeg format to normal JPEG format conversion.
 
-    for i in range(header_length):
-        buffer_out[i] = header[i]
+    The first byte of mini images (the color flag) and 0xFF padding at the end are dropped and 0x00 bytes are stuffed
+    after each 0xFF byte of the entropy-coded data. Returns a uint8 NumPy array.
+    """
+    if not isinstance(mini, np.ndarray):
+        mini = np.frombuffer(mini, dtype=np.uint8)
 
-    buffer_out[0x5e] = height >> 8
-    buffer_out[0x5f] = height & 0xff
-    buffer_out[0x60] = width >> 8
-    buffer_out[0x61] = width & 0xff
     # Remove padding at the end
-    while buffer_in[curr_len - 1] == 0xff:
-        curr_len -= 1
-
-    off = header_length
-    for i in range(curr_len - 1):
-        buffer_out[off] = buffer_in[i + 1]
-        off += 1
-        if buffer_in[i + 1] == 0xff:
-            buffer_out[off] = 0
-            off += 1
-
-    buffer_out[off] = 0xff
-    off += 1
-    buffer_out[off] = 0xD9
-
-    return np.asarray(buffer_out)
+    end = len(mini)
+    while end > 1 and mini[end - 1] == 0xff:
+        end -= 1
+    data = mini[1:end]
+
+    # Byte stuffing
+    ff = np.flatnonzero(data == 0xff)
+    if len(ff):
+        data = np.insert(data, ff + 1, 0)
+
+    header_length = len(header)
+    buffer_out = np.empty(header_length + len(data) + len(JPEG_EOI), dtype=np.uint8)
+    buffer_out[:header_length] = header
+    buffer_out[HEADER_SIZE_OFFSET:HEADER_SIZE_OFFSET + 4] = (height >> 8, height & 0xff, width >> 8, width & 0xff)
+    buffer_out[header_length:-len(JPEG_EOI)] = data
+    buffer_out[-len(JPEG_EOI):] = JPEG_EOI
+
+    return buffer_out
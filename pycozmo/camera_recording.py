@@ -0,0 +1,272 @@
+"""
+
+Camera stream recording and replay.
+
+Camera images are recorded as received from the robot, without decoding, to a single file. The file consists of a
+header, a sequence of frame records, and an index of frame records, written when the recording is closed:
+
+- header: magic (8 bytes), version (uint16), reserved (uint16), index offset (uint64, 0 if there is no index)
+- frame record: magic (4 bytes), image ID (uint32), frame timestamp (uint32), image encoding (int8),
+  image resolution (int8), padding (2 bytes), time since start of recording in seconds (float64), data size (uint32),
+  followed by the image data
+- index: magic (4 bytes), frame count (uint32), followed by an entry per frame - record offset (uint64), time (float64),
+  frame timestamp (uint32), and image ID (uint32)
+
+All values are little-endian. Recordings that were not closed properly have no index or an incomplete one. Their frame
+records are scanned when opened.
+
+"""
+
+from collections import deque
+from threading import Lock, Condition, Thread
+from typing import Optional, Union
+import mmap
+import os
+import struct
+import time
+
+import numpy as np
+
+from . import camera
+from . import event
+from . import protocol_encoder
+from .logger import logger
+
+
+__all__ = [
+    "CameraRecorder",
+    "CameraRecording",
+]
+
+
+MAGIC = b"PYCOZCAM"
+VERSION = 1
+RECORD_MAGIC = b"PCFR"
+INDEX_MAGIC = b"PCIX"
+
+HEADER = struct.Struct("<8sHHQ")
+RECORD_HEADER = struct.Struct("<4sIIbbxxdI")
+INDEX_HEADER = struct.Struct("<4sI")
+INDEX_DTYPE = np.dtype([
+    ("offset", "<u8"),
+    ("time", "<f8"),
+    ("frame_timestamp", "<u4"),
+    ("image_id", "<u4"),
+])
+
+
+class CameraRecorder(object):
+    """
+    Camera stream recorder. Safe to use from any thread.
+
+    Frames are copied and queued by write() and written to the file by a background thread, so that recording does not
+    block the caller. If the writer falls behind by more than max_pending frames, new frames are dropped.
+    """
+
+    def __init__(self, fspec: str, max_pending: int = 100) -> None:
+        self.fspec = fspec
+        self.max_pending = max_pending
+        self.lock = Lock()
+        self.not_empty = Condition(self.lock)
+        self.empty = Condition(self.lock)
+        # Queued records - (header, data) tuples.
+        self.pending = deque()
+        self.busy = False
+        self.stop_flag = False
+        self.f = open(fspec, "wb")
+        self.f.write(HEADER.pack(MAGIC, VERSION, 0, 0))
+        self.offset = HEADER.size
+        # Index entries - (offset, time, frame timestamp, image ID) tuples.
+        self.index = []
+        # Recording start time (time.perf_counter()), set by the first frame.
+        self.start_time = None     # type: Optional[float]
+        # Number of recorded bytes of image data.
+        self.data_bytes = 0
+        # Number of frames, dropped because the writer fell behind.
+        self.dropped = 0
+        self.thread = Thread(daemon=True, name=type(self).__name__, target=self._run)
+        self.thread.start()
+
+    def write(self, image: Union[camera.RawImage, camera.CameraFrame]) -> None:
+        """ Queue a raw image or a camera frame for appending to the recording. """
+        if isinstance(image, camera.RawImage):
+            data = image.get_data()
+        else:
+            data = image.data
+        with self.lock:
+            if self.stop_flag:
+                raise ValueError("Recording is closed.")
+            if len(self.pending) >= self.max_pending:
+                self.dropped += 1
+                return
+            if self.start_time is None:
+                self.start_time = image.receive_time
+            t = image.receive_time - self.start_time
+            # Raw image buffers are reused once released, so the data is copied.
+            self.pending.append(((image.image_id, image.frame_timestamp, image.encoding.value, image.resolution.value,
+                                  t), bytes(data)))
+            self.not_empty.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self.lock:
+                self.busy = False
+                if not self.pending:
+                    self.empty.notify_all()
+                self.not_empty.wait_for(lambda: self.pending or self.stop_flag)
+                if not self.pending:
+                    break
+                header, data = self.pending.popleft()
+                self.busy = True
+            image_id, frame_timestamp, encoding, resolution, t = header
+            try:
+                self.f.write(RECORD_HEADER.pack(
+                    RECORD_MAGIC, image_id, frame_timestamp, encoding, resolution, t, len(data)))
+                self.f.write(data)
+            except Exception as e:
+                logger.error("Failed to record camera image. {}".format(e))
+                continue
+            self.index.append((self.offset, t, frame_timestamp, image_id))
+            self.offset += RECORD_HEADER.size + len(data)
+            self.data_bytes += len(data)
+
+    def flush(self) -> None:
+        """ Wait for queued frames to be written and flush the file. """
+        with self.lock:
+            self.empty.wait_for(lambda: not self.pending and not self.busy)
+            if self.f is not None:
+                self.f.flush()
+
+    def get_frame_count(self) -> int:
+        """ Get the number of written frames. """
+        return len(self.index)
+
+    def close(self) -> None:
+        """ Write queued frames and the index, and close the recording. """
+        with self.lock:
+            self.stop_flag = True
+            self.not_empty.notify()
+        self.thread.join()
+        with self.lock:
+            if self.f is None:
+                return
+            index = np.array(self.index, dtype=INDEX_DTYPE)
+            self.f.write(INDEX_HEADER.pack(INDEX_MAGIC, len(index)))
+            self.f.write(index.tobytes())
+            self.f.seek(0)
+            self.f.write(HEADER.pack(MAGIC, VERSION, 0, self.offset))
+            self.f.close()
+            self.f = None
+
+    def __enter__(self) -> "CameraRecorder":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class CameraRecording(object):
+    """
+    Camera stream recording reader.
+
+    The recording file is memory-mapped. Frames are read on random access without copying - frame data are read-only
+    views of the mapping. The receive_time of frames is the time since the start of the recording.
+    """
+
+    def __init__(self, fspec: str) -> None:
+        self.fspec = fspec
+        with open(fspec, "rb") as f:
+            # Empty files cannot be memory-mapped.
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                raise ValueError("Invalid camera recording '{}'.".format(fspec))
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, index_offset = HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Invalid camera recording '{}'.".format(fspec))
+        index = self._read_index(index_offset) if index_offset else None
+        self.index = index if index is not None else self._scan()
+
+    def _read_index(self, offset: int) -> Optional[np.ndarray]:
+        """ Read the index. Returns None if it is incomplete. """
+        if offset + INDEX_HEADER.size > len(self.mm):
+            return None
+        magic, count = INDEX_HEADER.unpack_from(self.mm, offset)
+        if magic != INDEX_MAGIC:
+            raise ValueError("Invalid camera recording index in '{}'.".format(self.fspec))
+        if offset + INDEX_HEADER.size + count * INDEX_DTYPE.itemsize > len(self.mm):
+            return None
+        return np.frombuffer(self.mm, dtype=INDEX_DTYPE, count=count, offset=offset + INDEX_HEADER.size)
+
+    def _scan(self) -> np.ndarray:
+        """ Build an index by scanning frame records. Incomplete records at the end are ignored. """
+        entries = []
+        offset = HEADER.size
+        while offset + RECORD_HEADER.size <= len(self.mm):
+            magic, image_id, frame_timestamp, _, _, t, size = RECORD_HEADER.unpack_from(self.mm, offset)
+            if magic != RECORD_MAGIC or offset + RECORD_HEADER.size + size > len(self.mm):
+                break
+            entries.append((offset, t, frame_timestamp, image_id))
+            offset += RECORD_HEADER.size + size
+        return np.array(entries, dtype=INDEX_DTYPE)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getitem__(self, i: int) -> camera.CameraFrame:
+        offset = int(self.index[i]["offset"])
+        _, image_id, frame_timestamp, encoding, resolution, t, size = RECORD_HEADER.unpack_from(self.mm, offset)
+        data = np.frombuffer(self.mm, dtype=np.uint8, count=size, offset=offset + RECORD_HEADER.size)
+        frame = camera.CameraFrame(
+            data, protocol_encoder.ImageEncoding(encoding), protocol_encoder.ImageResolution(resolution),
+            image_id, frame_timestamp, receive_time=t)
+        return frame
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def get_duration(self) -> float:
+        """ Get the time between the first and the last frame in seconds. """
+        if not len(self.index):
+            return 0.0
+        return float(self.index["time"][-1] - self.index["time"][0])
+
+    def find(self, t: float) -> int:
+        """ Get the index of the first frame, recorded at or after a given time since the start of the recording. """
+        return int(np.searchsorted(self.index["time"], t))
+
+    def replay(self,
+               dispatcher: event.Dispatcher,
+               speed: Optional[float] = 1.0,
+               start: int = 0,
+               stop: Optional[int] = None) -> int:
+        """
+        Replay frames as EvtNewRawCameraImage events. Recorded frame timing is reproduced at the given speed or frames
+        are dispatched as fast as possible if speed is None. Returns the number of replayed frames.
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        start_time = time.perf_counter()
+        count = 0
+        for i in range(start, stop):
+            frame = self[i]
+            if speed:
+                delay = (frame.receive_time - self.index["time"][start]) / speed - (time.perf_counter() - start_time)
+                if delay > 0.0:
+                    time.sleep(delay)
+            dispatcher.dispatch(event.EvtNewRawCameraImage, dispatcher, frame)
+            count += 1
+        return count
+
+    def close(self) -> None:
+        self.index = self.index.copy()
+        try:
+            self.mm.close()
+        except BufferError:
+            # Frames still reference the mapping. It is released when they are garbage-collected.
+            pass
+
+    def __enter__(self) -> "CameraRecording":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -8,15 +8,14 @@ from threading import Event
 from typing import Optional, Tuple
 import json
 import time
-import io
 
-import numpy as np
 from PIL import Image
 
 from . import logger, logger_robot, logger_animation
 from . import protocol_encoder
 from . import event
 from . import camera
+from . import camera_recording
 from . import object
 from . import util
 from . import robot
@@ -39,19 +38,28 @@ __all__ = [
 
 
 class Client(event.Dispatcher):
-    """ Cozmo protocol client and high-level API class. """
+    """
+    Cozmo protocol client and high-level API class.
+
+    By default, the client creates and owns a threaded connection to the robot. Alternatively, an existing connection
+    can be given (e.g. one, created with ConnectionHub.add_connection()). Such connections are started and stopped by
+    their owner.
+    """
 
     def __init__(self,
                  robot_addr: Optional[Tuple[str, int]] = None,
                  protocol_log_messages: Optional[list] = None,
                  auto_initialize: bool = True,
                  enable_animations: bool = True,
-                 enable_procedural_face: bool = True) -> None:
+                 enable_procedural_face: bool = True,
+                 connection: Optional[conn.BaseConnection] = None) -> None:
         super().__init__()
         # Whether to automatically initialize the robot when connection is established.
         self.auto_initialize = bool(auto_initialize)
 
-        self.conn = conn.Connection(robot_addr, protocol_log_messages)
+        # Whether the connection is owned by the client or given by the application.
+        self.owns_connection = connection is None
+        self.conn = conn.Connection(robot_addr, protocol_log_messages) if connection is None else connection
         self.conn.add_child_dispatcher(self)
         self.anim_controller = anim_controller.AnimationController(self)
         self.anim_controller.enable_animations(auto_initialize and enable_animations)
@@ -86,6 +94,15 @@ class Client(event.Dispatcher):
         self.client_drop_count = 0
         # Camera state
         self.last_image_timestamp = None
+        # Format of images, delivered with EvtNewRawCameraImage events.
+        self.camera_image_format = camera.ImageFormat.FRAME
+        # Image reassembly buffers - one for reassembly, one waiting for decoding, and one being decoded.
+        self.camera_buffers = camera.BufferPool(max_buffers=3)
+        # Camera image decoding thread. Images are decoded on the connection thread, when not running.
+        self.camera_decoder = camera.DecodeWorker(self._decode_image, self._deliver_image, self._release_raw_image)
+        # Camera stream recorder.
+        self.camera_recorder = None     # type: Optional[camera_recording.CameraRecorder]
+        self._partial_data = None
         # Object state
         self.available_objects = dict()
         self.connected_objects = dict()
@@ -114,11 +131,18 @@ class Client(event.Dispatcher):
         self.add_handler(protocol_encoder.DebugData, self._on_debug_data)
         self.add_handler(event.EvtRobotPickedUpChange, self._on_robot_picked_up)
         self.add_handler(event.EvtRobotWheelsMovingChange, self._on_robot_moving)
-        self.conn.start()
+        self.camera_decoder.start()
+        if self.owns_connection:
+            self.conn.start()
 
     def stop(self) -> None:
         logger.debug("Stopping client...")
-        self.conn.stop()
+        if self.owns_connection:
+            self.conn.stop()
+        else:
+            self.conn.del_child_dispatcher(self)
+        self.camera_decoder.stop()
+        self.stop_camera_recording()
         self.anim_controller.stop()
         self.del_all_handlers()
 
@@ -197,9 +221,25 @@ class Client(event.Dispatcher):
             except exception.Timeout as e:
                 raise exception.ConnectionTimeout("Failed to initialize Cozmo.") from e
 
+    async def wait_for_robot_async(self, timeout: float = 5.0) -> None:
+        if not self.robot_fw_sig:
+            try:
+                await self.wait_for_async(event.EvtRobotFound, timeout=timeout)
+            except exception.Timeout as e:
+                raise exception.ConnectionTimeout("Failed to connect to Cozmo.") from e
+
+        if not self.serial_number:
+            try:
+                await self.wait_for_async(event.EvtRobotReady, timeout=timeout)
+            except exception.Timeout as e:
+                raise exception.ConnectionTimeout("Failed to initialize Cozmo.") from e
+
     def _reset_partial_state(self):
+        if self._partial_data is not None:
+            self.camera_buffers.put(self._partial_image_resolution, self._partial_data)
         self._partial_image_timestamp = None
         self._partial_data = None
+        self._partial_view = None
         self._partial_image_id = None
         self._partial_invalid = False
         self._partial_size = 0
@@ -227,10 +267,8 @@ class Client(event.Dispatcher):
             self._partial_image_encoding = protocol_encoder.ImageEncoding(pkt.image_encoding)
             self._partial_image_resolution = protocol_encoder.ImageResolution(pkt.image_resolution)
 
-            image_resolution = protocol_encoder.ImageResolution(pkt.image_resolution)
-            width, height = camera.RESOLUTIONS[image_resolution]
-            max_size = width * height * 3  # 3 bytes per pixel (RGB)
-            self._partial_data = np.empty(max_size, dtype=np.uint8)
+            self._partial_data = self.camera_buffers.get(self._partial_image_resolution)
+            self._partial_view = memoryview(self._partial_data)
 
         if pkt.chunk_id != (self._last_chunk_id + 1) or pkt.image_id != self._partial_image_id:
             logger.debug("Image missing chunks - discarding (last_chunk_id=%d partial_image_id=%s).",
@@ -239,9 +277,18 @@ class Client(event.Dispatcher):
             self._partial_invalid = True
             return
 
+        data = pkt.data
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            data = bytes(data)
         offset = self._partial_size
-        self._partial_data[offset:offset + len(pkt.data)] = np.frombuffer(pkt.data, dtype=np.uint8)
-        self._partial_size += len(pkt.data)
+        if offset + len(data) > len(self._partial_data):
+            logger.debug("Image too large - discarding.")
+            self._reset_partial_state()
+            self._partial_invalid = True
+            return
+        # Chunks are copied directly into the reassembly buffer.
+        self._partial_view[offset:offset + len(data)] = data
+        self._partial_size += len(data)
         self._last_chunk_id = pkt.chunk_id
 
         if pkt.chunk_id == pkt.image_chunk_count - 1:
@@ -249,31 +296,53 @@ class Client(event.Dispatcher):
             self._reset_partial_state()
 
     def _process_completed_image(self):
-        data = self._partial_data[0:self._partial_size]
-
-        # The first byte of the image is whether or not it is in color
-        is_color_image = data[0] != 0
-
-        if self._partial_image_encoding == protocol_encoder.ImageEncoding.JPEGMinimizedGray:
-            width, height = camera.RESOLUTIONS[self._partial_image_resolution]
-
-            if is_color_image:
-                # Color images are half width
-                width = width // 2
-                data = camera.minicolor_to_jpeg(data, width, height)
-            else:
-                data = camera.minigray_to_jpeg(data, width, height)
-
-        image = Image.open(io.BytesIO(data)).convert('RGB')
-
-        # Color images need to be resized to the proper resolution
-        if is_color_image:
-            size = camera.RESOLUTIONS[self._partial_image_resolution]
-            image = image.resize(size)
-
+        raw = camera.RawImage(self._partial_image_id, self._partial_image_timestamp, self._partial_image_encoding,
+                              self._partial_image_resolution, self._partial_data, self._partial_size)
+        # The buffer is owned by the raw image from now on.
+        self._partial_data = None
+        self._partial_view = None
+        recorder = self.camera_recorder
+        if recorder:
+            try:
+                recorder.write(raw)
+            except Exception as e:
+                logger.error("Failed to record camera image. {}".format(e))
+        # Frames are converted on demand by consumers, so only other formats need decoding off the connection thread.
+        if self.camera_decoder.is_running() and self.camera_image_format != camera.ImageFormat.FRAME:
+            self.camera_decoder.put(raw)
+            return
+        try:
+            image = self._decode_image(raw)
+        finally:
+            self._release_raw_image(raw)
+        self._deliver_image(raw, image, time.perf_counter() - raw.receive_time)
+
+    def _decode_image(self, raw: camera.RawImage):
+        frame = camera.CameraFrame.from_raw_image(raw)
+        if self.camera_image_format == camera.ImageFormat.FRAME:
+            return frame
+        elif self.camera_image_format == camera.ImageFormat.JPEG:
+            return frame.jpeg
+        elif self.camera_image_format == camera.ImageFormat.ARRAY:
+            return frame.jpeg_array
+        else:
+            return frame.image
+
+    def _release_raw_image(self, raw: camera.RawImage) -> None:
+        self.camera_buffers.put(raw.resolution, raw.data)
+
+    def _deliver_image(self, raw: camera.RawImage, image, latency: float) -> None:
+        if isinstance(image, camera.CameraFrame):
+            image.decode_latency = latency
+        elif isinstance(image, Image.Image):
+            image.info["image_id"] = raw.image_id
+            image.info["frame_timestamp"] = raw.frame_timestamp
+            image.info["decode_latency"] = latency
         self._latest_image = image
-        self.last_image_timestamp = self._partial_image_timestamp
-        self.dispatch(event.EvtNewRawCameraImage, self, image)
+        self.last_image_timestamp = raw.frame_timestamp
+        # Camera images are dispatched through the connection event queue, so that only the latest image is kept when
+        #   handlers fall behind.
+        self.conn.post_event(event.EvtNewRawCameraImage, self, image)
 
     def _on_robot_state(self, cli, pkt: protocol_encoder.RobotState):
         del cli
@@ -445,14 +514,33 @@ class Client(event.Dispatcher):
         pkt = protocol_encoder.SetHeadLight(enable=enable)
         self.conn.send(pkt)
 
-    def enable_camera(self, enable: bool = True, color: bool = False) -> None:
-        """ Enable or disable camera image streaming in color or grayscale. """
+    def enable_camera(self,
+                      enable: bool = True,
+                      color: bool = False,
+                      image_format: Optional[camera.ImageFormat] = None) -> None:
+        """
+        Enable or disable camera image streaming in color or grayscale. Optionally, set the format of images,
+        delivered with EvtNewRawCameraImage events.
+        """
+        if image_format is not None:
+            self.camera_image_format = camera.ImageFormat(image_format)
         image_send_mode = protocol_encoder.ImageSendMode.Stream if enable else protocol_encoder.ImageSendMode.Off
         pkt = protocol_encoder.EnableCamera(image_send_mode=image_send_mode)
         self.conn.send(pkt)
         pkt = protocol_encoder.EnableColorImages(enable=color)
         self.conn.send(pkt)
 
+    def start_camera_recording(self, fspec: str) -> None:
+        """ Record camera images, as received from the robot, to a file. See pycozmo.camera_recording . """
+        self.stop_camera_recording()
+        self.camera_recorder = camera_recording.CameraRecorder(fspec)
+
+    def stop_camera_recording(self) -> None:
+        recorder = self.camera_recorder
+        self.camera_recorder = None
+        if recorder:
+            recorder.close()
+
     def clear_screen(self) -> None:
         pkt = protocol_encoder.DisplayImage(image=b"\x3f\x3f")
         self.anim_controller.display_image(pkt)
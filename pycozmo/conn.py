@@ -4,19 +4,24 @@ Cozmo protocol low-level client and server connection.
 
 """
 
+import logging
 import select
 import socket
 import time
-from queue import Queue, Empty
-from threading import Thread, Lock
-from typing import Optional, Tuple, Any
+from queue import Empty
+from threading import Thread, Lock, Condition
+from typing import Optional, Tuple, List, Union, Any, Callable
 
 from .logger import logger, logger_protocol
 from .frame import Frame
 from .protocol_ast import PacketType
-from .protocol_base import Packet
-from .protocol_declaration import MAX_FRAME_PAYLOAD_SIZE, MAX_SEQ, OOB_SEQ
+from .protocol_base import Packet, LazyPacket
+from .protocol_utils import BinaryWriter
+from .protocol_declaration import MAX_FRAME_SIZE, MAX_FRAME_PAYLOAD_SIZE, MAX_SEQ, OOB_SEQ
 from .window import ReceiveWindow, SendWindow
+from .rtt import RttEstimator
+from .queues import Priority, PriorityQueue, QueuePolicy, EventQueue
+from .metrics import ConnectionStats, LatencyProfiler
 from . import protocol_encoder
 from . import event
 from . import filter
@@ -26,9 +31,15 @@ from . import exception
 
 __all__ = [
     "ROBOT_ADDR",
+    "PACKET_PRIORITIES",
 
+    "get_packet_priority",
+
+    "Sender",
+    "Receiver",
     "ReceiveThread",
     "SendThread",
+    "BaseConnection",
     "Connection",
 ]
 
@@ -38,26 +49,83 @@ ROBOT_ADDR = ("172.31.1.1", 5551)
 #: Default server address (IP, port).
 SERVER_ADDR = ("127.0.0.1", 5551)
 
-
-class SendThread(Thread):
-    """ Cozmo protocol connection send thread. """
-
-    COLLECT_INTERVAL = 1/30 / 3
+# Packet class -> packet ID.
+_PACKET_IDS = {pkt_class: pkt_id for pkt_id, pkt_class in protocol_encoder.PACKETS_BY_ID.items()}
+
+#: Outgoing packet class -> priority. Packets that are not listed are sent with Priority.CONTROL.
+PACKET_PRIORITIES = {
+    # Animation frames.
+    protocol_encoder.OutputAudio: Priority.REALTIME,
+    protocol_encoder.OutputSilence: Priority.REALTIME,
+    protocol_encoder.DisplayImage: Priority.REALTIME,
+    protocol_encoder.AnimHead: Priority.REALTIME,
+    protocol_encoder.AnimLift: Priority.REALTIME,
+    protocol_encoder.AnimBackpackLights: Priority.REALTIME,
+    protocol_encoder.AnimBody: Priority.REALTIME,
+    protocol_encoder.RecordHeading: Priority.REALTIME,
+    protocol_encoder.TurnToRecordedHeading: Priority.REALTIME,
+    protocol_encoder.StartAnimation: Priority.REALTIME,
+    protocol_encoder.EndAnimation: Priority.REALTIME,
+    protocol_encoder.EnableAnimationState: Priority.REALTIME,
+    # Bulk transfers.
+    protocol_encoder.NvStorageOp: Priority.BULK,
+    protocol_encoder.FirmwareUpdate: Priority.BULK,
+}
+
+
+def get_packet_priority(pkt: Packet) -> Priority:
+    """ Get the default priority of an outgoing packet. """
+    return PACKET_PRIORITIES.get(pkt.__class__, Priority.CONTROL)
+
+
+class Sender(object):
+    """
+    Cozmo protocol connection send side.
+
+    Implements windowing, retransmission, and framing of outgoing packets independently of the transport and of the
+    concurrency model. Subclasses schedule sending and provide the send() and _sendto() methods.
+    """
+
+    # Initial retransmission timeout, used until round-trip time measurements are available.
     ACK_TIMEOUT = 3 * 1/30
+    # Number of duplicate acknowledgements that trigger a fast retransmit.
+    DUP_ACK_THRESHOLD = 3
+    # Default maximum time that queued packets wait for more packets to fill a frame.
+    FRAME_DELAY = 0.002
 
     def __init__(self,
-                 sock: socket.socket,
-                 receiver_address: Optional[Tuple[str, int]]) -> None:
-        super().__init__(daemon=True, name=__class__.__name__)
-        self.sock = sock
+                 receiver_address: Optional[Tuple[str, int]],
+                 clock: Callable[[], float] = time.perf_counter) -> None:
         self.lock = Lock()
+        # Time source for timeouts and round-trip time measurement.
+        self.clock = clock
         self.receiver_address = receiver_address
         self.server = receiver_address is None
         self.window = SendWindow(16, size=62, max_seq=MAX_SEQ)
-        self.stop_flag = False
-        self.queue = Queue()
+        # Outgoing packets, waiting for space in the send window. Higher priority packets are framed first.
+        self.queue = PriorityQueue(get_packet_priority)
+        # Queued Disconnect packet. Nothing should be sent after a disconnect, so it is held back until all other
+        # queued packets have been framed.
+        self.disconnect_pkt = None     # type: Optional[protocol_encoder.Disconnect]
+        # Maximum time that queued packets wait for more packets to fill a frame. Zero disables coalescing.
+        self.max_frame_delay = self.FRAME_DELAY
+        # Enqueue time of the oldest packet, waiting in the queue, and estimated payload size of all queued packets.
+        self.first_queued = None     # type: Optional[float]
+        self.queued_bytes = 0
+        # Reusable frame encoding buffer.
+        self.writer = BinaryWriter(MAX_FRAME_SIZE)
         self.last_ack = 0
         self.last_ack_time = 0
+        # Round-trip time estimation, driving the retransmission timeout.
+        self.rtt = RttEstimator(initial_rto=self.ACK_TIMEOUT)
+        # Time of the last resend. Packets, sent before it, are not used for round-trip time measurement.
+        self.resend_time = 0.0
+        # Last sequence number, acknowledged by the receiver.
+        self.ack_seq = None
+        # Number of duplicate acknowledgements for ack_seq.
+        self.dup_acks = 0
+        # Whether the first unacknowledged packet should be resent immediately.
+        self.fast_retransmit = False
         self.disconnected = False
         # Number of packets received from the application layer.
         self.outgoing_packets = 0
@@ -69,128 +137,236 @@ class SendThread(Thread):
         self.discarded_frames = 0
         # Number of bytes sent.
         self.sent_bytes = 0
-
-    def stop(self) -> None:
-        self.stop_flag = True
-        self.join()
-
-    def run(self) -> None:
-        while not self.stop_flag:
-            try:
-                resend_pkts = self._resend_messages()
-                new_pkts, last_ack = self._collect_messages()
-                self._send_packets(resend_pkts + new_pkts, last_ack)
-            except Exception:
-                pass
+        # Number of frames, carrying packets from the send window, and their total payload size.
+        self.data_frames = 0
+        self.framed_bytes = 0
+        # Number of resent packets.
+        self.resent_packets = 0
+        # Number of fast retransmits, triggered by duplicate acknowledgements.
+        self.fast_retransmits = 0
+        # Number of unacknowledged packets that were not resent together with expired ones - resend traffic saved
+        # compared to resending the whole window.
+        self.saved_resends = 0
+
+    def send(self, data: Any, priority: Optional[Priority] = None) -> None:
+        raise NotImplementedError
+
+    def _sendto(self, raw_frame: Union[bytes, memoryview], address: Tuple[str, int]) -> None:
+        raise NotImplementedError
+
+    def _enqueue(self, data: Any, priority: Optional[Priority]) -> None:
+        """ Put an outgoing packet in the queue. Must be called with the lock held. """
+        if not self._has_queued_messages():
+            self.first_queued = self.clock()
+        if isinstance(data, protocol_encoder.Disconnect):
+            self.disconnect_pkt = data
+        else:
+            self.queue.append(data, priority)
+        self.queued_bytes += 4 + len(data)
+
+    def _has_queued_messages(self) -> bool:
+        """ Check whether there are queued packets. Must be called with the lock held. """
+        return bool(self.queue) or self.disconnect_pkt is not None
+
+    def _has_new_messages(self) -> bool:
+        """ Check whether queued packets can be put in the send window. Must be called with the lock held. """
+        return self._has_queued_messages() and not self.window.is_full() and not self.disconnected
+
+    def _get_resend_timeout(self, now: float) -> Optional[float]:
+        """ Get the time until unacknowledged packets are due for a resend. Must be called with the lock held. """
+        if self.window.is_empty() or not self.last_ack_time:
+            return None
+        return max(0.0, self.window.get_oldest_time() + self.rtt.rto - now)
+
+    def _get_frame_delay(self, now: float) -> Optional[float]:
+        """
+        Get the time until queued packets are due for framing or None if there are none. Packets are held back for up
+        to max_frame_delay to allow packets, produced together, to share a frame. Control packets are not held back.
+        Must be called with the lock held.
+        """
+        if not self._has_new_messages():
+            return None
+        if self.max_frame_delay <= 0.0 or self.first_queued is None or self.queued_bytes >= MAX_FRAME_PAYLOAD_SIZE or \
+                self.queue.lanes[Priority.CONTROL]:
+            return 0.0
+        return max(0.0, self.first_queued + self.max_frame_delay - now)
+
+    def _get_send_timeout(self, now: float) -> Optional[float]:
+        """ Get the time until something is due to be sent or None. Must be called with the lock held. """
+        if self.fast_retransmit:
+            return 0.0
+        timeouts = [timeout for timeout in (self._get_frame_delay(now), self._get_resend_timeout(now))
+                    if timeout is not None]
+        return min(timeouts) if timeouts else None
 
     def _collect_messages(self) -> Tuple[list, int]:
-        with self.lock:
-            last_ack = self.last_ack
-            is_full = self.window.is_full()
+        """ Move as many queued packets as possible to the send window. """
         pkts = []
-        start = time.perf_counter()
-        while not is_full and not self.disconnected and time.perf_counter() - start < self.COLLECT_INTERVAL:
-            try:
-                pkt = self.queue.get(timeout=self.COLLECT_INTERVAL)
-            except Empty:
-                continue
-            self.outgoing_packets += 1
-            if not self.server and isinstance(pkt, protocol_encoder.Disconnect):
-                # The robot does not expect packets after a disconnect. Sometimes this may lead to reboots or revert
-                #   to factory firmware.  Ensure this does not happen.
-                self.disconnected = True
-            if not self.server and isinstance(pkt, protocol_encoder.Ping):
-                self._send_ping(pkt)
-            else:
-                with self.lock:
-                    seq = self.window.put(pkt)
+        while True:
+            with self.lock:
+                if not self._has_new_messages():
                     last_ack = self.last_ack
-                    is_full = self.window.is_full()
-                pkts.append((seq, pkt))
+                    break
+                if self.queue:
+                    pkt = self.queue.popleft()
+                else:
+                    pkt = self.disconnect_pkt
+                    self.disconnect_pkt = None
+                if self._has_queued_messages():
+                    self.queued_bytes -= 4 + len(pkt)
+                else:
+                    self.first_queued = None
+                    self.queued_bytes = 0
+            item = self._put_packet(pkt)
+            if item is not None:
+                pkts.append(item)
         return pkts, last_ack
 
+    def _put_packet(self, pkt: Packet) -> Optional[Tuple[int, Packet]]:
+        """ Put a new packet in the send window. Returns (sequence number, packet) if it needs framing. """
+        self.outgoing_packets += 1
+        if not self.server and isinstance(pkt, protocol_encoder.Disconnect):
+            # The robot does not expect packets after a disconnect. Sometimes this may lead to reboots or revert
+            #   to factory firmware.  Ensure this does not happen.
+            self.disconnected = True
+        if not self.server and isinstance(pkt, protocol_encoder.Ping):
+            self._send_ping(pkt)
+            return None
+        with self.lock:
+            seq = self.window.put(pkt, self.clock())
+        return seq, pkt
+
     def _resend_messages(self) -> list:
+        """ Get unacknowledged packets that are due for a resend, as a list of (sequence number, packet) tuples. """
+        now = self.clock()
         with self.lock:
-            pkts = self.window.get()
-            last_ack_time = self.last_ack_time
-        if pkts and last_ack_time and time.perf_counter() - last_ack_time > self.ACK_TIMEOUT:
-            with self.lock:
-                self.last_ack_time = time.perf_counter()
-        else:
-            pkts = []
+            fast_retransmit = self.fast_retransmit
+            self.fast_retransmit = False
+            if self.window.is_empty() or not self.last_ack_time:
+                return []
+            pkts = self.window.get_expired(now - self.rtt.rto)
+            if pkts:
+                # Retransmission timeout expired.
+                self.rtt.backoff()
+            if fast_retransmit and (not pkts or pkts[0][0] != self.window.expected_seq):
+                pkts.insert(0, self.window.get()[0])
+                self.fast_retransmits += 1
+            if pkts:
+                self.resent_packets += len(pkts)
+                self.saved_resends += self.window.get_count() - len(pkts)
+                self.resend_time = now
+            for seq, _ in pkts:
+                self.window.set_time(seq, now)
         return pkts
 
+    def _send_due_packets(self, frame_due: bool) -> None:
+        """ Resend unacknowledged packets if due and frame queued packets if due or if there are resends to join. """
+        resend_pkts = self._resend_messages()
+        if frame_due or resend_pkts:
+            new_pkts, last_ack = self._collect_messages()
+            self._send_packets(resend_pkts + new_pkts, last_ack)
+
     def _send_packets(self, pkts, last_ack: int):
         to_frame = []
         frame_len = 0
         first_seq = None
-        seq = None
+        prev_seq = None
         for seq, pkt in pkts:
+            pktlen = 4 + len(pkt)
+            if to_frame and (frame_len + pktlen >= MAX_FRAME_PAYLOAD_SIZE or seq != (prev_seq + 1) % MAX_SEQ):
+                # Send current frame. Frames carry only consecutive sequence numbers.
+                self._send_frame(to_frame, first_seq, prev_seq, last_ack)
+                self.framed_bytes += frame_len
+                to_frame = []
+                frame_len = 0
 
             # First packet in a frame?
-            if first_seq is None:
+            if not to_frame:
                 first_seq = seq
 
             # Add to current frame.
-            pktlen = 4 + len(pkt)
-            if frame_len + pktlen < MAX_FRAME_PAYLOAD_SIZE:
-                # Add to current frame.
-                frame_len += pktlen
-                to_frame.append(pkt)
-            else:
-                # Send current frame.
-                self._send_frame(to_frame, first_seq, seq, last_ack)
-                # Start new frame.
-                to_frame = [pkt]
-                frame_len = pktlen
-                first_seq = seq
+            frame_len += pktlen
+            to_frame.append(pkt)
+            prev_seq = seq
 
-        if len(to_frame):
+        if to_frame:
             # Send current frame.
-            self._send_frame(to_frame, first_seq, seq, last_ack)
+            self._send_frame(to_frame, first_seq, prev_seq, last_ack)
+            self.framed_bytes += frame_len
 
     def _send_ping(self, pkt) -> None:
         self.sent_packets += 1
-        raw_frame = Frame(protocol_declaration.FrameType.PING, OOB_SEQ, OOB_SEQ, self.last_ack, [pkt]).to_bytes()
-        self._send_raw_frame(raw_frame)
+        frame = Frame(protocol_declaration.FrameType.PING, OOB_SEQ, OOB_SEQ, self.last_ack, [pkt])
+        self._send_encoded_frame(frame)
 
     def _send_frame(self, pkts, first_seq: int, seq: int, ack: int) -> None:
         self.sent_packets += len(pkts)
-        raw_frame = self._build_frame(pkts, first_seq, seq, ack)
-        self._send_raw_frame(raw_frame)
+        self.data_frames += 1
+        frame = Frame(protocol_declaration.FrameType.ENGINE, first_seq, seq, ack, pkts)
+        self._send_encoded_frame(frame)
 
-    @staticmethod
-    def _build_frame(pkts, first_seq: int, seq: int, ack: int) -> bytes:
+    def _send_encoded_frame(self, frame: Frame) -> None:
+        """ Encode a frame into the reusable frame buffer and send it without copying. """
+        self.writer.clear()
         try:
-            frame = Frame(protocol_declaration.FrameType.ENGINE, first_seq, seq, ack, pkts)
-            return frame.to_bytes()
+            frame.to_writer(self.writer)
         except Exception as e:
             logger.error("Failed to serialize frame. {}".format(e))
             raise
+        with self.writer.getbuffer() as raw_frame:
+            self._send_raw_frame(raw_frame)
 
-    def _send_raw_frame(self, raw_frame: bytes) -> None:
+    def _send_raw_frame(self, raw_frame: Union[bytes, memoryview]) -> None:
         try:
-            self.sock.sendto(raw_frame, self.receiver_address)
+            self._sendto(raw_frame, self.receiver_address)
             self.sent_frames += 1
             self.sent_bytes += len(raw_frame)
         except OSError:
             self.discarded_frames += 1
 
-    def send(self, data: Any) -> None:
-        self.queue.put(data)
-
     def ack(self, seq: int, last_ack: int) -> None:
-        now = time.perf_counter()
+        now = self.clock()
         with self.lock:
+            if seq != self.ack_seq:
+                self.dup_acks = 0
+                if self.window.is_valid_seq(seq) and not self.window.is_out_of_order(seq):
+                    sent_time = self.window.get_time(seq)
+                    # Measure round-trip time only for packets that were not resent (Karn's algorithm).
+                    if sent_time > self.resend_time:
+                        self.rtt.update(now - sent_time)
+            elif not self.window.is_empty() and \
+                    now - self.window.get_time(self.window.expected_seq) > (self.rtt.srtt or self.rtt.rto):
+                # The receiver repeats its last acknowledgement in every frame. Only acknowledgements that arrive more
+                # than a round trip after the first unacknowledged packet was (re)sent indicate its loss.
+                self.dup_acks += 1
+                if self.dup_acks >= self.DUP_ACK_THRESHOLD:
+                    self.dup_acks = 0
+                    self.fast_retransmit = True
+            self.ack_seq = seq
             self.window.acknowledge(seq)
             self.last_ack = last_ack
             self.last_ack_time = now
 
+    def get_frame_fill(self) -> float:
+        """ Get the average payload fill ratio of frames, carrying packets from the send window. """
+        return self.framed_bytes / ((self.data_frames or 1) * MAX_FRAME_PAYLOAD_SIZE)
+
+    def add_rtt_sample(self, rtt: float) -> None:
+        """ Update round-trip time estimation with an external measurement (e.g. a ping round trip). """
+        with self.lock:
+            self.rtt.update(rtt)
+
     def reset(self) -> None:
         with self.lock:
             self.window.reset()
             self.last_ack = 0
             self.last_ack_time = 0
+            self.rtt.reset()
+            self.resend_time = 0.0
+            self.first_queued = self.clock() if self._has_queued_messages() else None
+            self.ack_seq = None
+            self.dup_acks = 0
+            self.fast_retransmit = False
         if self.server:
             self.receiver_address = None
         self.outgoing_packets = 0
@@ -198,26 +374,87 @@ class SendThread(Thread):
         self.sent_frames = 0
         self.discarded_frames = 0
         self.sent_bytes = 0
+        self.data_frames = 0
+        self.framed_bytes = 0
+        self.resent_packets = 0
+        self.fast_retransmits = 0
+        self.saved_resends = 0
 
 
-class ReceiveThread(Thread):
-    """ Cozmo protocol connection receive thread. """
+class SendThread(Sender, Thread):
+    """
+    Cozmo protocol connection send thread.
+
+    The thread sleeps until there is something to do - queued packets are due for framing, acknowledgements free up
+    space in the send window, or unacknowledged packets are due for a resend.
+    """
 
     def __init__(self,
                  sock: socket.socket,
-                 send_thread: SendThread,
-                 sender_address: Optional[Tuple[str, int]],
-                 delivery_handler,
-                 buffer_size: int = 2048) -> None:
-        super().__init__(daemon=True, name=__class__.__name__)
+                 receiver_address: Optional[Tuple[str, int]]) -> None:
+        Thread.__init__(self, daemon=True, name=__class__.__name__)
+        Sender.__init__(self, receiver_address)
         self.sock = sock
+        self.stop_flag = False
+        self.cond = Condition(self.lock)
+        # Whether the thread sleeps without a resend timeout.
+        self.idle = False
+
+    def stop(self) -> None:
+        with self.cond:
+            self.stop_flag = True
+            self.cond.notify()
+        self.join()
+
+    def run(self) -> None:
+        while not self.stop_flag:
+            with self.cond:
+                now = self.clock()
+                timeout = self._get_send_timeout(now)
+                if timeout is None or timeout > 0.0:
+                    self.idle = timeout is None
+                    self.cond.wait(timeout)
+                    self.idle = False
+                    continue
+                frame_due = self._get_frame_delay(now) == 0.0
+            try:
+                self._send_due_packets(frame_due)
+            except Exception:
+                pass
+
+    def _sendto(self, raw_frame: Union[bytes, memoryview], address: Tuple[str, int]) -> None:
+        self.sock.sendto(raw_frame, address)
+
+    def send(self, data: Any, priority: Optional[Priority] = None) -> None:
+        with self.cond:
+            self._enqueue(data, priority)
+            self.cond.notify()
+
+    def ack(self, seq: int, last_ack: int) -> None:
+        super().ack(seq, last_ack)
+        with self.cond:
+            if self._has_new_messages() or self.fast_retransmit or (self.idle and not self.window.is_empty()):
+                # Acknowledgements free up window space, start resend timeouts, and trigger fast retransmits.
+                self.cond.notify()
+
+
+class Receiver(object):
+    """
+    Cozmo protocol connection receive side.
+
+    Implements frame decoding, windowing, and in-order delivery of incoming packets independently of the transport
+    and of the concurrency model. Received datagrams are passed to the handle_datagram() method.
+    """
+
+    def __init__(self,
+                 sender: Sender,
+                 sender_address: Optional[Tuple[str, int]],
+                 delivery_handler) -> None:
+        self.sender = sender
         self.sender_address = sender_address
         self.server = sender_address is None
         self.window = ReceiveWindow(16, size=62, max_seq=MAX_SEQ)
-        self.buffer_size = buffer_size
-        self.stop_flag = False
         self.delivery_handler = delivery_handler
-        self.send_thread = send_thread
         # Received bytes.
         self.received_bytes = 0
         # Number of discarded frames (e.g. unexpected source, decode failures, etc.).
@@ -228,47 +465,46 @@ class ReceiveThread(Thread):
         self.received_packets = 0
         # Number of packets, delivered to the application layer.
         self.delivered_packets = 0
+        # Optional latency profiler.
+        self.profiler = None    # type: Optional[LatencyProfiler]
+
+    def handle_datagram(self,
+                        raw_frame: Union[bytes, memoryview],
+                        address: Tuple[str, int],
+                        recv_time: Optional[float] = None) -> None:
+        self.received_bytes += len(raw_frame)
+        profiler = self.profiler
+        if profiler is not None and recv_time is None:
+            recv_time = time.perf_counter()
 
-    def stop(self) -> None:
-        self.stop_flag = True
-        self.join()
-
-    def run(self) -> None:
-        while not self.stop_flag:
-            try:
-                ready = select.select((self.sock,), (), (), 0.5)
-                if not ready[0]:
-                    continue
-
-                raw_frame, address = self.sock.recvfrom(self.buffer_size)
-                self.received_bytes += len(raw_frame)
-            except Exception as e:
-                self.discarded_frames += 1
-                logger_protocol.error("Failed to receive frame. {}".format(e))
-                continue
+        try:
+            # Packets are decoded only if there are handlers for them.
+            frame = Frame.from_bytes(raw_frame, lazy=True)
+        except Exception as e:
+            self.discarded_frames += 1
+            logger_protocol.error("Failed to decode frame. {}".format(e))
+            return
 
-            try:
-                frame = Frame.from_bytes(raw_frame)
-            except Exception as e:
-                self.discarded_frames += 1
-                logger_protocol.error("Failed to decode frame. {}".format(e))
-                continue
+        if profiler is not None:
+            now = time.perf_counter()
+            for pkt in frame.pkts:
+                pkt.recv_time = recv_time
+                profiler.record(profiler.DECODE, pkt, now)
 
-            try:
-                if frame.type == protocol_declaration.FrameType.RESET:
-                    self.handle_reset(address)
-                elif self.sender_address:
-                    if self.sender_address != address:
-                        logger_protocol.debug("Received a UDP datagram from unexpected address {}.".format(address))
-                    elif frame.type == protocol_declaration.FrameType.FIN:
-                        self.handle_fin()
-                    else:
-                        self.handle_frame(frame)
+        try:
+            if frame.type == protocol_declaration.FrameType.RESET:
+                self.handle_reset(address)
+            elif self.sender_address:
+                if self.sender_address != address:
+                    logger_protocol.debug("Received a UDP datagram from unexpected address {}.".format(address))
+                elif frame.type == protocol_declaration.FrameType.FIN:
+                    self.handle_fin()
                 else:
-                    logger_protocol.debug("Got unexpected {} from {}".format(frame.type, address))
-            except Exception as e:
-                logger_protocol.error("Failed to handle frame. {}".format(e))
-                continue
+                    self.handle_frame(frame)
+            else:
+                logger_protocol.debug("Got unexpected {} from {}".format(frame.type, address))
+        except Exception as e:
+            logger_protocol.error("Failed to handle frame. {}".format(e))
 
     def handle_reset(self, address):
         if not self.server:
@@ -277,10 +513,10 @@ class ReceiveThread(Thread):
         logger_protocol.debug("Got reset from {}.".format(address))
         self.sender_address = address
         self.reset()
-        self.send_thread.reset()
-        self.send_thread.receiver_address = address
+        self.sender.reset()
+        self.sender.receiver_address = address
         pkt = protocol_encoder.Connect()
-        self.send_thread.send(pkt)
+        self.sender.send(pkt)
         self.deliver(pkt)
 
     def handle_fin(self):
@@ -296,13 +532,13 @@ class ReceiveThread(Thread):
             return
         self.sender_address = None
         self.reset()
-        self.send_thread.reset()
+        self.sender.reset()
         pkt = protocol_encoder.Disconnect()
         self.deliver(pkt)
 
     def handle_frame(self, frame: Frame) -> None:
         self.received_frames += 1
-        self.send_thread.ack(frame.ack, frame.seq)
+        self.sender.ack(frame.ack, frame.seq)
         for pkt in frame.pkts:
             if isinstance(pkt, protocol_encoder.Disconnect):
                 self.disconnect()
@@ -327,6 +563,8 @@ class ReceiveThread(Thread):
 
     def deliver(self, pkt: Packet):
         self.delivered_packets += 1
+        if self.profiler is not None:
+            self.profiler.record(self.profiler.DELIVER, pkt, time.perf_counter())
         self.delivery_handler(pkt)
 
     def reset(self):
@@ -338,14 +576,99 @@ class ReceiveThread(Thread):
         self.delivered_packets = 0
 
 
-class Connection(Thread, event.Dispatcher):
-    """ Cozmo protocol low-level connection implementing bot client and server sides. """
+class ReceiveThread(Receiver, Thread):
+    """
+    Cozmo protocol connection receive thread.
+
+    On each wakeup, the thread drains all pending datagrams from the socket into a ring of preallocated buffers and
+    decodes them directly from the buffers. Decoded byte arrays are views into the receive buffers. Buffers that are
+    still referenced by packets, kept by the application, are replaced instead of being overwritten.
+    """
+
+    def __init__(self,
+                 sock: socket.socket,
+                 send_thread: SendThread,
+                 sender_address: Optional[Tuple[str, int]],
+                 delivery_handler,
+                 buffer_size: int = 2048,
+                 buffer_count: int = 32) -> None:
+        Thread.__init__(self, daemon=True, name=__class__.__name__)
+        Receiver.__init__(self, send_thread, sender_address, delivery_handler)
+        self.sock = sock
+        self.buffer_size = buffer_size
+        self.buffers = [bytearray(buffer_size) for _ in range(buffer_count)]
+        # Number of receive buffers that had to be replaced because they were still in use.
+        self.replaced_buffers = 0
+        self.stop_flag = False
+
+    def stop(self) -> None:
+        self.stop_flag = True
+        self.join()
+
+    def run(self) -> None:
+        while not self.stop_flag:
+            try:
+                ready = select.select((self.sock,), (), (), 0.5)
+                if not ready[0]:
+                    continue
+            except Exception as e:
+                logger_protocol.error("Failed to wait for frames. {}".format(e))
+                continue
+
+            for raw_frame, address, recv_time in self._receive_datagrams():
+                self.handle_datagram(raw_frame, address, recv_time)
+                # Packets may still hold views into the buffer but the frame itself is no longer needed.
+                raw_frame.release()
+
+    def _receive_datagrams(self) -> List[Tuple[memoryview, Tuple[str, int], Optional[float]]]:
+        """
+        Receive all pending datagrams, up to the number of available buffers, without blocking. Returns (datagram,
+        address, receive time) tuples. Receive times are only taken when profiling.
+        """
+        profiling = self.profiler is not None
+        datagrams = []
+        for i, buffer in enumerate(self.buffers):
+            if self._is_in_use(buffer):
+                buffer = bytearray(self.buffer_size)
+                self.buffers[i] = buffer
+                self.replaced_buffers += 1
+            with memoryview(buffer) as view:
+                try:
+                    size, address = self.sock.recvfrom_into(view)
+                except BlockingIOError:
+                    break
+                except Exception as e:
+                    self.discarded_frames += 1
+                    logger_protocol.error("Failed to receive frame. {}".format(e))
+                    break
+                recv_time = time.perf_counter() if profiling else None
+                datagrams.append((view[:size], address, recv_time))
+        return datagrams
+
+    @staticmethod
+    def _is_in_use(buffer: bytearray) -> bool:
+        """ Check whether memoryview objects, referencing a buffer, still exist. """
+        try:
+            # Buffers with exported views cannot be resized.
+            buffer.append(0)
+        except BufferError:
+            return True
+        del buffer[-1]
+        return False
+
+
+class BaseConnection(event.Dispatcher):
+    """
+    Cozmo protocol low-level connection base class.
+
+    Implements the connection state machine, pings, and statistics independently of the transport and of the
+    concurrency model. Subclasses provide the sender and receiver attributes and the _send_raw_frame() method.
+    """
 
     IDLE = 1
     CONNECTING = 2
     CONNECTED = 3
 
-    RUN_INTERVAL = 0.01
     PING_INTERVAL = 0.5
     STATS_INTERVAL = 60.0
 
@@ -353,13 +676,9 @@ class Connection(Thread, event.Dispatcher):
                  robot_addr: Optional[Tuple[str, int]] = None,
                  protocol_log_messages: Optional[list] = None,
                  server: bool = False) -> None:
-        super().__init__(daemon=True, name=__class__.__name__)
-        # Thread is an old-style class and does not propagate initialization.
-        event.Dispatcher.__init__(self)
+        super().__init__()
         self.robot_addr = robot_addr or (SERVER_ADDR if server else ROBOT_ADDR)
         self.server = server
-        # Event queue.
-        self.queue = Queue()
         # Filters
         self.packet_type_filter = filter.Filter()
         self.packet_type_filter.deny_ids({PacketType.PING.value})
@@ -367,66 +686,76 @@ class Connection(Thread, event.Dispatcher):
         if protocol_log_messages:
             for i in protocol_log_messages:
                 self.packet_id_filter.deny_ids(protocol_encoder.PACKETS_BY_GROUP[i])
+        # Incoming packets without handlers are dropped before decoding.
+        self.receive_filter = filter.Filter()
+        # Serializes receive filter updates, so that a filter built from older handler counts does not replace a newer
+        # one.
+        self.receive_filter_lock = Lock()
+        # Number of packets, dropped by the receive filter.
+        self.filtered_packets = 0
+        self._update_receive_filter()
         self.state = self.IDLE
-        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        if server:
-            self.sock.bind(self.robot_addr)
-        self.sock.setblocking(False)
-        self.send_thread = SendThread(self.sock, None if server else self.robot_addr)
-        self.recv_thread = ReceiveThread(
-            self.sock, self.send_thread, None if server else self.robot_addr, self._on_packet)
-        self.stop_flag = False
         self.send_last = 0
         self.ping_last = 0
         self.stats_last = 0
         self.ping_counter = 0
+        # Optional incoming packet latency profiler.
+        self.profiler = None    # type: Optional[LatencyProfiler]
 
-    def start(self) -> None:
-        logger.debug("Starting...")
-        self.add_handler(event.EvtPacketReceived, self._on_packet_received)
-        self.add_handler(protocol_encoder.Connect, self._on_connect)
-        self.add_handler(protocol_encoder.Disconnect, self._on_disconnect)
-        self.add_handler(protocol_encoder.Ping, self._on_ping)
-        self.recv_thread.start()
-        self.send_thread.start()
-        super().start()
+    @property
+    def sender(self) -> Sender:
+        raise NotImplementedError
 
-    def stop(self) -> None:
-        logger.debug("Stopping...")
-        self.stop_flag = True
-        self.join()
-        self.send_thread.stop()
-        self.recv_thread.stop()
-        self.sock.close()
-        self.del_all_handlers()
+    @property
+    def receiver(self) -> Receiver:
+        raise NotImplementedError
 
-    def _on_packet(self, pkt) -> None:
-        self.queue.put((event.EvtPacketReceived, [pkt], {}))
+    def _send_raw_frame(self, raw_frame: bytes) -> None:
+        raise NotImplementedError
 
-    def run(self) -> None:
-        while not self.stop_flag:
-            try:
-                evt, args, kwargs = self.queue.get(timeout=self.RUN_INTERVAL)
-            except Empty:
-                evt, args, kwargs = None, [], {}
-            except Exception as e:
-                logger.error("Failed to get from event queue. {}".format(e))
-                continue
+    @property
+    def rtt(self) -> RttEstimator:
+        """ Round-trip time statistics - smoothed round-trip time, variation, and retransmission timeout. """
+        return self.sender.rtt
 
-            if not self.server and self.state == self.CONNECTED:
-                now = time.perf_counter()
-                if now - self.ping_last > self.PING_INTERVAL:
-                    self._send_ping()
-                    self.ping_last = now
-                if now - self.stats_last > self.STATS_INTERVAL:
-                    self.log_stats()
-                    self.stats_last = now
+    def _add_protocol_handlers(self) -> None:
+        self.add_handler(event.EvtPacketReceived, self._on_packet_received)
+        self.add_handler(protocol_encoder.Connect, self._on_connect)
+        self.add_handler(protocol_encoder.Disconnect, self._on_disconnect)
+        self.add_handler(protocol_encoder.Ping, self._on_ping)
 
-            if evt:
-                try:
-                    self.dispatch(evt, *args, **kwargs)
-                except Exception as e:
-                    logger.error("Failed to process event {}. {}".format(evt, e))
+    def _on_handlers_changed(self) -> None:
+        super()._on_handlers_changed()
+        self._update_receive_filter()
+
+    def _update_receive_filter(self) -> None:
+        """ Recalculate the set of packet IDs that are dropped, based on currently registered handlers. """
+        with self.receive_filter_lock:
+            counts = self.count_handlers()
+            receive_filter = filter.Filter()
+            # Packets with no ID (e.g. Connect, Disconnect, Ping) and unknown packets are never filtered.
+            if counts[event.EvtPacketReceived] <= 1:
+                receive_filter.deny_ids({
+                    pkt_id for pkt_class, pkt_id in _PACKET_IDS.items() if not counts[pkt_class]})
+            # Replace the filter atomically as it is used by the receive side.
+            self.receive_filter = receive_filter
+
+    def _filter_packet(self, pkt: Packet) -> bool:
+        """ Check whether an incoming packet should be dropped. Called from the receive side. """
+        if self.receive_filter.filter(pkt.id):
+            self.filtered_packets += 1
+            return True
+        return False
+
+    def _check_timers(self, now: float) -> None:
+        """ Send pings and log statistics when due. """
+        if not self.server and self.state == self.CONNECTED:
+            if now - self.ping_last > self.PING_INTERVAL:
+                self._send_ping()
+                self.ping_last = now
+            if now - self.stats_last > self.STATS_INTERVAL:
+                self.log_stats()
+                self.stats_last = now
 
     def connect(self) -> None:
         if self.server:
@@ -435,23 +764,21 @@ class Connection(Thread, event.Dispatcher):
         logger_protocol.debug("Connecting...")
         self.state = self.CONNECTING
 
-        self.send_thread.reset()
+        self.sender.reset()
 
         frame = Frame(protocol_declaration.FrameType.RESET, 0, 0, OOB_SEQ, [])
         raw_frame = frame.to_bytes()
-        try:
-            self.sock.sendto(raw_frame, self.robot_addr)
-        except OSError:
-            pass
+        self._send_raw_frame(raw_frame)
 
-    def send(self, pkt: Packet) -> None:
+    def send(self, pkt: Packet, priority: Optional[Priority] = None) -> None:
+        """ Send a packet. Without explicit priority, the priority is determined by the packet class. """
         self.send_last = time.perf_counter()
-        self.send_thread.send(pkt)
+        self.sender.send(pkt, priority)
         if not self.packet_type_filter.filter(pkt.type.value) and not self.packet_id_filter.filter(pkt.id):
             logger_protocol.debug("Sent %s", pkt)
 
     def post_event(self, evt, *args, **kwargs) -> None:
-        self.queue.put((evt, args, kwargs))
+        raise NotImplementedError
 
     def disconnect(self) -> None:
         if self.server:
@@ -468,10 +795,35 @@ class Connection(Thread, event.Dispatcher):
         self.send(pkt)
         self.ping_counter += 1
 
+    def _dispatch_event(self, evt, *args, **kwargs) -> None:
+        """ Dispatch an event. Incoming packets are decoded first if EvtPacketReceived has user handlers. """
+        if evt is event.EvtPacketReceived and isinstance(args[0], LazyPacket) and \
+                len(self.get_dispatch_table(event.EvtPacketReceived)) > 1:
+            try:
+                args = (args[0].decode(), )
+            except (ValueError, IndexError) as e:
+                logger_protocol.debug("Failed to decode packet. Ignoring. {}".format(e))
+                return
+        self.dispatch(evt, *args, **kwargs)
+
     def _on_packet_received(self, pkt):
-        if not self.packet_type_filter.filter(pkt.type.value) and not self.packet_id_filter.filter(pkt.id):
+        # Formatting packets requires decoding them.
+        if logger_protocol.isEnabledFor(logging.DEBUG) and \
+                not self.packet_type_filter.filter(pkt.type.value) and not self.packet_id_filter.filter(pkt.id):
             logger_protocol.debug("Got  %s", pkt)
+        if isinstance(pkt, LazyPacket):
+            if not self.has_handlers(pkt.packet_class):
+                # Nobody is interested in the packet - do not decode it.
+                return
+            try:
+                pkt = pkt.decode()
+            except (ValueError, IndexError) as e:
+                logger_protocol.debug("Failed to decode packet. Ignoring. {}".format(e))
+                return
         self.dispatch(pkt.__class__, self, pkt)
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.record(profiler.HANDLE, pkt, time.perf_counter())
 
     def _on_connect(self, cli, pkt: protocol_encoder.Connect):
         del cli, pkt
@@ -488,21 +840,210 @@ class Connection(Thread, event.Dispatcher):
         if self.server:
             self.send(pkt)
         else:
-            # TODO: Calculate round-trip time
-            pass
+            # Pings carry their send time and are echoed back by the robot.
+            self.sender.add_rtt_sample(time.perf_counter() - pkt.time_sent_ms)
+
+    def _get_event_queue_depth(self) -> int:
+        """ Get the number of events, waiting to be dispatched. """
+        return 0
+
+    def _get_dropped_events(self) -> int:
+        """ Get the number of events, dropped by event queue policies. """
+        return 0
+
+    def enable_profiling(self) -> LatencyProfiler:
+        """ Start recording incoming packet latency histograms. """
+        if self.profiler is None:
+            self.profiler = LatencyProfiler()
+            self.receiver.profiler = self.profiler
+        return self.profiler
+
+    def disable_profiling(self) -> None:
+        self.receiver.profiler = None
+        self.profiler = None
+
+    def get_stats(self, prev: Optional[ConnectionStats] = None) -> ConnectionStats:
+        """
+        Get a connection statistics snapshot. Rates are calculated over the interval since a previous snapshot, if
+        given. Consumers keep their own previous snapshots, so they do not affect each other's rates.
+
+        Safe to call from any thread.
+        """
+        now = time.perf_counter()
+        sender = self.sender
+        receiver = self.receiver
+        rtt = self.rtt
+        stats = ConnectionStats(
+            timestamp=now,
+            received_bytes=receiver.received_bytes,
+            received_frames=receiver.received_frames,
+            received_packets=receiver.received_packets,
+            delivered_packets=receiver.delivered_packets,
+            filtered_packets=self.filtered_packets,
+            receive_discarded_frames=receiver.discarded_frames,
+            outgoing_packets=sender.outgoing_packets,
+            sent_packets=sender.sent_packets,
+            sent_frames=sender.sent_frames,
+            sent_bytes=sender.sent_bytes,
+            send_discarded_frames=sender.discarded_frames,
+            resent_packets=sender.resent_packets,
+            fast_retransmits=sender.fast_retransmits,
+            resend_ratio=sender.resent_packets / (sender.sent_packets or 1),
+            frame_fill=sender.get_frame_fill(),
+            send_window_count=sender.window.get_count(),
+            send_window_occupancy=sender.window.get_count() / sender.window.size,
+            send_queue_depth=len(sender.queue) + int(sender.disconnect_pkt is not None),
+            event_queue_depth=self._get_event_queue_depth(),
+            dropped_events=self._get_dropped_events(),
+            rtt=rtt.srtt,
+            rtt_var=rtt.rttvar,
+            rto=rtt.rto,
+            rtt_p50=rtt.get_percentile(50),
+            rtt_p90=rtt.get_percentile(90),
+            rtt_p99=rtt.get_percentile(99))
+        if prev is not None:
+            stats.calc_rates(prev)
+        return stats
 
     def log_stats(self):
-        logger_protocol.info("Recv: {}B, {}F (disc.), {}F, {}P, {}P ({:.02f}%); "
-                             "Sent: {}P, {}P ({:.02f}%), {}F, {}F (disc.), {}B;".format(
-                                self.recv_thread.received_bytes,
-                                self.recv_thread.discarded_frames,
-                                self.recv_thread.received_frames,
-                                self.recv_thread.received_packets,
-                                self.recv_thread.delivered_packets,
-                                self.recv_thread.delivered_packets / (self.recv_thread.received_packets or 1) * 100.0,
-                                self.send_thread.outgoing_packets,
-                                self.send_thread.sent_packets,
-                                self.send_thread.outgoing_packets / (self.send_thread.sent_packets or 1) * 100.0,
-                                self.send_thread.sent_frames,
-                                self.send_thread.discarded_frames,
-                                self.send_thread.sent_bytes))
+        logger_protocol.info("Recv: {}B, {}F (disc.), {}F, {}P, {}P ({:.02f}%), {}P (filt.); "
+                             "Sent: {}P, {}P ({:.02f}%), {}F, {}F (disc.), {}B, {}P (resent), {}P (fast), "
+                             "{}P (saved), {:.02f}% (fill); RTT: {:.01f}ms, {:.01f}ms (var.), {:.01f}ms (RTO);".format(
+                                self.receiver.received_bytes,
+                                self.receiver.discarded_frames,
+                                self.receiver.received_frames,
+                                self.receiver.received_packets,
+                                self.receiver.delivered_packets,
+                                self.receiver.delivered_packets / (self.receiver.received_packets or 1) * 100.0,
+                                self.filtered_packets,
+                                self.sender.outgoing_packets,
+                                self.sender.sent_packets,
+                                self.sender.outgoing_packets / (self.sender.sent_packets or 1) * 100.0,
+                                self.sender.sent_frames,
+                                self.sender.discarded_frames,
+                                self.sender.sent_bytes,
+                                self.sender.resent_packets,
+                                self.sender.fast_retransmits,
+                                self.sender.saved_resends,
+                                self.sender.get_frame_fill() * 100.0,
+                                (self.rtt.srtt or 0.0) * 1000.0,
+                                self.rtt.rttvar * 1000.0,
+                                self.rtt.rto * 1000.0))
+
+
+class Connection(Thread, BaseConnection):
+    """
+    Cozmo protocol low-level connection implementing bot client and server sides.
+
+    Incoming packets and posted events are dispatched from a bounded event queue. Event and packet classes can have
+    their own queue bounds and policies - see set_event_policy().
+    """
+
+    RUN_INTERVAL = 0.01
+
+    # Default event queue bound for events without a policy (0 - no bound).
+    EVENT_QUEUE_SIZE = 0
+    # Default event queue policies - event or packet class -> (policy, bound).
+    EVENT_POLICIES = {
+        protocol_encoder.RobotState: (QueuePolicy.KEEP_LATEST, 1),
+        event.EvtNewRawCameraImage: (QueuePolicy.KEEP_LATEST, 1),
+    }
+
+    def __init__(self,
+                 robot_addr: Optional[Tuple[str, int]] = None,
+                 protocol_log_messages: Optional[list] = None,
+                 server: bool = False) -> None:
+        super().__init__(daemon=True, name=__class__.__name__)
+        # Thread is an old-style class and does not propagate initialization.
+        BaseConnection.__init__(self, robot_addr, protocol_log_messages, server)
+        # Event queue.
+        self.queue = EventQueue(self.EVENT_QUEUE_SIZE)
+        for key, (policy, maxsize) in self.EVENT_POLICIES.items():
+            self.queue.set_policy(key, policy, maxsize)
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        if server:
+            self.sock.bind(self.robot_addr)
+        self.sock.setblocking(False)
+        self.send_thread = SendThread(self.sock, None if server else self.robot_addr)
+        self.recv_thread = ReceiveThread(
+            self.sock, self.send_thread, None if server else self.robot_addr, self._on_packet)
+        self.stop_flag = False
+
+    @property
+    def sender(self) -> SendThread:
+        return self.send_thread
+
+    @property
+    def receiver(self) -> ReceiveThread:
+        return self.recv_thread
+
+    def start(self) -> None:
+        logger.debug("Starting...")
+        self._add_protocol_handlers()
+        self.recv_thread.start()
+        self.send_thread.start()
+        super().start()
+
+    def stop(self) -> None:
+        logger.debug("Stopping...")
+        self.stop_flag = True
+        self.join()
+        # Release the receive thread if it is blocked on a full event queue.
+        self.queue.close()
+        self.send_thread.stop()
+        self.recv_thread.stop()
+        self.sock.close()
+        self.del_all_handlers()
+
+    def _on_packet(self, pkt) -> None:
+        if self._filter_packet(pkt):
+            return
+        packet_class = pkt.packet_class if isinstance(pkt, LazyPacket) else pkt.__class__
+        self.queue.put((event.EvtPacketReceived, [pkt], {}), packet_class)
+
+    def run(self) -> None:
+        while not self.stop_flag:
+            try:
+                evt, args, kwargs = self.queue.get(timeout=self.RUN_INTERVAL)
+            except Empty:
+                evt, args, kwargs = None, [], {}
+            except Exception as e:
+                logger.error("Failed to get from event queue. {}".format(e))
+                continue
+
+            now = time.perf_counter()
+            self._check_timers(now)
+
+            if evt is event.EvtPacketReceived and self.profiler is not None:
+                self.profiler.record(self.profiler.DEQUEUE, args[0], now)
+
+            if evt:
+                try:
+                    self._dispatch_event(evt, *args, **kwargs)
+                except Exception as e:
+                    logger.error("Failed to process event {}. {}".format(evt, e))
+
+    def _send_raw_frame(self, raw_frame: bytes) -> None:
+        try:
+            self.sock.sendto(raw_frame, self.robot_addr)
+        except OSError:
+            pass
+
+    def post_event(self, evt, *args, **kwargs) -> None:
+        self.queue.put((evt, args, kwargs), evt)
+
+    def set_event_policy(self, key, policy: QueuePolicy, maxsize: int = 1) -> None:
+        """
+        Set the event queue bound and policy for an event class or an incoming packet class.
+
+        - QueuePolicy.KEEP_LATEST - replace the newest queued event (e.g. for state updates and camera images).
+        - QueuePolicy.DROP_OLDEST - drop the oldest queued event.
+        - QueuePolicy.BLOCK - block the receive side until the event queue is drained (backpressure).
+        """
+        self.queue.set_policy(key, policy, maxsize)
+
+    def _get_event_queue_depth(self) -> int:
+        return self.queue.qsize()
+
+    def _get_dropped_events(self) -> int:
+        return self.queue.get_dropped()
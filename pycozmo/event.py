@@ -4,10 +4,14 @@ Event declaration and dispatching.
 
 """
 
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
+from concurrent.futures import Executor, Future
+import asyncio
 import collections
 import threading
+import time
 
+from .logger import logger
 from . import exception
 from . import robot
 
@@ -46,6 +50,7 @@ __all__ = [
     "STATUS_EVENTS",
 
     "Handler",
+    "EventStream",
     "Dispatcher",
 ]
 
@@ -54,11 +59,93 @@ class Event(object):
     """ Base class for events. """
 
 
+def _call_timed(f: Callable, args: tuple, kwargs: dict) -> float:
+    """ Call a function and return its run time. Module-level, so that it can be used with process pools. """
+    start = time.perf_counter()
+    f(*args, **kwargs)
+    return time.perf_counter() - start
+
+
 class Handler(object):
-    """ Event handler class. """
-    def __init__(self, f: Callable, one_shot: bool):
+    """
+    Event handler class.
+
+    Handlers with an executor (e.g. concurrent.futures.ThreadPoolExecutor) are called asynchronously. Calls to the
+    same handler are serialized in dispatch order - a call is submitted to the executor only after the previous one
+    completes. With process pool executors, the handler function and its arguments must be picklable.
+    """
+    def __init__(self, f: Callable, one_shot: bool, executor: Optional[Executor] = None):
         self.f = f
         self.one_shot = one_shot
+        self.executor = executor
+        self.lock = threading.Lock()
+        # Calls, waiting for the previous call to complete - (args, kwargs, dispatch time) tuples.
+        self.pending = collections.deque()
+        self.busy = False
+        # Number of completed and failed calls.
+        self.calls = 0
+        self.errors = 0
+        # Total and maximum handler run time.
+        self.run_time = 0.0
+        self.max_run_time = 0.0
+        # Total and maximum time from dispatch to completion, including waiting for previous calls.
+        self.latency = 0.0
+        self.max_latency = 0.0
+
+    def submit(self, args: tuple, kwargs: dict) -> None:
+        """ Schedule an asynchronous call. """
+        with self.lock:
+            self.pending.append((args, kwargs, time.perf_counter()))
+            if self.busy:
+                return
+            self.busy = True
+        self._submit_next()
+
+    def _submit_next(self) -> None:
+        with self.lock:
+            if not self.pending:
+                self.busy = False
+                return
+            args, kwargs, dispatch_time = self.pending.popleft()
+        try:
+            future = self.executor.submit(_call_timed, self.f, args, kwargs)
+        except Exception as e:
+            # E.g. the executor has been shut down.
+            logger.error("Failed to submit event handler {}. {}".format(self.f, e))
+            with self.lock:
+                self.pending.clear()
+                self.busy = False
+            return
+        future.add_done_callback(lambda f: self._on_done(f, dispatch_time))
+
+    def _on_done(self, future: Future, dispatch_time: float) -> None:
+        latency = time.perf_counter() - dispatch_time
+        try:
+            run_time = future.result()
+        except Exception as e:
+            run_time = 0.0
+            logger.error("Failed to run event handler {}. {}".format(self.f, e))
+            failed = True
+        else:
+            failed = False
+        with self.lock:
+            self.calls += 1
+            self.errors += failed
+            self.run_time += run_time
+            self.max_run_time = max(self.max_run_time, run_time)
+            self.latency += latency
+            self.max_latency = max(self.max_latency, latency)
+        self._submit_next()
+
+    def get_pending(self) -> int:
+        """ Get the number of calls, waiting to be submitted. """
+        return len(self.pending)
+
+    def get_stats(self) -> Tuple[int, int, float, float]:
+        """ Get (calls, errors, average run time, average latency). """
+        with self.lock:
+            calls = self.calls or 1
+            return self.calls, self.errors, self.run_time / calls, self.latency / calls
 
 
 class EvtRobotFound(Event):
@@ -190,53 +277,231 @@ class EvtBehaviorDone(Event):
     pass
 
 
+def _get_event_value(args: tuple):
+    """ Get the value of an event from its handler arguments, skipping the leading source (client or connection). """
+    if len(args) <= 1:
+        return None
+    elif len(args) == 2:
+        return args[1]
+    else:
+        return args[1:]
+
+
+class EventStream(object):
+    """
+    Asynchronous iterator over dispatched events.
+
+    Events are passed from the dispatching thread to an asyncio event loop through a bounded queue. When the queue is
+    full, the oldest event is dropped, so slow consumers get recent events rather than a backlog. Iteration yields
+    event values - handler arguments without the leading source argument, e.g. packets for packet classes.
+    """
+
+    def __init__(self, dispatcher: "Dispatcher", evt, maxsize: int = 16) -> None:
+        if maxsize < 1:
+            raise ValueError("Invalid queue bound.")
+        self.dispatcher = dispatcher
+        self.evt = evt
+        self.loop = asyncio.get_event_loop()
+        self.queue = asyncio.Queue(maxsize)
+        # Number of events dropped because the queue was full.
+        self.dropped = 0
+        self.closed = False
+        self.handler = dispatcher.add_handler(evt, self._on_event)
+
+    def _on_event(self, *args) -> None:
+        # Called from the dispatching thread.
+        try:
+            self.loop.call_soon_threadsafe(self._put, _get_event_value(args))
+        except RuntimeError:
+            # The event loop has been closed.
+            self.dispatcher.del_handler(self.evt, self.handler)
+
+    def _put(self, value) -> None:
+        if self.closed:
+            return
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(value)
+
+    def close(self) -> None:
+        """ Stop receiving events. Pending iterations end after queued events are consumed. """
+        if self.closed:
+            return
+        self.closed = True
+        self.dispatcher.del_handler(self.evt, self.handler)
+        if self.queue.empty():
+            # Wake up a waiting consumer.
+            self.queue.put_nowait(self)
+
+    def __aiter__(self) -> "EventStream":
+        return self
+
+    async def __anext__(self):
+        if self.closed and self.queue.empty():
+            raise StopAsyncIteration
+        value = await self.queue.get()
+        if value is self:
+            raise StopAsyncIteration
+        return value
+
+    async def __aenter__(self) -> "EventStream":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
 class Dispatcher(object):
-    """ Event dispatcher class. """
+    """
+    Event dispatcher class.
+
+    Dispatching uses a per-event table of handlers that is flattened across child dispatchers. Tables are built on
+    first use and are invalidated whenever handlers or child dispatchers of the dispatcher or of any of its children
+    change.
+    """
 
     def __init__(self):
         super().__init__()
         self.dispatch_children = []
+        self.dispatch_parents = []
         self.dispatch_handlers = collections.defaultdict(list)
+        # Guards changes to handler lists.
+        self.dispatch_lock = threading.Lock()
+        # Event -> tuple of (owner dispatcher, handler) pairs, in dispatch order.
+        self.dispatch_table = {}
 
     def add_child_dispatcher(self, child):
         self.dispatch_children.append(child)
+        child.dispatch_parents.append(self)
+        self._on_handlers_changed()
 
     def del_child_dispatcher(self, child):
         try:
             self.dispatch_children.remove(child)
+            child.dispatch_parents.remove(self)
         except ValueError:
             pass
-
-    def add_handler(self, event, f, one_shot=False):
-        handler = Handler(f, one_shot=one_shot)
-        self.dispatch_handlers[event].append(handler)
+        self._on_handlers_changed()
+
+    def add_handler(self, event, f, one_shot=False, executor: Optional[Executor] = None):
+        """
+        Add an event handler. Handlers are called from the dispatching thread, unless an executor is given. Calls of
+        handlers with an executor are serialized per handler.
+        """
+        handler = Handler(f, one_shot=one_shot, executor=executor)
+        with self.dispatch_lock:
+            self.dispatch_handlers[event].append(handler)
+        self._on_handlers_changed()
         return handler
 
+    def _remove_handler(self, event, handler) -> bool:
+        """ Remove a handler. Returns False if the handler has already been removed. """
+        with self.dispatch_lock:
+            handlers = self.dispatch_handlers.get(event)
+            if not handlers:
+                return False
+            for i, _handler in enumerate(handlers):
+                if _handler is handler:
+                    del handlers[i]
+                    return True
+            return False
+
     def del_handler(self, event, handler):
-        for i, _handler in enumerate(self.dispatch_handlers[event]):
-            if _handler == handler:
-                del self.dispatch_handlers[event][i]
-                return
+        if self._remove_handler(event, handler):
+            self._on_handlers_changed()
 
     def del_all_handlers(self):
-        self.dispatch_handlers = collections.defaultdict(list)
+        with self.dispatch_lock:
+            self.dispatch_handlers = collections.defaultdict(list)
+        self._on_handlers_changed()
+
+    def has_handlers(self, event) -> bool:
+        """ Checks whether the dispatcher or any of its child dispatchers has handlers for an event. """
+        return bool(self.get_dispatch_table(event))
+
+    def count_handlers(self) -> collections.Counter:
+        """ Counts handlers by event, including handlers of child dispatchers. """
+        counts = collections.Counter()
+        # Handlers may be modified from other threads.
+        for event, handlers in list(self.dispatch_handlers.items()):
+            if handlers:
+                counts[event] += len(handlers)
+        for child in list(self.dispatch_children):
+            counts.update(child.count_handlers())
+        return counts
+
+    def _on_handlers_changed(self):
+        """ Called when handlers of the dispatcher or of any of its child dispatchers change. """
+        self.dispatch_table = {}
+        for parent in list(self.dispatch_parents):
+            parent._on_handlers_changed()
+
+    def _collect_handlers(self, event, entries: list) -> None:
+        with self.dispatch_lock:
+            handlers = list(self.dispatch_handlers.get(event, ()))
+        entries.extend((self, handler) for handler in handlers)
+        for child in list(self.dispatch_children):
+            child._collect_handlers(event, entries)
+
+    def get_dispatch_table(self, event) -> tuple:
+        """ Get (owner dispatcher, handler) pairs for an event, including handlers of child dispatchers. """
+        # The table is replaced, not cleared, on changes, so a table built concurrently with a change is discarded.
+        table = self.dispatch_table
+        entries = table.get(event)
+        if entries is None:
+            entries = []
+            self._collect_handlers(event, entries)
+            entries = tuple(entries)
+            table[event] = entries
+        return entries
 
     def dispatch(self, event, *args, **kwargs):
-        # Dispatch to handlers.
+        entries = self.get_dispatch_table(event)
+        if not entries:
+            return
+        # Delete one-shot handlers prior to actual dispatch. A one-shot handler is only called by the dispatch that
+        # removes it, even if the same event is dispatched concurrently.
         handlers = []
-        for i, handler in enumerate(self.dispatch_handlers[event]):
+        changed = []
+        for owner, handler in entries:
             if handler.one_shot:
-                # Delete one-shot handlers prior to actual dispatch
-                del self.dispatch_handlers[event][i]
+                if not owner._remove_handler(event, handler):
+                    continue
+                if owner not in changed:
+                    changed.append(owner)
             handlers.append(handler)
+        for owner in changed:
+            owner._on_handlers_changed()
         for handler in handlers:
-            handler.f(*args, **kwargs)
-        # Dispatch to child dispatchers.
-        for child in self.dispatch_children:
-            child.dispatch(event, *args, **kwargs)
+            if handler.executor is None:
+                handler.f(*args, **kwargs)
+            else:
+                handler.submit(args, kwargs)
 
     def wait_for(self, evt, timeout: Optional[float] = None) -> None:
         e = threading.Event()
         self.add_handler(evt, lambda *args: e.set(), one_shot=True)
         if not e.wait(timeout):
             raise exception.Timeout("Failed to receive event in time.")
+
+    async def wait_for_async(self, evt, timeout: Optional[float] = None):
+        """ Wait for an event from an asyncio event loop. Returns the event value (see EventStream). """
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+
+        def on_event(*args):
+            # Called from the dispatching thread.
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(_get_event_value(args)))
+
+        handler = self.add_handler(evt, on_event, one_shot=True)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError as e:
+            raise exception.Timeout("Failed to receive event in time.") from e
+        finally:
+            self.del_handler(evt, handler)
+
+    def events(self, evt, maxsize: int = 16) -> EventStream:
+        """ Get an asynchronous iterator over events. Must be called from an asyncio event loop. """
+        return EventStream(self, evt, maxsize)
@@ -4,12 +4,13 @@ Cozmo protocol frame representation and encoding and decoding.
 
 """
 
-from typing import List
+from typing import List, Union
+import struct
 
 from .logger import logger_protocol
 from .protocol_ast import FrameType, PacketType
 from .protocol_declaration import FRAME_ID, MIN_FRAME_SIZE, MAX_SEQ, OOB_SEQ
-from .protocol_base import Packet, UnknownCommand, UnknownEvent
+from .protocol_base import Packet, UnknownCommand, UnknownEvent, LazyPacket
 from .protocol_utils import BinaryReader, BinaryWriter
 from .protocol_encoder import Connect, Disconnect, Ping, Keyframe, PACKETS_BY_ID
 
@@ -19,6 +20,14 @@ __all__ = [
 ]
 
 
+# Frame type, first sequence number, sequence number, and acknowledgement number.
+_FRAME_HEADER = struct.Struct("<BHHH")
+# Packet type and length.
+_PACKET_HEADER = struct.Struct("<BH")
+# Packet type, length, and ID.
+_PACKET_ID_HEADER = struct.Struct("<BHB")
+
+
 class Frame(object):
     """ Cozmo protocol frame. """
 
@@ -37,27 +46,40 @@ class Frame(object):
         self.ack = ack
         self.pkts = pkts
 
+    def __len__(self):
+        size = MIN_FRAME_SIZE
+        if self.type == FrameType.ENGINE or self.type == FrameType.ROBOT:
+            for pkt in self.pkts:
+                size += 3 + len(pkt)
+                if pkt.type == PacketType.COMMAND or pkt.type == PacketType.EVENT:
+                    size += 1
+        elif self.type == FrameType.PING:
+            size += len(self.pkts[0])
+        elif self.type == FrameType.ENGINE_ACT:
+            size += 1 + len(self.pkts[0])
+        return size
+
     def to_bytes(self) -> bytes:
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     @staticmethod
     def _encode_packet(pkt: Packet, writer: BinaryWriter) -> None:
-        writer.write(pkt.type.value, "B")
         if pkt.type == PacketType.COMMAND or pkt.type == PacketType.EVENT:
-            writer.write(len(pkt) + 1, "H")
-            writer.write(pkt.id, "B")
+            writer.write_struct(_PACKET_ID_HEADER, pkt.type.value, len(pkt) + 1, pkt.id)
         else:
-            writer.write(len(pkt), "H")
+            writer.write_struct(_PACKET_HEADER, pkt.type.value, len(pkt))
         writer.write_object(pkt)
 
     def to_writer(self, writer: BinaryWriter) -> None:
         writer.write_bytes(FRAME_ID)
-        writer.write(self.type.value, "B")
-        writer.write((self.first_seq + 1) % 0x10000, "H")
-        writer.write((self.seq + 1) % 0x10000, "H")
-        writer.write((self.ack + 1) % 0x10000, "H")
+        writer.write_struct(
+            _FRAME_HEADER,
+            self.type.value,
+            (self.first_seq + 1) % 0x10000,
+            (self.seq + 1) % 0x10000,
+            (self.ack + 1) % 0x10000)
         if self.type == FrameType.ENGINE or self.type == FrameType.ROBOT:
             for pkt in self.pkts:
                 self._encode_packet(pkt, writer)
@@ -82,17 +104,19 @@ class Frame(object):
             raise NotImplementedError("Unexpected frame type {}.".format(self.type))
 
     @classmethod
-    def from_bytes(cls, buffer: bytes) -> "Frame":
+    def from_bytes(cls, buffer: Union[bytes, bytearray, memoryview], lazy: bool = False) -> "Frame":
         reader = BinaryReader(buffer)
-        obj = cls.from_reader(reader)
+        obj = cls.from_reader(reader, lazy)
         return obj
 
     @classmethod
-    def _decode_packet(cls, pkt_type, pkt_len, reader):
+    def _decode_packet(cls, pkt_type, pkt_len, reader, lazy=False):
         if pkt_type == PacketType.COMMAND or pkt_type == PacketType.EVENT:
             pkt_id = reader.read("B")
             pkt_class = PACKETS_BY_ID.get(pkt_id)   # type: Packet  # type: ignore
-            if pkt_class:
+            if pkt_class and lazy:
+                res = LazyPacket(pkt_class, pkt_type, pkt_id, reader.read_bytes(pkt_len - 1))
+            elif pkt_class:
                 res = pkt_class.from_reader(reader)
             elif pkt_type == PacketType.COMMAND:
                 res = UnknownCommand(pkt_id, reader.read_farray("B", pkt_len - 1))
@@ -111,7 +135,11 @@ class Frame(object):
         return res
 
     @classmethod
-    def from_reader(cls, reader: BinaryReader) -> "Frame":
+    def from_reader(cls, reader: BinaryReader, lazy: bool = False) -> "Frame":
+        """
+        Decodes a frame. With lazy decoding, command and event packets are represented by LazyPacket objects that
+        are decoded on demand.
+        """
         if len(reader.buffer) < MIN_FRAME_SIZE:
             raise ValueError("Invalid frame.")
 
@@ -119,20 +147,21 @@ class Frame(object):
             raise ValueError("Invalid frame ID.")
 
         reader.seek_set(7)
-        frame_type = FrameType(reader.read("B"))
-        first_seq = (reader.read("H") - 1) % 0x10000
-        seq = (reader.read("H") - 1) % 0x10000
-        ack = (reader.read("H") - 1) % 0x10000
+        frame_type, first_seq, seq, ack = reader.read_struct(_FRAME_HEADER)
+        frame_type = FrameType(frame_type)
+        first_seq = (first_seq - 1) % 0x10000
+        seq = (seq - 1) % 0x10000
+        ack = (ack - 1) % 0x10000
         pkts = []
 
         if frame_type == FrameType.ENGINE or frame_type == FrameType.ROBOT:
             pkt_seq = first_seq
             while reader.tell() < len(reader):
-                pkt_type = PacketType(reader.read("B"))
-                pkt_len = reader.read("H")
+                pkt_type, pkt_len = reader.read_struct(_PACKET_HEADER)
+                pkt_type = PacketType(pkt_type)
                 expected_offset = reader.tell() + pkt_len
                 try:
-                    pkt = cls._decode_packet(pkt_type, pkt_len, reader)
+                    pkt = cls._decode_packet(pkt_type, pkt_len, reader, lazy)
                     if reader.tell() != expected_offset:
                         # Packet length may change between protocol versions.
                         reader.seek_set(expected_offset)
@@ -153,7 +182,7 @@ class Frame(object):
             pkt_type = PacketType.COMMAND
             pkt_len = len(reader) - reader.tell()
             try:
-                pkt = cls._decode_packet(pkt_type, pkt_len, reader)
+                pkt = cls._decode_packet(pkt_type, pkt_len, reader, lazy)
                 pkt.seq = pkt_seq
                 pkt.ack = ack
                 if not pkt.is_oob():
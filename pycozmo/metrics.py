@@ -0,0 +1,407 @@
+"""
+
+Connection metrics export.
+
+Connection statistics snapshots, packet pipeline latency histograms, and their export in Prometheus text format over
+HTTP.
+
+"""
+
+from typing import Optional, Tuple, List, Iterable, Callable, Union
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+from threading import Thread, Lock
+import math
+
+from .logger import logger
+
+
+__all__ = [
+    "DEFAULT_ADDRESS",
+
+    "ConnectionStats",
+    "Histogram",
+    "LatencyProfiler",
+    "METRICS",
+    "format_prometheus",
+    "format_prometheus_histograms",
+    "MetricsServer",
+    "start_metrics_server",
+]
+
+
+#: Default metrics HTTP endpoint address (IP, port).
+DEFAULT_ADDRESS = ("127.0.0.1", 9100)
+
+
+class ConnectionStats(object):
+    """ Connection statistics snapshot. Rates are calculated over the interval since a baseline snapshot. """
+
+    __slots__ = (
+        # Snapshot time (time.perf_counter()) and interval since the baseline snapshot in seconds.
+        "timestamp",
+        "interval",
+        # Receive side counters.
+        "received_bytes",
+        "received_frames",
+        "received_packets",
+        "delivered_packets",
+        "filtered_packets",
+        "receive_discarded_frames",
+        # Send side counters.
+        "outgoing_packets",
+        "sent_packets",
+        "sent_frames",
+        "sent_bytes",
+        "send_discarded_frames",
+        "resent_packets",
+        "fast_retransmits",
+        # Rates per second.
+        "received_bytes_rate",
+        "received_frames_rate",
+        "received_packets_rate",
+        "sent_bytes_rate",
+        "sent_frames_rate",
+        "sent_packets_rate",
+        # Ratio of resent to sent packets.
+        "resend_ratio",
+        # Average payload fill ratio of data frames.
+        "frame_fill",
+        # Number of unacknowledged packets and its ratio to the send window size.
+        "send_window_count",
+        "send_window_occupancy",
+        # Number of packets, waiting for space in the send window.
+        "send_queue_depth",
+        # Number of events, waiting to be dispatched, and number of events, dropped by event queue policies.
+        "event_queue_depth",
+        "dropped_events",
+        # Round-trip time statistics in seconds. None before the first measurement.
+        "rtt",
+        "rtt_var",
+        "rto",
+        "rtt_p50",
+        "rtt_p90",
+        "rtt_p99",
+    )
+
+    def __init__(self, **kwargs) -> None:
+        for name in self.__slots__:
+            setattr(self, name, kwargs.pop(name, 0))
+        if kwargs:
+            raise TypeError("Unexpected statistics: {}".format(", ".join(kwargs)))
+
+    def calc_rates(self, prev: "ConnectionStats") -> None:
+        """ Calculate rates over the interval since a baseline snapshot of the same connection. """
+        if self.timestamp <= prev.timestamp:
+            return
+        self.interval = self.timestamp - prev.timestamp
+        for name in ("received_bytes", "received_frames", "received_packets",
+                     "sent_bytes", "sent_frames", "sent_packets"):
+            rate = (getattr(self, name) - getattr(prev, name)) / self.interval
+            # Counters are zeroed on reconnects.
+            setattr(self, name + "_rate", max(0.0, rate))
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return "{}({})".format(
+            type(self).__name__, ", ".join("{}={}".format(name, getattr(self, name)) for name in self.__slots__))
+
+
+class Histogram(object):
+    """
+    Latency histogram with logarithmic buckets, similar to HDR histograms.
+
+    Values are recorded with microsecond resolution. Values below 16 us have their own buckets. Larger values are
+    grouped in 8 buckets per power of two, which bounds the relative error to 12.5%.
+    """
+
+    # Linear buckets.
+    LINEAR = 16
+    # Buckets per power of two.
+    SUB_BUCKETS = 8
+    # Number of powers of two above the linear range (up to ~2^40 us).
+    OCTAVES = 36
+
+    __slots__ = ("counts", "count", "sum", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (self.LINEAR + self.SUB_BUCKETS * self.OCTAVES)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    @classmethod
+    def get_index(cls, value: float) -> int:
+        """ Get the bucket index for a value in seconds. """
+        v = max(0, int(value * 1e6))
+        if v < cls.LINEAR:
+            return v
+        shift = v.bit_length() - 4
+        return min(cls.LINEAR + (shift - 1) * cls.SUB_BUCKETS + (v >> shift) - cls.SUB_BUCKETS,
+                   cls.LINEAR + cls.SUB_BUCKETS * cls.OCTAVES - 1)
+
+    @classmethod
+    def get_upper_bound(cls, index: int) -> float:
+        """ Get the exclusive upper bound of a bucket in seconds. """
+        if index < cls.LINEAR:
+            return (index + 1) * 1e-6
+        shift = (index - cls.LINEAR) // cls.SUB_BUCKETS + 1
+        mantissa = (index - cls.LINEAR) % cls.SUB_BUCKETS + cls.SUB_BUCKETS
+        return ((mantissa + 1) << shift) * 1e-6
+
+    def record(self, value: float) -> None:
+        """ Record a value in seconds. """
+        self.counts[self.get_index(value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def get_percentile(self, percentile: float) -> Optional[float]:
+        """ Get an upper bound for a percentile (0-100) of recorded values or None if there are none. """
+        if not self.count:
+            return None
+        target = max(1, math.ceil(percentile / 100.0 * self.count))
+        total = 0
+        for index, count in enumerate(self.counts):
+            total += count
+            if total >= target:
+                return min(self.get_upper_bound(index), self.max)
+        return self.max
+
+    def get_mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    def get_count_below(self, bound: float) -> int:
+        """ Get the number of recorded values in buckets that end at or below a bound in seconds. """
+        total = 0
+        for index, count in enumerate(self.counts):
+            if self.get_upper_bound(index) > bound + 1e-12:
+                break
+            total += count
+        return total
+
+    def get_buckets(self) -> List[Tuple[float, int]]:
+        """ Get non-empty buckets as a list of (upper bound, count) tuples. """
+        return [(self.get_upper_bound(index), count) for index, count in enumerate(self.counts) if count]
+
+
+class LatencyProfiler(object):
+    """
+    Incoming packet pipeline latency profiler.
+
+    Records the time since a packet was received from the socket at each pipeline stage, in histograms per stage and
+    packet class. Comparing stages shows where time goes - e.g. ImageChunk packets waiting in the event queue behind
+    RobotState handlers.
+    """
+
+    # Frame decoded.
+    DECODE = "decode"
+    # Packet delivered in order by the receive window.
+    DELIVER = "deliver"
+    # Packet taken from the event queue.
+    DEQUEUE = "dequeue"
+    # Packet handlers completed.
+    HANDLE = "handle"
+
+    STAGES = (DECODE, DELIVER, DEQUEUE, HANDLE)
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        # (stage, packet class name) -> Histogram
+        self.histograms = {}
+
+    def record(self, stage: str, pkt, now: float) -> None:
+        """ Record the time since a packet was received. Packets without receive time are ignored. """
+        recv_time = getattr(pkt, "recv_time", None)
+        if recv_time is None:
+            return
+        packet_class = getattr(pkt, "packet_class", None) or type(pkt)
+        key = (stage, packet_class.__name__)
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = Histogram()
+                self.histograms[key] = histogram
+            histogram.record(now - recv_time)
+
+    def get_histograms(self) -> dict:
+        """ Get a {(stage, packet class name): Histogram} dictionary. """
+        with self.lock:
+            return dict(self.histograms)
+
+    def reset(self) -> None:
+        with self.lock:
+            self.histograms = {}
+
+    def format_report(self) -> str:
+        """ Format a latency table in milliseconds, ordered by packet class and stage. """
+        lines = ["{:<24} {:<8} {:>8} {:>9} {:>9} {:>9} {:>9}".format(
+            "Packet", "Stage", "Count", "Mean", "P50", "P99", "Max")]
+        histograms = self.get_histograms()
+        for stage, name in sorted(histograms, key=lambda key: (key[1], self.STAGES.index(key[0]))):
+            h = histograms[(stage, name)]
+            lines.append("{:<24} {:<8} {:>8} {:>9.3f} {:>9.3f} {:>9.3f} {:>9.3f}".format(
+                name, stage, h.count, h.get_mean() * 1000.0, h.get_percentile(50) * 1000.0,
+                h.get_percentile(99) * 1000.0, h.max * 1000.0))
+        return "\n".join(lines)
+
+
+#: Exported metrics - (statistics attribute, Prometheus metric name, metric type, help text).
+METRICS = (
+    ("received_bytes", "pycozmo_received_bytes_total", "counter", "Received bytes."),
+    ("received_frames", "pycozmo_received_frames_total", "counter", "Received frames."),
+    ("received_packets", "pycozmo_received_packets_total", "counter", "Received packets."),
+    ("delivered_packets", "pycozmo_delivered_packets_total", "counter", "Packets delivered in order."),
+    ("filtered_packets", "pycozmo_filtered_packets_total", "counter", "Received packets dropped without handlers."),
+    ("receive_discarded_frames", "pycozmo_receive_discarded_frames_total", "counter", "Discarded received frames."),
+    ("outgoing_packets", "pycozmo_outgoing_packets_total", "counter", "Packets queued for sending."),
+    ("sent_packets", "pycozmo_sent_packets_total", "counter", "Sent packets, including resends."),
+    ("sent_frames", "pycozmo_sent_frames_total", "counter", "Sent frames."),
+    ("sent_bytes", "pycozmo_sent_bytes_total", "counter", "Sent bytes."),
+    ("send_discarded_frames", "pycozmo_send_discarded_frames_total", "counter", "Frames that failed to send."),
+    ("resent_packets", "pycozmo_resent_packets_total", "counter", "Resent packets."),
+    ("fast_retransmits", "pycozmo_fast_retransmits_total", "counter", "Fast retransmits."),
+    ("resend_ratio", "pycozmo_resend_ratio", "gauge", "Ratio of resent to sent packets."),
+    ("frame_fill", "pycozmo_frame_fill_ratio", "gauge", "Average payload fill ratio of data frames."),
+    ("send_window_count", "pycozmo_send_window_packets", "gauge", "Unacknowledged packets."),
+    ("send_window_occupancy", "pycozmo_send_window_occupancy_ratio", "gauge", "Send window occupancy."),
+    ("send_queue_depth", "pycozmo_send_queue_packets", "gauge", "Packets waiting for send window space."),
+    ("event_queue_depth", "pycozmo_event_queue_events", "gauge", "Events waiting to be dispatched."),
+    ("dropped_events", "pycozmo_dropped_events_total", "counter", "Events dropped by event queue policies."),
+    ("rtt", "pycozmo_rtt_seconds", "gauge", "Smoothed round-trip time."),
+    ("rtt_var", "pycozmo_rtt_variation_seconds", "gauge", "Round-trip time variation."),
+    ("rto", "pycozmo_rto_seconds", "gauge", "Retransmission timeout."),
+    ("rtt_p50", "pycozmo_rtt_p50_seconds", "gauge", "Median of recent round-trip times."),
+    ("rtt_p90", "pycozmo_rtt_p90_seconds", "gauge", "90th percentile of recent round-trip times."),
+    ("rtt_p99", "pycozmo_rtt_p99_seconds", "gauge", "99th percentile of recent round-trip times."),
+)
+
+
+def format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join('{}="{}"'.format(
+        k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")) for k, v in labels.items()) + "}"
+
+
+def format_prometheus(stats: Iterable[Tuple[dict, ConnectionStats]]) -> str:
+    """ Format (labels, statistics) pairs in Prometheus text exposition format. Unknown values are omitted. """
+    stats = list(stats)
+    lines = []
+    for attr, name, metric_type, help_text in METRICS:
+        lines.append("# HELP {} {}".format(name, help_text))
+        lines.append("# TYPE {} {}".format(name, metric_type))
+        for labels, snapshot in stats:
+            value = getattr(snapshot, attr)
+            if value is None:
+                continue
+            lines.append("{}{} {}".format(name, format_labels(labels), repr(float(value))))
+    return "\n".join(lines) + "\n"
+
+
+#: Exported latency histogram bucket upper bounds in seconds.
+HISTOGRAM_BOUNDS = (0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0)
+
+
+def format_prometheus_histograms(profilers: Iterable[Tuple[dict, LatencyProfiler]]) -> str:
+    """ Format (labels, profiler) pairs as Prometheus histograms. Bucket counts are approximate. """
+    name = "pycozmo_packet_latency_seconds"
+    lines = [
+        "# HELP {} Time since packet receive at packet pipeline stages.".format(name),
+        "# TYPE {} histogram".format(name),
+    ]
+    for labels, profiler in profilers:
+        for (stage, packet), h in sorted(profiler.get_histograms().items()):
+            hist_labels = dict(labels, stage=stage, packet=packet)
+            for bound in HISTOGRAM_BOUNDS:
+                lines.append("{}_bucket{} {}".format(
+                    name, format_labels(dict(hist_labels, le=repr(bound))), h.get_count_below(bound)))
+            lines.append("{}_bucket{} {}".format(name, format_labels(dict(hist_labels, le="+Inf")), h.count))
+            lines.append("{}_sum{} {}".format(name, format_labels(hist_labels), repr(h.sum)))
+            lines.append("{}_count{} {}".format(name, format_labels(hist_labels), h.count))
+    return "\n".join(lines) + "\n"
+
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self) -> None:
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        try:
+            body = self.server.get_metrics().encode("utf-8")
+        except Exception as e:
+            logger.error("Failed to collect metrics. {}".format(e))
+            self.send_error(500)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, fmt: str, *args) -> None:
+        logger.debug("Metrics request from {}: {}".format(self.address_string(), fmt % args))
+
+
+class MetricsServer(ThreadingMixIn, HTTPServer):
+    """
+    HTTP server, exporting connection statistics in Prometheus text format on /metrics.
+
+    Connections are given as a list or as a function, returning the current list of connections (e.g.
+    ConnectionHub.get_connections). Each connection is labeled with its robot address.
+    """
+
+    daemon_threads = True
+
+    def __init__(self,
+                 connections: Union[list, Callable[[], List]],
+                 address: Optional[Tuple[str, int]] = None) -> None:
+        super().__init__(address or DEFAULT_ADDRESS, MetricsRequestHandler)
+        self.connections = connections
+        self.thread = None  # type: Optional[Thread]
+
+    def get_connections(self) -> list:
+        if callable(self.connections):
+            return list(self.connections())
+        return list(self.connections)
+
+    def get_metrics(self) -> str:
+        stats = []
+        profilers = []
+        for conn in self.get_connections():
+            labels = {"robot": "{}:{}".format(*conn.robot_addr)}
+            # Rates are not exported. Prometheus calculates them from counters.
+            stats.append((labels, conn.get_stats()))
+            if conn.profiler:
+                profilers.append((labels, conn.profiler))
+        res = format_prometheus(stats)
+        if profilers:
+            res += format_prometheus_histograms(profilers)
+        return res
+
+    def start(self) -> None:
+        """ Serve requests from a background thread. """
+        self.thread = Thread(target=self.serve_forever, daemon=True, name=type(self).__name__)
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+
+def start_metrics_server(connections: Union[list, Callable[[], List]],
+                         address: Optional[Tuple[str, int]] = None) -> MetricsServer:
+    """ Start a Prometheus metrics HTTP endpoint for a list of connections in a background thread. """
+    server = MetricsServer(connections, address)
+    server.start()
+    return server
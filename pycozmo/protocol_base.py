@@ -4,7 +4,7 @@ Cozmo protocol implementation base.
 
 """
 
-from typing import Optional
+from typing import Optional, Union
 from abc import ABC, abstractmethod
 
 from .protocol_ast import PacketType
@@ -18,6 +18,7 @@ __all__ = [
     "Packet",
     "UnknownPacket",
     "UnknownCommand",
+    "LazyPacket",
     "UnknownEvent",
 ]
 
@@ -58,6 +59,7 @@ class Packet(Struct, ABC):
         "_id",
         "seq",
         "ack",
+        "recv_time",
     )
 
     def __init__(self, packet_type: PacketType, packet_id: Optional[int] = None):
@@ -65,6 +67,8 @@ class Packet(Struct, ABC):
         self.id = packet_id
         self.seq = OOB_SEQ
         self.ack = OOB_SEQ
+        # Receive time (time.perf_counter()) of incoming packets, when latency profiling is enabled.
+        self.recv_time = None
 
     @property
     def type(self) -> PacketType:
@@ -123,7 +127,7 @@ class UnknownPacket(Packet):
             type=self.type.value, type_name=type(self).__name__, data=hex_dump(data=self._data))
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -179,3 +183,84 @@ class UnknownEvent(UnknownPacket):
     def __repr__(self):
         return "{type}({id:02x}, {data})".format(
             id=self.id, type=type(self).__name__, data=hex_dump(data=self._data))
+
+
+class LazyPacket(Packet):
+    """
+    Received packet that is decoded on demand.
+
+    Keeps the raw packet data and decodes it with the actual packet class on first access to a packet field. Use
+    decode() to get the decoded packet object.
+    """
+
+    __slots__ = (
+        "_packet_class",
+        "_data",
+        "_packet",
+    )
+
+    def __init__(self,
+                 packet_class: type,
+                 packet_type: PacketType,
+                 packet_id: int,
+                 data: Union[bytes, memoryview]):
+        super().__init__(packet_type, packet_id)
+        self._packet_class = packet_class
+        self._data = data
+        self._packet = None
+
+    @property
+    def packet_class(self) -> type:
+        return self._packet_class
+
+    def is_decoded(self) -> bool:
+        return self._packet is not None
+
+    def decode(self) -> Packet:
+        """ Decodes the packet. Raises ValueError or IndexError for invalid packet data. """
+        if self._packet is None:
+            pkt = self._packet_class.from_bytes(self._data)
+            pkt.seq = self.seq
+            pkt.ack = self.ack
+            pkt.recv_time = self.recv_time
+            self._packet = pkt
+            # Do not keep references to the receive buffer.
+            self._data = None
+        return self._packet
+
+    def __getattr__(self, name):
+        # Only called for attributes that are not defined by LazyPacket.
+        return getattr(self.decode(), name)
+
+    def __len__(self):
+        if self._packet is not None:
+            return len(self._packet)
+        return len(self._data)
+
+    def __repr__(self):
+        try:
+            return repr(self.decode())
+        except (ValueError, IndexError):
+            return "{type}({name}, {data})".format(
+                type=type(self).__name__, name=self._packet_class.__name__, data=hex_dump(data=self._data))
+
+    def to_bytes(self):
+        writer = BinaryWriter(len(self))
+        self.to_writer(writer)
+        return writer.dumps()
+
+    def to_writer(self, writer):
+        if self._packet is not None:
+            self._packet.to_writer(writer)
+        else:
+            writer.write_bytes(self._data)
+
+    @classmethod
+    def from_bytes(cls, buffer):
+        # The packet class is not known.
+        raise NotImplementedError
+
+    @classmethod
+    def from_reader(cls, reader):
+        # The packet class is not known.
+        raise NotImplementedError
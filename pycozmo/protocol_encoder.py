@@ -9,6 +9,7 @@ Do not modify.
 """
 
 import enum
+import struct
 
 from .protocol_ast import PacketType
 from .protocol_base import Struct, Packet
@@ -219,6 +220,8 @@ class LightState(Struct):
         "_offset",  # int16
     )
 
+    _codec = struct.Struct("<HHBBBBh")
+
     def __init__(self,
                  on_color=0,
                  off_color=0,
@@ -235,6 +238,26 @@ class LightState(Struct):
         self.transition_off_frames = transition_off_frames
         self.offset = offset
 
+    @classmethod
+    def unchecked(cls,
+                  on_color=0,
+                  off_color=0,
+                  on_frames=0,
+                  off_frames=0,
+                  transition_on_frames=0,
+                  transition_off_frames=0,
+                  offset=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        obj._on_color = on_color
+        obj._off_color = off_color
+        obj._on_frames = on_frames
+        obj._off_frames = off_frames
+        obj._transition_on_frames = transition_on_frames
+        obj._transition_off_frames = transition_off_frames
+        obj._offset = offset
+        return obj
+
     @property
     def on_color(self):
         return self._on_color
@@ -320,18 +343,20 @@ class LightState(Struct):
                 offset=self._offset)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._on_color, "H")
-        writer.write(self._off_color, "H")
-        writer.write(self._on_frames, "B")
-        writer.write(self._off_frames, "B")
-        writer.write(self._transition_on_frames, "B")
-        writer.write(self._transition_off_frames, "B")
-        writer.write(self._offset, "h")
+        writer.write_struct(
+            self._codec,
+            self._on_color,
+            self._off_color,
+            self._on_frames,
+            self._off_frames,
+            self._transition_on_frames,
+            self._transition_off_frames,
+            self._offset)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -341,14 +366,15 @@ class LightState(Struct):
 
     @classmethod
     def from_reader(cls, reader):
-        on_color = reader.read("H")
-        off_color = reader.read("H")
-        on_frames = reader.read("B")
-        off_frames = reader.read("B")
-        transition_on_frames = reader.read("B")
-        transition_off_frames = reader.read("B")
-        offset = reader.read("h")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        on_color = values[0]
+        off_color = values[1]
+        on_frames = values[2]
+        off_frames = values[3]
+        transition_on_frames = values[4]
+        transition_off_frames = values[5]
+        offset = values[6]
+        return cls.unchecked(
             on_color=on_color,
             off_color=off_color,
             on_frames=on_frames,
@@ -366,6 +392,8 @@ class PathSegmentSpeed(Struct):
         "_decel_mmps2",  # float
     )
 
+    _codec = struct.Struct("<fff")
+
     def __init__(self,
                  speed_mmps=0.0,
                  accel_mmps2=0.0,
@@ -377,6 +405,18 @@ class PathSegmentSpeed(Struct):
         # Deceleration in millimeters per second squared.
         self.decel_mmps2 = decel_mmps2
 
+    @classmethod
+    def unchecked(cls,
+                  speed_mmps=0.0,
+                  accel_mmps2=0.0,
+                  decel_mmps2=0.0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        obj._speed_mmps = speed_mmps
+        obj._accel_mmps2 = accel_mmps2
+        obj._decel_mmps2 = decel_mmps2
+        return obj
+
     @property
     def speed_mmps(self):
         return self._speed_mmps
@@ -418,14 +458,16 @@ class PathSegmentSpeed(Struct):
                 decel_mmps2=self._decel_mmps2)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._speed_mmps, "f")
-        writer.write(self._accel_mmps2, "f")
-        writer.write(self._decel_mmps2, "f")
+        writer.write_struct(
+            self._codec,
+            self._speed_mmps,
+            self._accel_mmps2,
+            self._decel_mmps2)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -435,10 +477,11 @@ class PathSegmentSpeed(Struct):
 
     @classmethod
     def from_reader(cls, reader):
-        speed_mmps = reader.read("f")
-        accel_mmps2 = reader.read("f")
-        decel_mmps2 = reader.read("f")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        speed_mmps = values[0]
+        accel_mmps2 = values[1]
+        decel_mmps2 = values[2]
+        return cls.unchecked(
             speed_mmps=speed_mmps,
             accel_mmps2=accel_mmps2,
             decel_mmps2=decel_mmps2)
@@ -453,6 +496,13 @@ class Connect(Packet):
         super().__init__(PacketType.CONNECT, packet_id=None)
         pass
 
+    @classmethod
+    def unchecked(cls):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.CONNECT, packet_id=None)
+        return obj
+
     def __len__(self):
         return 0
 
@@ -460,7 +510,7 @@ class Connect(Packet):
         return "{type}()".format(type=type(self).__name__)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -476,7 +526,7 @@ class Connect(Packet):
     @classmethod
     def from_reader(cls, reader):
         del reader
-        return cls(
+        return cls.unchecked(
             )
 
 
@@ -489,6 +539,13 @@ class Disconnect(Packet):
         super().__init__(PacketType.DISCONNECT, packet_id=None)
         pass
 
+    @classmethod
+    def unchecked(cls):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.DISCONNECT, packet_id=None)
+        return obj
+
     def __len__(self):
         return 0
 
@@ -496,7 +553,7 @@ class Disconnect(Packet):
         return "{type}()".format(type=type(self).__name__)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -512,7 +569,7 @@ class Disconnect(Packet):
     @classmethod
     def from_reader(cls, reader):
         del reader
-        return cls(
+        return cls.unchecked(
             )
 
 
@@ -525,6 +582,8 @@ class Ping(Packet):
         "_unknown",  # uint8
     )
 
+    _codec = struct.Struct("<dLLB")
+
     def __init__(self,
                  time_sent_ms=0.0,
                  counter=0,
@@ -536,6 +595,21 @@ class Ping(Packet):
         self.last = last
         self.unknown = unknown
 
+    @classmethod
+    def unchecked(cls,
+                  time_sent_ms=0.0,
+                  counter=0,
+                  last=0,
+                  unknown=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.PING, packet_id=None)
+        obj._time_sent_ms = time_sent_ms
+        obj._counter = counter
+        obj._last = last
+        obj._unknown = unknown
+        return obj
+
     @property
     def time_sent_ms(self):
         return self._time_sent_ms
@@ -588,15 +662,17 @@ class Ping(Packet):
                 unknown=self._unknown)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._time_sent_ms, "d")
-        writer.write(self._counter, "L")
-        writer.write(self._last, "L")
-        writer.write(self._unknown, "B")
+        writer.write_struct(
+            self._codec,
+            self._time_sent_ms,
+            self._counter,
+            self._last,
+            self._unknown)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -606,11 +682,12 @@ class Ping(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        time_sent_ms = reader.read("d")
-        counter = reader.read("L")
-        last = reader.read("L")
-        unknown = reader.read("B")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        time_sent_ms = values[0]
+        counter = values[1]
+        last = values[2]
+        unknown = values[3]
+        return cls.unchecked(
             time_sent_ms=time_sent_ms,
             counter=counter,
             last=last,
@@ -626,6 +703,13 @@ class Keyframe(Packet):
         super().__init__(PacketType.KEYFRAME, packet_id=None)
         pass
 
+    @classmethod
+    def unchecked(cls):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.KEYFRAME, packet_id=None)
+        return obj
+
     def __len__(self):
         return 0
 
@@ -633,7 +717,7 @@ class Keyframe(Packet):
         return "{type}()".format(type=type(self).__name__)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -649,7 +733,7 @@ class Keyframe(Packet):
     @classmethod
     def from_reader(cls, reader):
         del reader
-        return cls(
+        return cls.unchecked(
             )
 
 
@@ -668,6 +752,17 @@ class LightStateCenter(Packet):
         self.states = states
         self.unknown = unknown
 
+    @classmethod
+    def unchecked(cls,
+                  states=(),
+                  unknown=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x03)
+        obj._states = states
+        obj._unknown = unknown
+        return obj
+
     @property
     def states(self):
         return self._states
@@ -699,7 +794,7 @@ class LightStateCenter(Packet):
                 unknown=self._unknown)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -717,7 +812,7 @@ class LightStateCenter(Packet):
     def from_reader(cls, reader):
         states = reader.read_object_farray(LightState.from_reader, 3)
         unknown = reader.read("B")
-        return cls(
+        return cls.unchecked(
             states=states,
             unknown=unknown)
 
@@ -733,6 +828,15 @@ class CubeLights(Packet):
         super().__init__(PacketType.COMMAND, packet_id=0x04)
         self.states = states
 
+    @classmethod
+    def unchecked(cls,
+                  states=()):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x04)
+        obj._states = states
+        return obj
+
     @property
     def states(self):
         return self._states
@@ -753,7 +857,7 @@ class CubeLights(Packet):
                 states=self._states)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -769,7 +873,7 @@ class CubeLights(Packet):
     @classmethod
     def from_reader(cls, reader):
         states = reader.read_object_farray(LightState.from_reader, 4)
-        return cls(
+        return cls.unchecked(
             states=states)
 
 
@@ -780,6 +884,8 @@ class ObjectConnect(Packet):
         "_connect",  # bool
     )
 
+    _codec = struct.Struct("<Lb")
+
     def __init__(self,
                  factory_id=0,
                  connect=False):
@@ -787,6 +893,17 @@ class ObjectConnect(Packet):
         self.factory_id = factory_id
         self.connect = connect
 
+    @classmethod
+    def unchecked(cls,
+                  factory_id=0,
+                  connect=False):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x05)
+        obj._factory_id = factory_id
+        obj._connect = connect
+        return obj
+
     @property
     def factory_id(self):
         return self._factory_id
@@ -817,13 +934,15 @@ class ObjectConnect(Packet):
                 connect=self._connect)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._factory_id, "L")
-        writer.write(int(self._connect), "b")
+        writer.write_struct(
+            self._codec,
+            self._factory_id,
+            self._connect)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -833,9 +952,10 @@ class ObjectConnect(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        factory_id = reader.read("L")
-        connect = bool(reader.read("b"))
-        return cls(
+        values = reader.read_struct(cls._codec)
+        factory_id = values[0]
+        connect = bool(values[1])
+        return cls.unchecked(
             factory_id=factory_id,
             connect=connect)
 
@@ -847,6 +967,8 @@ class StreamObjectAccel(Packet):
         "_enable",  # bool
     )
 
+    _codec = struct.Struct("<Lb")
+
     def __init__(self,
                  object_id=0,
                  enable=False):
@@ -854,6 +976,17 @@ class StreamObjectAccel(Packet):
         self.object_id = object_id
         self.enable = enable
 
+    @classmethod
+    def unchecked(cls,
+                  object_id=0,
+                  enable=False):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x08)
+        obj._object_id = object_id
+        obj._enable = enable
+        return obj
+
     @property
     def object_id(self):
         return self._object_id
@@ -884,13 +1017,15 @@ class StreamObjectAccel(Packet):
                 enable=self._enable)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._object_id, "L")
-        writer.write(int(self._enable), "b")
+        writer.write_struct(
+            self._codec,
+            self._object_id,
+            self._enable)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -900,9 +1035,10 @@ class StreamObjectAccel(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        object_id = reader.read("L")
-        enable = bool(reader.read("b"))
-        return cls(
+        values = reader.read_struct(cls._codec)
+        object_id = values[0]
+        enable = bool(values[1])
+        return cls.unchecked(
             object_id=object_id,
             enable=enable)
 
@@ -913,11 +1049,22 @@ class SetAccessoryDiscovery(Packet):
         "_enable",  # bool
     )
 
+    _codec = struct.Struct("<b")
+
     def __init__(self,
                  enable=False):
         super().__init__(PacketType.COMMAND, packet_id=0x0a)
         self.enable = enable
 
+    @classmethod
+    def unchecked(cls,
+                  enable=False):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x0a)
+        obj._enable = enable
+        return obj
+
     @property
     def enable(self):
         return self._enable
@@ -937,12 +1084,14 @@ class SetAccessoryDiscovery(Packet):
                 enable=self._enable)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(int(self._enable), "b")
+        writer.write_struct(
+            self._codec,
+            self._enable)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -952,8 +1101,9 @@ class SetAccessoryDiscovery(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        enable = bool(reader.read("b"))
-        return cls(
+        values = reader.read_struct(cls._codec)
+        enable = bool(values[0])
+        return cls.unchecked(
             enable=enable)
 
 
@@ -963,11 +1113,22 @@ class SetHeadLight(Packet):
         "_enable",  # bool
     )
 
+    _codec = struct.Struct("<b")
+
     def __init__(self,
                  enable=False):
         super().__init__(PacketType.COMMAND, packet_id=0x0b)
         self.enable = enable
 
+    @classmethod
+    def unchecked(cls,
+                  enable=False):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x0b)
+        obj._enable = enable
+        return obj
+
     @property
     def enable(self):
         return self._enable
@@ -987,12 +1148,14 @@ class SetHeadLight(Packet):
                 enable=self._enable)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(int(self._enable), "b")
+        writer.write_struct(
+            self._codec,
+            self._enable)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -1002,8 +1165,9 @@ class SetHeadLight(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        enable = bool(reader.read("b"))
-        return cls(
+        values = reader.read_struct(cls._codec)
+        enable = bool(values[0])
+        return cls.unchecked(
             enable=enable)
 
 
@@ -1014,6 +1178,8 @@ class CubeId(Packet):
         "_rotation_period_frames",  # uint8
     )
 
+    _codec = struct.Struct("<LB")
+
     def __init__(self,
                  object_id=0,
                  rotation_period_frames=0):
@@ -1021,6 +1187,17 @@ class CubeId(Packet):
         self.object_id = object_id
         self.rotation_period_frames = rotation_period_frames
 
+    @classmethod
+    def unchecked(cls,
+                  object_id=0,
+                  rotation_period_frames=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x10)
+        obj._object_id = object_id
+        obj._rotation_period_frames = rotation_period_frames
+        return obj
+
     @property
     def object_id(self):
         return self._object_id
@@ -1051,13 +1228,15 @@ class CubeId(Packet):
                 rotation_period_frames=self._rotation_period_frames)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._object_id, "L")
-        writer.write(self._rotation_period_frames, "B")
+        writer.write_struct(
+            self._codec,
+            self._object_id,
+            self._rotation_period_frames)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -1067,9 +1246,10 @@ class CubeId(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        object_id = reader.read("L")
-        rotation_period_frames = reader.read("B")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        object_id = values[0]
+        rotation_period_frames = values[1]
+        return cls.unchecked(
             object_id=object_id,
             rotation_period_frames=rotation_period_frames)
 
@@ -1089,6 +1269,17 @@ class LightStateSide(Packet):
         self.states = states
         self.unknown = unknown
 
+    @classmethod
+    def unchecked(cls,
+                  states=(),
+                  unknown=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x11)
+        obj._states = states
+        obj._unknown = unknown
+        return obj
+
     @property
     def states(self):
         return self._states
@@ -1120,7 +1311,7 @@ class LightStateSide(Packet):
                 unknown=self._unknown)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -1138,7 +1329,7 @@ class LightStateSide(Packet):
     def from_reader(cls, reader):
         states = reader.read_object_farray(LightState.from_reader, 2)
         unknown = reader.read("B")
-        return cls(
+        return cls.unchecked(
             states=states,
             unknown=unknown)
 
@@ -1152,6 +1343,13 @@ class Enable(Packet):
         super().__init__(PacketType.COMMAND, packet_id=0x25)
         pass
 
+    @classmethod
+    def unchecked(cls):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x25)
+        return obj
+
     def __len__(self):
         return 0
 
@@ -1159,7 +1357,7 @@ class Enable(Packet):
         return "{type}()".format(type=type(self).__name__)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -1175,7 +1373,7 @@ class Enable(Packet):
     @classmethod
     def from_reader(cls, reader):
         del reader
-        return cls(
+        return cls.unchecked(
             )
 
 
@@ -1188,6 +1386,8 @@ class DriveWheels(Packet):
         "_rwheel_accel_mmps2",  # float
     )
 
+    _codec = struct.Struct("<ffff")
+
     def __init__(self,
                  lwheel_speed_mmps=0.0,
                  rwheel_speed_mmps=0.0,
@@ -1199,6 +1399,21 @@ class DriveWheels(Packet):
         self.lwheel_accel_mmps2 = lwheel_accel_mmps2
         self.rwheel_accel_mmps2 = rwheel_accel_mmps2
 
+    @classmethod
+    def unchecked(cls,
+                  lwheel_speed_mmps=0.0,
+                  rwheel_speed_mmps=0.0,
+                  lwheel_accel_mmps2=0.0,
+                  rwheel_accel_mmps2=0.0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x32)
+        obj._lwheel_speed_mmps = lwheel_speed_mmps
+        obj._rwheel_speed_mmps = rwheel_speed_mmps
+        obj._lwheel_accel_mmps2 = lwheel_accel_mmps2
+        obj._rwheel_accel_mmps2 = rwheel_accel_mmps2
+        return obj
+
     @property
     def lwheel_speed_mmps(self):
         return self._lwheel_speed_mmps
@@ -1251,15 +1466,17 @@ class DriveWheels(Packet):
                 rwheel_accel_mmps2=self._rwheel_accel_mmps2)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._lwheel_speed_mmps, "f")
-        writer.write(self._rwheel_speed_mmps, "f")
-        writer.write(self._lwheel_accel_mmps2, "f")
-        writer.write(self._rwheel_accel_mmps2, "f")
+        writer.write_struct(
+            self._codec,
+            self._lwheel_speed_mmps,
+            self._rwheel_speed_mmps,
+            self._lwheel_accel_mmps2,
+            self._rwheel_accel_mmps2)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -1269,11 +1486,12 @@ class DriveWheels(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        lwheel_speed_mmps = reader.read("f")
-        rwheel_speed_mmps = reader.read("f")
-        lwheel_accel_mmps2 = reader.read("f")
-        rwheel_accel_mmps2 = reader.read("f")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        lwheel_speed_mmps = values[0]
+        rwheel_speed_mmps = values[1]
+        lwheel_accel_mmps2 = values[2]
+        rwheel_accel_mmps2 = values[3]
+        return cls.unchecked(
             lwheel_speed_mmps=lwheel_speed_mmps,
             rwheel_speed_mmps=rwheel_speed_mmps,
             lwheel_accel_mmps2=lwheel_accel_mmps2,
@@ -1288,6 +1506,8 @@ class TurnInPlaceAtSpeed(Packet):
         "_direction",  # int16
     )
 
+    _codec = struct.Struct("<ffh")
+
     def __init__(self,
                  wheel_speed_mmps=0.0,
                  wheel_accel_mmps2=0.0,
@@ -1297,6 +1517,19 @@ class TurnInPlaceAtSpeed(Packet):
         self.wheel_accel_mmps2 = wheel_accel_mmps2
         self.direction = direction
 
+    @classmethod
+    def unchecked(cls,
+                  wheel_speed_mmps=0.0,
+                  wheel_accel_mmps2=0.0,
+                  direction=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x33)
+        obj._wheel_speed_mmps = wheel_speed_mmps
+        obj._wheel_accel_mmps2 = wheel_accel_mmps2
+        obj._direction = direction
+        return obj
+
     @property
     def wheel_speed_mmps(self):
         return self._wheel_speed_mmps
@@ -1338,14 +1571,16 @@ class TurnInPlaceAtSpeed(Packet):
                 direction=self._direction)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._wheel_speed_mmps, "f")
-        writer.write(self._wheel_accel_mmps2, "f")
-        writer.write(self._direction, "h")
+        writer.write_struct(
+            self._codec,
+            self._wheel_speed_mmps,
+            self._wheel_accel_mmps2,
+            self._direction)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -1355,10 +1590,11 @@ class TurnInPlaceAtSpeed(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        wheel_speed_mmps = reader.read("f")
-        wheel_accel_mmps2 = reader.read("f")
-        direction = reader.read("h")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        wheel_speed_mmps = values[0]
+        wheel_accel_mmps2 = values[1]
+        direction = values[2]
+        return cls.unchecked(
             wheel_speed_mmps=wheel_speed_mmps,
             wheel_accel_mmps2=wheel_accel_mmps2,
             direction=direction)
@@ -1370,11 +1606,22 @@ class MoveLift(Packet):
         "_speed_rad_per_sec",  # float
     )
 
+    _codec = struct.Struct("<f")
+
     def __init__(self,
                  speed_rad_per_sec=0.0):
         super().__init__(PacketType.COMMAND, packet_id=0x34)
         self.speed_rad_per_sec = speed_rad_per_sec
 
+    @classmethod
+    def unchecked(cls,
+                  speed_rad_per_sec=0.0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x34)
+        obj._speed_rad_per_sec = speed_rad_per_sec
+        return obj
+
     @property
     def speed_rad_per_sec(self):
         return self._speed_rad_per_sec
@@ -1394,12 +1641,14 @@ class MoveLift(Packet):
                 speed_rad_per_sec=self._speed_rad_per_sec)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._speed_rad_per_sec, "f")
+        writer.write_struct(
+            self._codec,
+            self._speed_rad_per_sec)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -1409,8 +1658,9 @@ class MoveLift(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        speed_rad_per_sec = reader.read("f")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        speed_rad_per_sec = values[0]
+        return cls.unchecked(
             speed_rad_per_sec=speed_rad_per_sec)
 
 
@@ -1420,11 +1670,22 @@ class MoveHead(Packet):
         "_speed_rad_per_sec",  # float
     )
 
+    _codec = struct.Struct("<f")
+
     def __init__(self,
                  speed_rad_per_sec=0.0):
         super().__init__(PacketType.COMMAND, packet_id=0x35)
         self.speed_rad_per_sec = speed_rad_per_sec
 
+    @classmethod
+    def unchecked(cls,
+                  speed_rad_per_sec=0.0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x35)
+        obj._speed_rad_per_sec = speed_rad_per_sec
+        return obj
+
     @property
     def speed_rad_per_sec(self):
         return self._speed_rad_per_sec
@@ -1444,12 +1705,14 @@ class MoveHead(Packet):
                 speed_rad_per_sec=self._speed_rad_per_sec)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._speed_rad_per_sec, "f")
+        writer.write_struct(
+            self._codec,
+            self._speed_rad_per_sec)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -1459,8 +1722,9 @@ class MoveHead(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        speed_rad_per_sec = reader.read("f")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        speed_rad_per_sec = values[0]
+        return cls.unchecked(
             speed_rad_per_sec=speed_rad_per_sec)
 
 
@@ -1474,6 +1738,8 @@ class SetLiftHeight(Packet):
         "_action_id",  # uint8
     )
 
+    _codec = struct.Struct("<ffffB")
+
     def __init__(self,
                  height_mm=0.0,
                  max_speed_rad_per_sec=3.0,
@@ -1488,6 +1754,23 @@ class SetLiftHeight(Packet):
         # Not present in v2214 and older.
         self.action_id = action_id
 
+    @classmethod
+    def unchecked(cls,
+                  height_mm=0.0,
+                  max_speed_rad_per_sec=3.0,
+                  accel_rad_per_sec2=20.0,
+                  duration_sec=0.0,
+                  action_id=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x36)
+        obj._height_mm = height_mm
+        obj._max_speed_rad_per_sec = max_speed_rad_per_sec
+        obj._accel_rad_per_sec2 = accel_rad_per_sec2
+        obj._duration_sec = duration_sec
+        obj._action_id = action_id
+        return obj
+
     @property
     def height_mm(self):
         return self._height_mm
@@ -1551,16 +1834,18 @@ class SetLiftHeight(Packet):
                 action_id=self._action_id)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._height_mm, "f")
-        writer.write(self._max_speed_rad_per_sec, "f")
-        writer.write(self._accel_rad_per_sec2, "f")
-        writer.write(self._duration_sec, "f")
-        writer.write(self._action_id, "B")
+        writer.write_struct(
+            self._codec,
+            self._height_mm,
+            self._max_speed_rad_per_sec,
+            self._accel_rad_per_sec2,
+            self._duration_sec,
+            self._action_id)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -1570,12 +1855,13 @@ class SetLiftHeight(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        height_mm = reader.read("f")
-        max_speed_rad_per_sec = reader.read("f")
-        accel_rad_per_sec2 = reader.read("f")
-        duration_sec = reader.read("f")
-        action_id = reader.read("B")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        height_mm = values[0]
+        max_speed_rad_per_sec = values[1]
+        accel_rad_per_sec2 = values[2]
+        duration_sec = values[3]
+        action_id = values[4]
+        return cls.unchecked(
             height_mm=height_mm,
             max_speed_rad_per_sec=max_speed_rad_per_sec,
             accel_rad_per_sec2=accel_rad_per_sec2,
@@ -1593,6 +1879,8 @@ class SetHeadAngle(Packet):
         "_action_id",  # uint8
     )
 
+    _codec = struct.Struct("<ffffB")
+
     def __init__(self,
                  angle_rad=0.0,
                  max_speed_rad_per_sec=15.0,
@@ -1607,6 +1895,23 @@ class SetHeadAngle(Packet):
         # Not present in v2214 and older.
         self.action_id = action_id
 
+    @classmethod
+    def unchecked(cls,
+                  angle_rad=0.0,
+                  max_speed_rad_per_sec=15.0,
+                  accel_rad_per_sec2=20.0,
+                  duration_sec=0.0,
+                  action_id=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x37)
+        obj._angle_rad = angle_rad
+        obj._max_speed_rad_per_sec = max_speed_rad_per_sec
+        obj._accel_rad_per_sec2 = accel_rad_per_sec2
+        obj._duration_sec = duration_sec
+        obj._action_id = action_id
+        return obj
+
     @property
     def angle_rad(self):
         return self._angle_rad
@@ -1670,16 +1975,18 @@ class SetHeadAngle(Packet):
                 action_id=self._action_id)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._angle_rad, "f")
-        writer.write(self._max_speed_rad_per_sec, "f")
-        writer.write(self._accel_rad_per_sec2, "f")
-        writer.write(self._duration_sec, "f")
-        writer.write(self._action_id, "B")
+        writer.write_struct(
+            self._codec,
+            self._angle_rad,
+            self._max_speed_rad_per_sec,
+            self._accel_rad_per_sec2,
+            self._duration_sec,
+            self._action_id)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -1689,12 +1996,13 @@ class SetHeadAngle(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        angle_rad = reader.read("f")
-        max_speed_rad_per_sec = reader.read("f")
-        accel_rad_per_sec2 = reader.read("f")
-        duration_sec = reader.read("f")
-        action_id = reader.read("B")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        angle_rad = values[0]
+        max_speed_rad_per_sec = values[1]
+        accel_rad_per_sec2 = values[2]
+        duration_sec = values[3]
+        action_id = values[4]
+        return cls.unchecked(
             angle_rad=angle_rad,
             max_speed_rad_per_sec=max_speed_rad_per_sec,
             accel_rad_per_sec2=accel_rad_per_sec2,
@@ -1715,6 +2023,8 @@ class TurnInPlace(Packet):
         "_action_id",  # uint8
     )
 
+    _codec = struct.Struct("<ffffBBbB")
+
     def __init__(self,
                  angle_rad=0.0,
                  speed_rad_per_sec=0.0,
@@ -1734,6 +2044,29 @@ class TurnInPlace(Packet):
         self.is_absolute = is_absolute
         self.action_id = action_id
 
+    @classmethod
+    def unchecked(cls,
+                  angle_rad=0.0,
+                  speed_rad_per_sec=0.0,
+                  accel_rad_per_sec2=0.0,
+                  angle_tolerance_rad=0.0,
+                  unknown4=0,
+                  unknown5=0,
+                  is_absolute=False,
+                  action_id=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x39)
+        obj._angle_rad = angle_rad
+        obj._speed_rad_per_sec = speed_rad_per_sec
+        obj._accel_rad_per_sec2 = accel_rad_per_sec2
+        obj._angle_tolerance_rad = angle_tolerance_rad
+        obj._unknown4 = unknown4
+        obj._unknown5 = unknown5
+        obj._is_absolute = is_absolute
+        obj._action_id = action_id
+        return obj
+
     @property
     def angle_rad(self):
         return self._angle_rad
@@ -1830,19 +2163,21 @@ class TurnInPlace(Packet):
                 action_id=self._action_id)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._angle_rad, "f")
-        writer.write(self._speed_rad_per_sec, "f")
-        writer.write(self._accel_rad_per_sec2, "f")
-        writer.write(self._angle_tolerance_rad, "f")
-        writer.write(self._unknown4, "B")
-        writer.write(self._unknown5, "B")
-        writer.write(int(self._is_absolute), "b")
-        writer.write(self._action_id, "B")
+        writer.write_struct(
+            self._codec,
+            self._angle_rad,
+            self._speed_rad_per_sec,
+            self._accel_rad_per_sec2,
+            self._angle_tolerance_rad,
+            self._unknown4,
+            self._unknown5,
+            self._is_absolute,
+            self._action_id)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -1852,15 +2187,16 @@ class TurnInPlace(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        angle_rad = reader.read("f")
-        speed_rad_per_sec = reader.read("f")
-        accel_rad_per_sec2 = reader.read("f")
-        angle_tolerance_rad = reader.read("f")
-        unknown4 = reader.read("B")
-        unknown5 = reader.read("B")
-        is_absolute = bool(reader.read("b"))
-        action_id = reader.read("B")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        angle_rad = values[0]
+        speed_rad_per_sec = values[1]
+        accel_rad_per_sec2 = values[2]
+        angle_tolerance_rad = values[3]
+        unknown4 = values[4]
+        unknown5 = values[5]
+        is_absolute = bool(values[6])
+        action_id = values[7]
+        return cls.unchecked(
             angle_rad=angle_rad,
             speed_rad_per_sec=speed_rad_per_sec,
             accel_rad_per_sec2=accel_rad_per_sec2,
@@ -1880,6 +2216,13 @@ class StopAllMotors(Packet):
         super().__init__(PacketType.COMMAND, packet_id=0x3b)
         pass
 
+    @classmethod
+    def unchecked(cls):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x3b)
+        return obj
+
     def __len__(self):
         return 0
 
@@ -1887,7 +2230,7 @@ class StopAllMotors(Packet):
         return "{type}()".format(type=type(self).__name__)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -1903,7 +2246,7 @@ class StopAllMotors(Packet):
     @classmethod
     def from_reader(cls, reader):
         del reader
-        return cls(
+        return cls.unchecked(
             )
 
 
@@ -1913,11 +2256,22 @@ class ClearPath(Packet):
         "_unknown",  # uint16
     )
 
+    _codec = struct.Struct("<H")
+
     def __init__(self,
                  unknown=0):
         super().__init__(PacketType.COMMAND, packet_id=0x3c)
         self.unknown = unknown
 
+    @classmethod
+    def unchecked(cls,
+                  unknown=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x3c)
+        obj._unknown = unknown
+        return obj
+
     @property
     def unknown(self):
         return self._unknown
@@ -1937,12 +2291,14 @@ class ClearPath(Packet):
                 unknown=self._unknown)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._unknown, "H")
+        writer.write_struct(
+            self._codec,
+            self._unknown)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -1952,8 +2308,9 @@ class ClearPath(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        unknown = reader.read("H")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        unknown = values[0]
+        return cls.unchecked(
             unknown=unknown)
 
 
@@ -1969,6 +2326,8 @@ class AppendPathSegLine(Packet):
         "_decel_mmps2",  # float
     )
 
+    _codec = struct.Struct("<fffffff")
+
     def __init__(self,
                  from_x=0.0,
                  from_y=0.0,
@@ -1986,6 +2345,27 @@ class AppendPathSegLine(Packet):
         self.accel_mmps2 = accel_mmps2
         self.decel_mmps2 = decel_mmps2
 
+    @classmethod
+    def unchecked(cls,
+                  from_x=0.0,
+                  from_y=0.0,
+                  to_x=0.0,
+                  to_y=0.0,
+                  speed_mmps=0.0,
+                  accel_mmps2=0.0,
+                  decel_mmps2=0.0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x3d)
+        obj._from_x = from_x
+        obj._from_y = from_y
+        obj._to_x = to_x
+        obj._to_y = to_y
+        obj._speed_mmps = speed_mmps
+        obj._accel_mmps2 = accel_mmps2
+        obj._decel_mmps2 = decel_mmps2
+        return obj
+
     @property
     def from_x(self):
         return self._from_x
@@ -2071,18 +2451,20 @@ class AppendPathSegLine(Packet):
                 decel_mmps2=self._decel_mmps2)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._from_x, "f")
-        writer.write(self._from_y, "f")
-        writer.write(self._to_x, "f")
-        writer.write(self._to_y, "f")
-        writer.write(self._speed_mmps, "f")
-        writer.write(self._accel_mmps2, "f")
-        writer.write(self._decel_mmps2, "f")
+        writer.write_struct(
+            self._codec,
+            self._from_x,
+            self._from_y,
+            self._to_x,
+            self._to_y,
+            self._speed_mmps,
+            self._accel_mmps2,
+            self._decel_mmps2)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -2092,14 +2474,15 @@ class AppendPathSegLine(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        from_x = reader.read("f")
-        from_y = reader.read("f")
-        to_x = reader.read("f")
-        to_y = reader.read("f")
-        speed_mmps = reader.read("f")
-        accel_mmps2 = reader.read("f")
-        decel_mmps2 = reader.read("f")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        from_x = values[0]
+        from_y = values[1]
+        to_x = values[2]
+        to_y = values[3]
+        speed_mmps = values[4]
+        accel_mmps2 = values[5]
+        decel_mmps2 = values[6]
+        return cls.unchecked(
             from_x=from_x,
             from_y=from_y,
             to_x=to_x,
@@ -2122,6 +2505,8 @@ class AppendPathSegArc(Packet):
         "_decel_mmps2",  # float
     )
 
+    _codec = struct.Struct("<ffffffff")
+
     def __init__(self,
                  center_x=0.0,
                  center_y=0.0,
@@ -2141,6 +2526,29 @@ class AppendPathSegArc(Packet):
         self.accel_mmps2 = accel_mmps2
         self.decel_mmps2 = decel_mmps2
 
+    @classmethod
+    def unchecked(cls,
+                  center_x=0.0,
+                  center_y=0.0,
+                  radius_mm=0.0,
+                  start_angle_rad=0.0,
+                  sweep_rad=0.0,
+                  speed_mmps=0.0,
+                  accel_mmps2=0.0,
+                  decel_mmps2=0.0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x3e)
+        obj._center_x = center_x
+        obj._center_y = center_y
+        obj._radius_mm = radius_mm
+        obj._start_angle_rad = start_angle_rad
+        obj._sweep_rad = sweep_rad
+        obj._speed_mmps = speed_mmps
+        obj._accel_mmps2 = accel_mmps2
+        obj._decel_mmps2 = decel_mmps2
+        return obj
+
     @property
     def center_x(self):
         return self._center_x
@@ -2237,19 +2645,21 @@ class AppendPathSegArc(Packet):
                 decel_mmps2=self._decel_mmps2)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._center_x, "f")
-        writer.write(self._center_y, "f")
-        writer.write(self._radius_mm, "f")
-        writer.write(self._start_angle_rad, "f")
-        writer.write(self._sweep_rad, "f")
-        writer.write(self._speed_mmps, "f")
-        writer.write(self._accel_mmps2, "f")
-        writer.write(self._decel_mmps2, "f")
+        writer.write_struct(
+            self._codec,
+            self._center_x,
+            self._center_y,
+            self._radius_mm,
+            self._start_angle_rad,
+            self._sweep_rad,
+            self._speed_mmps,
+            self._accel_mmps2,
+            self._decel_mmps2)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -2259,15 +2669,16 @@ class AppendPathSegArc(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        center_x = reader.read("f")
-        center_y = reader.read("f")
-        radius_mm = reader.read("f")
-        start_angle_rad = reader.read("f")
-        sweep_rad = reader.read("f")
-        speed_mmps = reader.read("f")
-        accel_mmps2 = reader.read("f")
-        decel_mmps2 = reader.read("f")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        center_x = values[0]
+        center_y = values[1]
+        radius_mm = values[2]
+        start_angle_rad = values[3]
+        sweep_rad = values[4]
+        speed_mmps = values[5]
+        accel_mmps2 = values[6]
+        decel_mmps2 = values[7]
+        return cls.unchecked(
             center_x=center_x,
             center_y=center_y,
             radius_mm=radius_mm,
@@ -2291,6 +2702,8 @@ class AppendPathSegPointTurn(Packet):
         "_unknown",  # bool
     )
 
+    _codec = struct.Struct("<fffffffb")
+
     def __init__(self,
                  x=0.0,
                  y=0.0,
@@ -2310,6 +2723,29 @@ class AppendPathSegPointTurn(Packet):
         self.decel_mmps2 = decel_mmps2
         self.unknown = unknown
 
+    @classmethod
+    def unchecked(cls,
+                  x=0.0,
+                  y=0.0,
+                  angle_rad=0.0,
+                  angle_tolerance_rad=0.0,
+                  speed_mmps=0.0,
+                  accel_mmps2=0.0,
+                  decel_mmps2=0.0,
+                  unknown=False):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x3f)
+        obj._x = x
+        obj._y = y
+        obj._angle_rad = angle_rad
+        obj._angle_tolerance_rad = angle_tolerance_rad
+        obj._speed_mmps = speed_mmps
+        obj._accel_mmps2 = accel_mmps2
+        obj._decel_mmps2 = decel_mmps2
+        obj._unknown = unknown
+        return obj
+
     @property
     def x(self):
         return self._x
@@ -2406,19 +2842,21 @@ class AppendPathSegPointTurn(Packet):
                 unknown=self._unknown)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._x, "f")
-        writer.write(self._y, "f")
-        writer.write(self._angle_rad, "f")
-        writer.write(self._angle_tolerance_rad, "f")
-        writer.write(self._speed_mmps, "f")
-        writer.write(self._accel_mmps2, "f")
-        writer.write(self._decel_mmps2, "f")
-        writer.write(int(self._unknown), "b")
+        writer.write_struct(
+            self._codec,
+            self._x,
+            self._y,
+            self._angle_rad,
+            self._angle_tolerance_rad,
+            self._speed_mmps,
+            self._accel_mmps2,
+            self._decel_mmps2,
+            self._unknown)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -2428,15 +2866,16 @@ class AppendPathSegPointTurn(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        x = reader.read("f")
-        y = reader.read("f")
-        angle_rad = reader.read("f")
-        angle_tolerance_rad = reader.read("f")
-        speed_mmps = reader.read("f")
-        accel_mmps2 = reader.read("f")
-        decel_mmps2 = reader.read("f")
-        unknown = bool(reader.read("b"))
-        return cls(
+        values = reader.read_struct(cls._codec)
+        x = values[0]
+        y = values[1]
+        angle_rad = values[2]
+        angle_tolerance_rad = values[3]
+        speed_mmps = values[4]
+        accel_mmps2 = values[5]
+        decel_mmps2 = values[6]
+        unknown = bool(values[7])
+        return cls.unchecked(
             x=x,
             y=y,
             angle_rad=angle_rad,
@@ -2454,6 +2893,8 @@ class TrimPath(Packet):
         "_tail",  # uint8
     )
 
+    _codec = struct.Struct("<BB")
+
     def __init__(self,
                  head=0,
                  tail=0):
@@ -2461,6 +2902,17 @@ class TrimPath(Packet):
         self.head = head
         self.tail = tail
 
+    @classmethod
+    def unchecked(cls,
+                  head=0,
+                  tail=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x40)
+        obj._head = head
+        obj._tail = tail
+        return obj
+
     @property
     def head(self):
         return self._head
@@ -2491,13 +2943,15 @@ class TrimPath(Packet):
                 tail=self._tail)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._head, "B")
-        writer.write(self._tail, "B")
+        writer.write_struct(
+            self._codec,
+            self._head,
+            self._tail)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -2507,9 +2961,10 @@ class TrimPath(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        head = reader.read("B")
-        tail = reader.read("B")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        head = values[0]
+        tail = values[1]
+        return cls.unchecked(
             head=head,
             tail=tail)
 
@@ -2521,6 +2976,8 @@ class ExecutePath(Packet):
         "_unknown",  # bool
     )
 
+    _codec = struct.Struct("<Hb")
+
     def __init__(self,
                  event_id=0,
                  unknown=False):
@@ -2528,6 +2985,17 @@ class ExecutePath(Packet):
         self.event_id = event_id
         self.unknown = unknown
 
+    @classmethod
+    def unchecked(cls,
+                  event_id=0,
+                  unknown=False):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x41)
+        obj._event_id = event_id
+        obj._unknown = unknown
+        return obj
+
     @property
     def event_id(self):
         return self._event_id
@@ -2558,13 +3026,15 @@ class ExecutePath(Packet):
                 unknown=self._unknown)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._event_id, "H")
-        writer.write(int(self._unknown), "b")
+        writer.write_struct(
+            self._codec,
+            self._event_id,
+            self._unknown)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -2574,9 +3044,10 @@ class ExecutePath(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        event_id = reader.read("H")
-        unknown = bool(reader.read("b"))
-        return cls(
+        values = reader.read_struct(cls._codec)
+        event_id = values[0]
+        unknown = bool(values[1])
+        return cls.unchecked(
             event_id=event_id,
             unknown=unknown)
 
@@ -2592,6 +3063,8 @@ class SetOrigin(Packet):
         "_unknown5",  # uint32
     )
 
+    _codec = struct.Struct("<LLLffL")
+
     def __init__(self,
                  unknown0=0,
                  pose_frame_id=0,
@@ -2607,6 +3080,25 @@ class SetOrigin(Packet):
         self.pose_y = pose_y
         self.unknown5 = unknown5
 
+    @classmethod
+    def unchecked(cls,
+                  unknown0=0,
+                  pose_frame_id=0,
+                  pose_origin_id=1,
+                  pose_x=0.0,
+                  pose_y=0.0,
+                  unknown5=2147483648):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x45)
+        obj._unknown0 = unknown0
+        obj._pose_frame_id = pose_frame_id
+        obj._pose_origin_id = pose_origin_id
+        obj._pose_x = pose_x
+        obj._pose_y = pose_y
+        obj._unknown5 = unknown5
+        return obj
+
     @property
     def unknown0(self):
         return self._unknown0
@@ -2681,17 +3173,19 @@ class SetOrigin(Packet):
                 unknown5=self._unknown5)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._unknown0, "L")
-        writer.write(self._pose_frame_id, "L")
-        writer.write(self._pose_origin_id, "L")
-        writer.write(self._pose_x, "f")
-        writer.write(self._pose_y, "f")
-        writer.write(self._unknown5, "L")
+        writer.write_struct(
+            self._codec,
+            self._unknown0,
+            self._pose_frame_id,
+            self._pose_origin_id,
+            self._pose_x,
+            self._pose_y,
+            self._unknown5)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -2701,13 +3195,14 @@ class SetOrigin(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        unknown0 = reader.read("L")
-        pose_frame_id = reader.read("L")
-        pose_origin_id = reader.read("L")
-        pose_x = reader.read("f")
-        pose_y = reader.read("f")
-        unknown5 = reader.read("L")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        unknown0 = values[0]
+        pose_frame_id = values[1]
+        pose_origin_id = values[2]
+        pose_x = values[3]
+        pose_y = values[4]
+        unknown5 = values[5]
+        return cls.unchecked(
             unknown0=unknown0,
             pose_frame_id=pose_frame_id,
             pose_origin_id=pose_origin_id,
@@ -2723,6 +3218,8 @@ class SyncTime(Packet):
         "_unknown",  # uint32
     )
 
+    _codec = struct.Struct("<LL")
+
     def __init__(self,
                  timestamp=0,
                  unknown=0):
@@ -2730,6 +3227,17 @@ class SyncTime(Packet):
         self.timestamp = timestamp
         self.unknown = unknown
 
+    @classmethod
+    def unchecked(cls,
+                  timestamp=0,
+                  unknown=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x4b)
+        obj._timestamp = timestamp
+        obj._unknown = unknown
+        return obj
+
     @property
     def timestamp(self):
         return self._timestamp
@@ -2760,13 +3268,15 @@ class SyncTime(Packet):
                 unknown=self._unknown)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._timestamp, "L")
-        writer.write(self._unknown, "L")
+        writer.write_struct(
+            self._codec,
+            self._timestamp,
+            self._unknown)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -2776,9 +3286,10 @@ class SyncTime(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        timestamp = reader.read("L")
-        unknown = reader.read("L")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        timestamp = values[0]
+        unknown = values[1]
+        return cls.unchecked(
             timestamp=timestamp,
             unknown=unknown)
 
@@ -2790,6 +3301,8 @@ class EnableCamera(Packet):
         "_image_resolution",  # ImageResolution
     )
 
+    _codec = struct.Struct("<bb")
+
     def __init__(self,
                  image_send_mode=1,
                  image_resolution=4):
@@ -2797,6 +3310,17 @@ class EnableCamera(Packet):
         self.image_send_mode = ImageSendMode(image_send_mode)
         self.image_resolution = ImageResolution(image_resolution)
 
+    @classmethod
+    def unchecked(cls,
+                  image_send_mode=1,
+                  image_resolution=4):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x4c)
+        obj._image_send_mode = ImageSendMode(image_send_mode)
+        obj._image_resolution = ImageResolution(image_resolution)
+        return obj
+
     @property
     def image_send_mode(self) -> ImageSendMode:
         return self._image_send_mode
@@ -2829,13 +3353,15 @@ class EnableCamera(Packet):
                 image_resolution=self._image_resolution)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._image_send_mode.value, "b")
-        writer.write(self._image_resolution.value, "b")
+        writer.write_struct(
+            self._codec,
+            self._image_send_mode.value,
+            self._image_resolution.value)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -2845,9 +3371,10 @@ class EnableCamera(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        image_send_mode = reader.read("b")
-        image_resolution = reader.read("b")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        image_send_mode = values[0]
+        image_resolution = values[1]
+        return cls.unchecked(
             image_send_mode=image_send_mode,
             image_resolution=image_resolution)
 
@@ -2860,6 +3387,8 @@ class SetCameraParams(Packet):
         "_auto_exposure_enabled",  # bool
     )
 
+    _codec = struct.Struct("<fHb")
+
     def __init__(self,
                  gain=0.0,
                  exposure_ms=0,
@@ -2869,6 +3398,19 @@ class SetCameraParams(Packet):
         self.exposure_ms = exposure_ms
         self.auto_exposure_enabled = auto_exposure_enabled
 
+    @classmethod
+    def unchecked(cls,
+                  gain=0.0,
+                  exposure_ms=0,
+                  auto_exposure_enabled=False):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x57)
+        obj._gain = gain
+        obj._exposure_ms = exposure_ms
+        obj._auto_exposure_enabled = auto_exposure_enabled
+        return obj
+
     @property
     def gain(self):
         return self._gain
@@ -2910,14 +3452,16 @@ class SetCameraParams(Packet):
                 auto_exposure_enabled=self._auto_exposure_enabled)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._gain, "f")
-        writer.write(self._exposure_ms, "H")
-        writer.write(int(self._auto_exposure_enabled), "b")
+        writer.write_struct(
+            self._codec,
+            self._gain,
+            self._exposure_ms,
+            self._auto_exposure_enabled)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -2927,10 +3471,11 @@ class SetCameraParams(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        gain = reader.read("f")
-        exposure_ms = reader.read("H")
-        auto_exposure_enabled = bool(reader.read("b"))
-        return cls(
+        values = reader.read_struct(cls._codec)
+        gain = values[0]
+        exposure_ms = values[1]
+        auto_exposure_enabled = bool(values[2])
+        return cls.unchecked(
             gain=gain,
             exposure_ms=exposure_ms,
             auto_exposure_enabled=auto_exposure_enabled)
@@ -2943,6 +3488,8 @@ class StartMotorCalibration(Packet):
         "_lift",  # bool
     )
 
+    _codec = struct.Struct("<bb")
+
     def __init__(self,
                  head=False,
                  lift=False):
@@ -2950,6 +3497,17 @@ class StartMotorCalibration(Packet):
         self.head = head
         self.lift = lift
 
+    @classmethod
+    def unchecked(cls,
+                  head=False,
+                  lift=False):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x58)
+        obj._head = head
+        obj._lift = lift
+        return obj
+
     @property
     def head(self):
         return self._head
@@ -2980,13 +3538,15 @@ class StartMotorCalibration(Packet):
                 lift=self._lift)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(int(self._head), "b")
-        writer.write(int(self._lift), "b")
+        writer.write_struct(
+            self._codec,
+            self._head,
+            self._lift)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -2996,9 +3556,10 @@ class StartMotorCalibration(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        head = bool(reader.read("b"))
-        lift = bool(reader.read("b"))
-        return cls(
+        values = reader.read_struct(cls._codec)
+        head = bool(values[0])
+        lift = bool(values[1])
+        return cls.unchecked(
             head=head,
             lift=lift)
 
@@ -3009,11 +3570,22 @@ class EnableStopOnCliff(Packet):
         "_enable",  # bool
     )
 
+    _codec = struct.Struct("<b")
+
     def __init__(self,
                  enable=False):
         super().__init__(PacketType.COMMAND, packet_id=0x60)
         self.enable = enable
 
+    @classmethod
+    def unchecked(cls,
+                  enable=False):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x60)
+        obj._enable = enable
+        return obj
+
     @property
     def enable(self):
         return self._enable
@@ -3033,12 +3605,14 @@ class EnableStopOnCliff(Packet):
                 enable=self._enable)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(int(self._enable), "b")
+        writer.write_struct(
+            self._codec,
+            self._enable)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -3048,8 +3622,9 @@ class EnableStopOnCliff(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        enable = bool(reader.read("b"))
-        return cls(
+        values = reader.read_struct(cls._codec)
+        enable = bool(values[0])
+        return cls.unchecked(
             enable=enable)
 
 
@@ -3059,11 +3634,22 @@ class SetRobotVolume(Packet):
         "_level",  # uint16
     )
 
+    _codec = struct.Struct("<H")
+
     def __init__(self,
                  level=0):
         super().__init__(PacketType.COMMAND, packet_id=0x64)
         self.level = level
 
+    @classmethod
+    def unchecked(cls,
+                  level=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x64)
+        obj._level = level
+        return obj
+
     @property
     def level(self):
         return self._level
@@ -3083,12 +3669,14 @@ class SetRobotVolume(Packet):
                 level=self._level)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._level, "H")
+        writer.write_struct(
+            self._codec,
+            self._level)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -3098,8 +3686,9 @@ class SetRobotVolume(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        level = reader.read("H")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        level = values[0]
+        return cls.unchecked(
             level=level)
 
 
@@ -3109,11 +3698,22 @@ class EnableColorImages(Packet):
         "_enable",  # bool
     )
 
+    _codec = struct.Struct("<b")
+
     def __init__(self,
                  enable=False):
         super().__init__(PacketType.COMMAND, packet_id=0x66)
         self.enable = enable
 
+    @classmethod
+    def unchecked(cls,
+                  enable=False):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x66)
+        obj._enable = enable
+        return obj
+
     @property
     def enable(self):
         return self._enable
@@ -3133,12 +3733,14 @@ class EnableColorImages(Packet):
                 enable=self._enable)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(int(self._enable), "b")
+        writer.write_struct(
+            self._codec,
+            self._enable)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -3148,8 +3750,9 @@ class EnableColorImages(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        enable = bool(reader.read("b"))
-        return cls(
+        values = reader.read_struct(cls._codec)
+        enable = bool(values[0])
+        return cls.unchecked(
             enable=enable)
 
 
@@ -3176,6 +3779,23 @@ class NvStorageOp(Packet):
         self.unknown = unknown
         self.data = data
 
+    @classmethod
+    def unchecked(cls,
+                  tag=4294967295,
+                  length=0,
+                  op=0,
+                  unknown=0,
+                  data=()):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x81)
+        obj._tag = NvEntryTag(tag)
+        obj._length = length
+        obj._op = NvOperation(op)
+        obj._unknown = unknown
+        obj._data = data
+        return obj
+
     @property
     def tag(self) -> NvEntryTag:
         return self._tag
@@ -3239,10 +3859,10 @@ class NvStorageOp(Packet):
                 length=self._length,
                 op=self._op,
                 unknown=self._unknown,
-                data=self._data)
+                data=bytes(self._data))
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -3266,7 +3886,7 @@ class NvStorageOp(Packet):
         op = reader.read("B")
         unknown = reader.read("B")
         data = reader.read_varray("B", "H")
-        return cls(
+        return cls.unchecked(
             tag=tag,
             length=length,
             op=op,
@@ -3283,6 +3903,13 @@ class AbortAnimation(Packet):
         super().__init__(PacketType.COMMAND, packet_id=0x8d)
         pass
 
+    @classmethod
+    def unchecked(cls):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x8d)
+        return obj
+
     def __len__(self):
         return 0
 
@@ -3290,7 +3917,7 @@ class AbortAnimation(Packet):
         return "{type}()".format(type=type(self).__name__)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -3306,7 +3933,7 @@ class AbortAnimation(Packet):
     @classmethod
     def from_reader(cls, reader):
         del reader
-        return cls(
+        return cls.unchecked(
             )
 
 
@@ -3321,6 +3948,15 @@ class OutputAudio(Packet):
         super().__init__(PacketType.COMMAND, packet_id=0x8e)
         self.samples = samples
 
+    @classmethod
+    def unchecked(cls,
+                  samples=()):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x8e)
+        obj._samples = samples
+        return obj
+
     @property
     def samples(self):
         return self._samples
@@ -3338,10 +3974,10 @@ class OutputAudio(Packet):
         return "{type}(" \
                "samples={samples})".format(
                 type=type(self).__name__,
-                samples=self._samples)
+                samples=bytes(self._samples))
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -3357,7 +3993,7 @@ class OutputAudio(Packet):
     @classmethod
     def from_reader(cls, reader):
         samples = reader.read_farray("B", 744)
-        return cls(
+        return cls.unchecked(
             samples=samples)
 
 
@@ -3370,6 +4006,13 @@ class OutputSilence(Packet):
         super().__init__(PacketType.COMMAND, packet_id=0x8f)
         pass
 
+    @classmethod
+    def unchecked(cls):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x8f)
+        return obj
+
     def __len__(self):
         return 0
 
@@ -3377,7 +4020,7 @@ class OutputSilence(Packet):
         return "{type}()".format(type=type(self).__name__)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -3393,7 +4036,7 @@ class OutputSilence(Packet):
     @classmethod
     def from_reader(cls, reader):
         del reader
-        return cls(
+        return cls.unchecked(
             )
 
 
@@ -3406,6 +4049,13 @@ class RecordHeading(Packet):
         super().__init__(PacketType.COMMAND, packet_id=0x91)
         pass
 
+    @classmethod
+    def unchecked(cls):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x91)
+        return obj
+
     def __len__(self):
         return 0
 
@@ -3413,7 +4063,7 @@ class RecordHeading(Packet):
         return "{type}()".format(type=type(self).__name__)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -3429,7 +4079,7 @@ class RecordHeading(Packet):
     @classmethod
     def from_reader(cls, reader):
         del reader
-        return cls(
+        return cls.unchecked(
             )
 
 
@@ -3442,6 +4092,13 @@ class TurnToRecordedHeading(Packet):
         super().__init__(PacketType.COMMAND, packet_id=0x92)
         pass
 
+    @classmethod
+    def unchecked(cls):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x92)
+        return obj
+
     def __len__(self):
         return 0
 
@@ -3449,7 +4106,7 @@ class TurnToRecordedHeading(Packet):
         return "{type}()".format(type=type(self).__name__)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -3465,7 +4122,7 @@ class TurnToRecordedHeading(Packet):
     @classmethod
     def from_reader(cls, reader):
         del reader
-        return cls(
+        return cls.unchecked(
             )
 
 
@@ -3477,6 +4134,8 @@ class AnimHead(Packet):
         "_angle_deg",  # int8
     )
 
+    _codec = struct.Struct("<Bbb")
+
     def __init__(self,
                  duration_ms=0,
                  variability_deg=0,
@@ -3486,6 +4145,19 @@ class AnimHead(Packet):
         self.variability_deg = variability_deg
         self.angle_deg = angle_deg
 
+    @classmethod
+    def unchecked(cls,
+                  duration_ms=0,
+                  variability_deg=0,
+                  angle_deg=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x93)
+        obj._duration_ms = duration_ms
+        obj._variability_deg = variability_deg
+        obj._angle_deg = angle_deg
+        return obj
+
     @property
     def duration_ms(self):
         return self._duration_ms
@@ -3527,14 +4199,16 @@ class AnimHead(Packet):
                 angle_deg=self._angle_deg)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._duration_ms, "B")
-        writer.write(self._variability_deg, "b")
-        writer.write(self._angle_deg, "b")
+        writer.write_struct(
+            self._codec,
+            self._duration_ms,
+            self._variability_deg,
+            self._angle_deg)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -3544,10 +4218,11 @@ class AnimHead(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        duration_ms = reader.read("B")
-        variability_deg = reader.read("b")
-        angle_deg = reader.read("b")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        duration_ms = values[0]
+        variability_deg = values[1]
+        angle_deg = values[2]
+        return cls.unchecked(
             duration_ms=duration_ms,
             variability_deg=variability_deg,
             angle_deg=angle_deg)
@@ -3561,6 +4236,8 @@ class AnimLift(Packet):
         "_height_mm",  # uint8
     )
 
+    _codec = struct.Struct("<BBB")
+
     def __init__(self,
                  duration_ms=0,
                  variability_mm=0,
@@ -3570,6 +4247,19 @@ class AnimLift(Packet):
         self.variability_mm = variability_mm
         self.height_mm = height_mm
 
+    @classmethod
+    def unchecked(cls,
+                  duration_ms=0,
+                  variability_mm=0,
+                  height_mm=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x94)
+        obj._duration_ms = duration_ms
+        obj._variability_mm = variability_mm
+        obj._height_mm = height_mm
+        return obj
+
     @property
     def duration_ms(self):
         return self._duration_ms
@@ -3611,14 +4301,16 @@ class AnimLift(Packet):
                 height_mm=self._height_mm)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._duration_ms, "B")
-        writer.write(self._variability_mm, "B")
-        writer.write(self._height_mm, "B")
+        writer.write_struct(
+            self._codec,
+            self._duration_ms,
+            self._variability_mm,
+            self._height_mm)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -3628,10 +4320,11 @@ class AnimLift(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        duration_ms = reader.read("B")
-        variability_mm = reader.read("B")
-        height_mm = reader.read("B")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        duration_ms = values[0]
+        variability_mm = values[1]
+        height_mm = values[2]
+        return cls.unchecked(
             duration_ms=duration_ms,
             variability_mm=variability_mm,
             height_mm=height_mm)
@@ -3648,6 +4341,15 @@ class DisplayImage(Packet):
         super().__init__(PacketType.COMMAND, packet_id=0x97)
         self.image = image
 
+    @classmethod
+    def unchecked(cls,
+                  image=()):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x97)
+        obj._image = image
+        return obj
+
     @property
     def image(self):
         return self._image
@@ -3665,10 +4367,10 @@ class DisplayImage(Packet):
         return "{type}(" \
                "image={image})".format(
                 type=type(self).__name__,
-                image=self._image)
+                image=bytes(self._image))
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -3684,7 +4386,7 @@ class DisplayImage(Packet):
     @classmethod
     def from_reader(cls, reader):
         image = reader.read_varray("B", "H")
-        return cls(
+        return cls.unchecked(
             image=image)
 
 
@@ -3694,12 +4396,23 @@ class AnimBackpackLights(Packet):
         "_colors",  # uint16[5]
     )
 
+    _codec = struct.Struct("<5H")
+
     def __init__(self,
                  colors=()):
         super().__init__(PacketType.COMMAND, packet_id=0x98)
         # Left, front, middle, back, and right.
         self.colors = colors
 
+    @classmethod
+    def unchecked(cls,
+                  colors=()):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x98)
+        obj._colors = colors
+        return obj
+
     @property
     def colors(self):
         return self._colors
@@ -3720,12 +4433,14 @@ class AnimBackpackLights(Packet):
                 colors=self._colors)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write_farray(self._colors, "H", 5)
+        writer.write_struct(
+            self._codec,
+            *self._colors)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -3735,9 +4450,10 @@ class AnimBackpackLights(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        colors = reader.read_farray("H", 5)
-        return cls(
-            colors=colors)
+        values = reader.read_struct(cls._codec)
+        colors = values[0:5]
+        return cls.unchecked(
+            colors=list(colors))
 
 
 class AnimBody(Packet):
@@ -3747,6 +4463,8 @@ class AnimBody(Packet):
         "_unknown",  # int16
     )
 
+    _codec = struct.Struct("<hh")
+
     def __init__(self,
                  speed=0,
                  unknown=0):
@@ -3754,6 +4472,17 @@ class AnimBody(Packet):
         self.speed = speed
         self.unknown = unknown
 
+    @classmethod
+    def unchecked(cls,
+                  speed=0,
+                  unknown=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x99)
+        obj._speed = speed
+        obj._unknown = unknown
+        return obj
+
     @property
     def speed(self):
         return self._speed
@@ -3784,13 +4513,15 @@ class AnimBody(Packet):
                 unknown=self._unknown)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._speed, "h")
-        writer.write(self._unknown, "h")
+        writer.write_struct(
+            self._codec,
+            self._speed,
+            self._unknown)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -3800,9 +4531,10 @@ class AnimBody(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        speed = reader.read("h")
-        unknown = reader.read("h")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        speed = values[0]
+        unknown = values[1]
+        return cls.unchecked(
             speed=speed,
             unknown=unknown)
 
@@ -3816,6 +4548,13 @@ class EndAnimation(Packet):
         super().__init__(PacketType.COMMAND, packet_id=0x9a)
         pass
 
+    @classmethod
+    def unchecked(cls):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x9a)
+        return obj
+
     def __len__(self):
         return 0
 
@@ -3823,7 +4562,7 @@ class EndAnimation(Packet):
         return "{type}()".format(type=type(self).__name__)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -3839,7 +4578,7 @@ class EndAnimation(Packet):
     @classmethod
     def from_reader(cls, reader):
         del reader
-        return cls(
+        return cls.unchecked(
             )
 
 
@@ -3849,11 +4588,22 @@ class StartAnimation(Packet):
         "_anim_id",  # uint8
     )
 
+    _codec = struct.Struct("<B")
+
     def __init__(self,
                  anim_id=0):
         super().__init__(PacketType.COMMAND, packet_id=0x9b)
         self.anim_id = anim_id
 
+    @classmethod
+    def unchecked(cls,
+                  anim_id=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x9b)
+        obj._anim_id = anim_id
+        return obj
+
     @property
     def anim_id(self):
         return self._anim_id
@@ -3873,12 +4623,14 @@ class StartAnimation(Packet):
                 anim_id=self._anim_id)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._anim_id, "B")
+        writer.write_struct(
+            self._codec,
+            self._anim_id)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -3888,8 +4640,9 @@ class StartAnimation(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        anim_id = reader.read("B")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        anim_id = values[0]
+        return cls.unchecked(
             anim_id=anim_id)
 
 
@@ -3902,6 +4655,13 @@ class EnableAnimationState(Packet):
         super().__init__(PacketType.COMMAND, packet_id=0x9f)
         pass
 
+    @classmethod
+    def unchecked(cls):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0x9f)
+        return obj
+
     def __len__(self):
         return 0
 
@@ -3909,7 +4669,7 @@ class EnableAnimationState(Packet):
         return "{type}()".format(type=type(self).__name__)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -3925,7 +4685,7 @@ class EnableAnimationState(Packet):
     @classmethod
     def from_reader(cls, reader):
         del reader
-        return cls(
+        return cls.unchecked(
             )
 
 
@@ -3938,6 +4698,13 @@ class ShutdownRobot(Packet):
         super().__init__(PacketType.COMMAND, packet_id=0xa9)
         pass
 
+    @classmethod
+    def unchecked(cls):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xa9)
+        return obj
+
     def __len__(self):
         return 0
 
@@ -3945,7 +4712,7 @@ class ShutdownRobot(Packet):
         return "{type}()".format(type=type(self).__name__)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -3961,7 +4728,7 @@ class ShutdownRobot(Packet):
     @classmethod
     def from_reader(cls, reader):
         del reader
-        return cls(
+        return cls.unchecked(
             )
 
 
@@ -3971,11 +4738,22 @@ class WifiOff(Packet):
         "_enable",  # bool
     )
 
+    _codec = struct.Struct("<b")
+
     def __init__(self,
                  enable=False):
         super().__init__(PacketType.COMMAND, packet_id=0xae)
         self.enable = enable
 
+    @classmethod
+    def unchecked(cls,
+                  enable=False):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xae)
+        obj._enable = enable
+        return obj
+
     @property
     def enable(self):
         return self._enable
@@ -3995,12 +4773,14 @@ class WifiOff(Packet):
                 enable=self._enable)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(int(self._enable), "b")
+        writer.write_struct(
+            self._codec,
+            self._enable)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -4010,8 +4790,9 @@ class WifiOff(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        enable = bool(reader.read("b"))
-        return cls(
+        values = reader.read_struct(cls._codec)
+        enable = bool(values[0])
+        return cls.unchecked(
             enable=enable)
 
 
@@ -4029,6 +4810,17 @@ class FirmwareUpdate(Packet):
         self.chunk_id = chunk_id
         self.data = data
 
+    @classmethod
+    def unchecked(cls,
+                  chunk_id=0,
+                  data=()):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xaf)
+        obj._chunk_id = chunk_id
+        obj._data = data
+        return obj
+
     @property
     def chunk_id(self):
         return self._chunk_id
@@ -4057,10 +4849,10 @@ class FirmwareUpdate(Packet):
                "data={data})".format(
                 type=type(self).__name__,
                 chunk_id=self._chunk_id,
-                data=self._data)
+                data=bytes(self._data))
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -4078,7 +4870,7 @@ class FirmwareUpdate(Packet):
     def from_reader(cls, reader):
         chunk_id = reader.read("H")
         data = reader.read_farray("B", 1024)
-        return cls(
+        return cls.unchecked(
             chunk_id=chunk_id,
             data=data)
 
@@ -4110,6 +4902,23 @@ class DebugData(Packet):
         self.level = level
         self.args = args
 
+    @classmethod
+    def unchecked(cls,
+                  format_id=0,
+                  unused=0,
+                  name_id=0,
+                  level=0,
+                  args=()):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xb0)
+        obj._format_id = format_id
+        obj._unused = unused
+        obj._name_id = name_id
+        obj._level = level
+        obj._args = args
+        return obj
+
     @property
     def format_id(self):
         return self._format_id
@@ -4174,7 +4983,7 @@ class DebugData(Packet):
                 args=self._args)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -4198,12 +5007,12 @@ class DebugData(Packet):
         name_id = reader.read("H")
         level = reader.read("b")
         args = reader.read_varray("L", "B")
-        return cls(
+        return cls.unchecked(
             format_id=format_id,
             unused=unused,
             name_id=name_id,
             level=level,
-            args=args)
+            args=list(args))
 
 
 class ObjectMoved(Packet):
@@ -4217,6 +5026,8 @@ class ObjectMoved(Packet):
         "_axis_of_accel",  # UpAxis
     )
 
+    _codec = struct.Struct("<LLfffB")
+
     def __init__(self,
                  timestamp=0,
                  object_id=0,
@@ -4232,6 +5043,25 @@ class ObjectMoved(Packet):
         self.active_accel_z = active_accel_z
         self.axis_of_accel = UpAxis(axis_of_accel)
 
+    @classmethod
+    def unchecked(cls,
+                  timestamp=0,
+                  object_id=0,
+                  active_accel_x=0.0,
+                  active_accel_y=0.0,
+                  active_accel_z=0.0,
+                  axis_of_accel=7):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xb4)
+        obj._timestamp = timestamp
+        obj._object_id = object_id
+        obj._active_accel_x = active_accel_x
+        obj._active_accel_y = active_accel_y
+        obj._active_accel_z = active_accel_z
+        obj._axis_of_accel = UpAxis(axis_of_accel)
+        return obj
+
     @property
     def timestamp(self):
         return self._timestamp
@@ -4307,17 +5137,19 @@ class ObjectMoved(Packet):
                 axis_of_accel=self._axis_of_accel)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._timestamp, "L")
-        writer.write(self._object_id, "L")
-        writer.write(self._active_accel_x, "f")
-        writer.write(self._active_accel_y, "f")
-        writer.write(self._active_accel_z, "f")
-        writer.write(self._axis_of_accel.value, "B")
+        writer.write_struct(
+            self._codec,
+            self._timestamp,
+            self._object_id,
+            self._active_accel_x,
+            self._active_accel_y,
+            self._active_accel_z,
+            self._axis_of_accel.value)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -4327,13 +5159,14 @@ class ObjectMoved(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        timestamp = reader.read("L")
-        object_id = reader.read("L")
-        active_accel_x = reader.read("f")
-        active_accel_y = reader.read("f")
-        active_accel_z = reader.read("f")
-        axis_of_accel = reader.read("B")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        timestamp = values[0]
+        object_id = values[1]
+        active_accel_x = values[2]
+        active_accel_y = values[3]
+        active_accel_z = values[4]
+        axis_of_accel = values[5]
+        return cls.unchecked(
             timestamp=timestamp,
             object_id=object_id,
             active_accel_x=active_accel_x,
@@ -4349,6 +5182,8 @@ class ObjectStoppedMoving(Packet):
         "_object_id",  # uint32
     )
 
+    _codec = struct.Struct("<LL")
+
     def __init__(self,
                  timestamp=0,
                  object_id=0):
@@ -4356,6 +5191,17 @@ class ObjectStoppedMoving(Packet):
         self.timestamp = timestamp
         self.object_id = object_id
 
+    @classmethod
+    def unchecked(cls,
+                  timestamp=0,
+                  object_id=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xb5)
+        obj._timestamp = timestamp
+        obj._object_id = object_id
+        return obj
+
     @property
     def timestamp(self):
         return self._timestamp
@@ -4386,13 +5232,15 @@ class ObjectStoppedMoving(Packet):
                 object_id=self._object_id)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._timestamp, "L")
-        writer.write(self._object_id, "L")
+        writer.write_struct(
+            self._codec,
+            self._timestamp,
+            self._object_id)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -4402,9 +5250,10 @@ class ObjectStoppedMoving(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        timestamp = reader.read("L")
-        object_id = reader.read("L")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        timestamp = values[0]
+        object_id = values[1]
+        return cls.unchecked(
             timestamp=timestamp,
             object_id=object_id)
 
@@ -4420,6 +5269,8 @@ class ObjectTapped(Packet):
         "_tap_pos",  # int8
     )
 
+    _codec = struct.Struct("<LLBBbb")
+
     def __init__(self,
                  timestamp=0,
                  object_id=0,
@@ -4435,6 +5286,25 @@ class ObjectTapped(Packet):
         self.tap_neg = tap_neg
         self.tap_pos = tap_pos
 
+    @classmethod
+    def unchecked(cls,
+                  timestamp=0,
+                  object_id=0,
+                  num_taps=0,
+                  tap_time=0,
+                  tap_neg=0,
+                  tap_pos=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xb6)
+        obj._timestamp = timestamp
+        obj._object_id = object_id
+        obj._num_taps = num_taps
+        obj._tap_time = tap_time
+        obj._tap_neg = tap_neg
+        obj._tap_pos = tap_pos
+        return obj
+
     @property
     def timestamp(self):
         return self._timestamp
@@ -4509,17 +5379,19 @@ class ObjectTapped(Packet):
                 tap_pos=self._tap_pos)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._timestamp, "L")
-        writer.write(self._object_id, "L")
-        writer.write(self._num_taps, "B")
-        writer.write(self._tap_time, "B")
-        writer.write(self._tap_neg, "b")
-        writer.write(self._tap_pos, "b")
+        writer.write_struct(
+            self._codec,
+            self._timestamp,
+            self._object_id,
+            self._num_taps,
+            self._tap_time,
+            self._tap_neg,
+            self._tap_pos)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -4529,13 +5401,14 @@ class ObjectTapped(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        timestamp = reader.read("L")
-        object_id = reader.read("L")
-        num_taps = reader.read("B")
-        tap_time = reader.read("B")
-        tap_neg = reader.read("b")
-        tap_pos = reader.read("b")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        timestamp = values[0]
+        object_id = values[1]
+        num_taps = values[2]
+        tap_time = values[3]
+        tap_neg = values[4]
+        tap_pos = values[5]
+        return cls.unchecked(
             timestamp=timestamp,
             object_id=object_id,
             num_taps=num_taps,
@@ -4553,6 +5426,8 @@ class ObjectTapFiltered(Packet):
         "_intensity",  # uint8
     )
 
+    _codec = struct.Struct("<LLBB")
+
     def __init__(self,
                  timestamp=0,
                  object_id=0,
@@ -4564,6 +5439,21 @@ class ObjectTapFiltered(Packet):
         self.time = time
         self.intensity = intensity
 
+    @classmethod
+    def unchecked(cls,
+                  timestamp=0,
+                  object_id=0,
+                  time=0,
+                  intensity=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xb9)
+        obj._timestamp = timestamp
+        obj._object_id = object_id
+        obj._time = time
+        obj._intensity = intensity
+        return obj
+
     @property
     def timestamp(self):
         return self._timestamp
@@ -4616,15 +5506,17 @@ class ObjectTapFiltered(Packet):
                 intensity=self._intensity)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._timestamp, "L")
-        writer.write(self._object_id, "L")
-        writer.write(self._time, "B")
-        writer.write(self._intensity, "B")
+        writer.write_struct(
+            self._codec,
+            self._timestamp,
+            self._object_id,
+            self._time,
+            self._intensity)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -4634,11 +5526,12 @@ class ObjectTapFiltered(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        timestamp = reader.read("L")
-        object_id = reader.read("L")
-        time = reader.read("B")
-        intensity = reader.read("B")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        timestamp = values[0]
+        object_id = values[1]
+        time = values[2]
+        intensity = values[3]
+        return cls.unchecked(
             timestamp=timestamp,
             object_id=object_id,
             time=time,
@@ -4651,11 +5544,22 @@ class AcknowledgeAction(Packet):
         "_action_id",  # uint8
     )
 
+    _codec = struct.Struct("<B")
+
     def __init__(self,
                  action_id=0):
         super().__init__(PacketType.COMMAND, packet_id=0xc4)
         self.action_id = action_id
 
+    @classmethod
+    def unchecked(cls,
+                  action_id=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xc4)
+        obj._action_id = action_id
+        return obj
+
     @property
     def action_id(self):
         return self._action_id
@@ -4675,12 +5579,14 @@ class AcknowledgeAction(Packet):
                 action_id=self._action_id)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._action_id, "B")
+        writer.write_struct(
+            self._codec,
+            self._action_id)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -4690,8 +5596,9 @@ class AcknowledgeAction(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        action_id = reader.read("B")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        action_id = values[0]
+        return cls.unchecked(
             action_id=action_id)
 
 
@@ -4704,6 +5611,13 @@ class RobotDelocalized(Packet):
         super().__init__(PacketType.COMMAND, packet_id=0xc2)
         pass
 
+    @classmethod
+    def unchecked(cls):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xc2)
+        return obj
+
     def __len__(self):
         return 0
 
@@ -4711,7 +5625,7 @@ class RobotDelocalized(Packet):
         return "{type}()".format(type=type(self).__name__)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -4727,7 +5641,7 @@ class RobotDelocalized(Packet):
     @classmethod
     def from_reader(cls, reader):
         del reader
-        return cls(
+        return cls.unchecked(
             )
 
 
@@ -4740,6 +5654,13 @@ class RobotPoked(Packet):
         super().__init__(PacketType.COMMAND, packet_id=0xc3)
         pass
 
+    @classmethod
+    def unchecked(cls):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xc3)
+        return obj
+
     def __len__(self):
         return 0
 
@@ -4747,7 +5668,7 @@ class RobotPoked(Packet):
         return "{type}()".format(type=type(self).__name__)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -4763,7 +5684,7 @@ class RobotPoked(Packet):
     @classmethod
     def from_reader(cls, reader):
         del reader
-        return cls(
+        return cls.unchecked(
             )
 
 
@@ -4774,6 +5695,8 @@ class PathFollowingEvent(Packet):
         "_event_type",  # PathEventType
     )
 
+    _codec = struct.Struct("<HB")
+
     def __init__(self,
                  event_id=0,
                  event_type=0):
@@ -4781,6 +5704,17 @@ class PathFollowingEvent(Packet):
         self.event_id = event_id
         self.event_type = PathEventType(event_type)
 
+    @classmethod
+    def unchecked(cls,
+                  event_id=0,
+                  event_type=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xc6)
+        obj._event_id = event_id
+        obj._event_type = PathEventType(event_type)
+        return obj
+
     @property
     def event_id(self):
         return self._event_id
@@ -4812,13 +5746,15 @@ class PathFollowingEvent(Packet):
                 event_type=self._event_type)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._event_id, "H")
-        writer.write(self._event_type.value, "B")
+        writer.write_struct(
+            self._codec,
+            self._event_id,
+            self._event_type.value)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -4828,9 +5764,10 @@ class PathFollowingEvent(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        event_id = reader.read("H")
-        event_type = reader.read("B")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        event_id = values[0]
+        event_type = values[1]
+        return cls.unchecked(
             event_id=event_id,
             event_type=event_type)
 
@@ -4843,6 +5780,8 @@ class HardwareInfo(Packet):
         "_unknown2",  # uint8
     )
 
+    _codec = struct.Struct("<LBB")
+
     def __init__(self,
                  serial_number_head=0,
                  unknown1=0,
@@ -4852,6 +5791,19 @@ class HardwareInfo(Packet):
         self.unknown1 = unknown1
         self.unknown2 = unknown2
 
+    @classmethod
+    def unchecked(cls,
+                  serial_number_head=0,
+                  unknown1=0,
+                  unknown2=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xc9)
+        obj._serial_number_head = serial_number_head
+        obj._unknown1 = unknown1
+        obj._unknown2 = unknown2
+        return obj
+
     @property
     def serial_number_head(self):
         return self._serial_number_head
@@ -4893,14 +5845,16 @@ class HardwareInfo(Packet):
                 unknown2=self._unknown2)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._serial_number_head, "L")
-        writer.write(self._unknown1, "B")
-        writer.write(self._unknown2, "B")
+        writer.write_struct(
+            self._codec,
+            self._serial_number_head,
+            self._unknown1,
+            self._unknown2)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -4910,10 +5864,11 @@ class HardwareInfo(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        serial_number_head = reader.read("L")
-        unknown1 = reader.read("B")
-        unknown2 = reader.read("B")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        serial_number_head = values[0]
+        unknown1 = values[1]
+        unknown2 = values[2]
+        return cls.unchecked(
             serial_number_head=serial_number_head,
             unknown1=unknown1,
             unknown2=unknown2)
@@ -4925,11 +5880,22 @@ class AnimationStarted(Packet):
         "_anim_id",  # uint8
     )
 
+    _codec = struct.Struct("<B")
+
     def __init__(self,
                  anim_id=0):
         super().__init__(PacketType.COMMAND, packet_id=0xca)
         self.anim_id = anim_id
 
+    @classmethod
+    def unchecked(cls,
+                  anim_id=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xca)
+        obj._anim_id = anim_id
+        return obj
+
     @property
     def anim_id(self):
         return self._anim_id
@@ -4949,12 +5915,14 @@ class AnimationStarted(Packet):
                 anim_id=self._anim_id)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._anim_id, "B")
+        writer.write_struct(
+            self._codec,
+            self._anim_id)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -4964,8 +5932,9 @@ class AnimationStarted(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        anim_id = reader.read("B")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        anim_id = values[0]
+        return cls.unchecked(
             anim_id=anim_id)
 
 
@@ -4975,11 +5944,22 @@ class AnimationEnded(Packet):
         "_anim_id",  # uint8
     )
 
+    _codec = struct.Struct("<B")
+
     def __init__(self,
                  anim_id=0):
         super().__init__(PacketType.COMMAND, packet_id=0xcb)
         self.anim_id = anim_id
 
+    @classmethod
+    def unchecked(cls,
+                  anim_id=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xcb)
+        obj._anim_id = anim_id
+        return obj
+
     @property
     def anim_id(self):
         return self._anim_id
@@ -4999,12 +5979,14 @@ class AnimationEnded(Packet):
                 anim_id=self._anim_id)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._anim_id, "B")
+        writer.write_struct(
+            self._codec,
+            self._anim_id)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -5014,8 +5996,9 @@ class AnimationEnded(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        anim_id = reader.read("B")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        anim_id = values[0]
+        return cls.unchecked(
             anim_id=anim_id)
 
 
@@ -5042,6 +6025,23 @@ class NvStorageOpResult(Packet):
         self.result = NvResult(result)
         self.data = data
 
+    @classmethod
+    def unchecked(cls,
+                  tag=4294967295,
+                  length=0,
+                  op=0,
+                  result=0,
+                  data=()):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xcd)
+        obj._tag = NvEntryTag(tag)
+        obj._length = length
+        obj._op = NvOperation(op)
+        obj._result = NvResult(result)
+        obj._data = data
+        return obj
+
     @property
     def tag(self) -> NvEntryTag:
         return self._tag
@@ -5106,10 +6106,10 @@ class NvStorageOpResult(Packet):
                 length=self._length,
                 op=self._op,
                 result=self._result,
-                data=self._data)
+                data=bytes(self._data))
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -5133,7 +6133,7 @@ class NvStorageOpResult(Packet):
         op = reader.read("B")
         result = reader.read("b")
         data = reader.read_varray("B", "H")
-        return cls(
+        return cls.unchecked(
             tag=tag,
             length=length,
             op=op,
@@ -5149,6 +6149,8 @@ class ObjectPowerLevel(Packet):
         "_battery_level",  # uint8
     )
 
+    _codec = struct.Struct("<LLB")
+
     def __init__(self,
                  object_id=0,
                  missed_packets=0,
@@ -5158,6 +6160,19 @@ class ObjectPowerLevel(Packet):
         self.missed_packets = missed_packets
         self.battery_level = battery_level
 
+    @classmethod
+    def unchecked(cls,
+                  object_id=0,
+                  missed_packets=0,
+                  battery_level=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xce)
+        obj._object_id = object_id
+        obj._missed_packets = missed_packets
+        obj._battery_level = battery_level
+        return obj
+
     @property
     def object_id(self):
         return self._object_id
@@ -5199,14 +6214,16 @@ class ObjectPowerLevel(Packet):
                 battery_level=self._battery_level)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._object_id, "L")
-        writer.write(self._missed_packets, "L")
-        writer.write(self._battery_level, "B")
+        writer.write_struct(
+            self._codec,
+            self._object_id,
+            self._missed_packets,
+            self._battery_level)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -5216,10 +6233,11 @@ class ObjectPowerLevel(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        object_id = reader.read("L")
-        missed_packets = reader.read("L")
-        battery_level = reader.read("B")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        object_id = values[0]
+        missed_packets = values[1]
+        battery_level = values[2]
+        return cls.unchecked(
             object_id=object_id,
             missed_packets=missed_packets,
             battery_level=battery_level)
@@ -5234,6 +6252,8 @@ class ObjectConnectionState(Packet):
         "_connected",  # bool
     )
 
+    _codec = struct.Struct("<LLlb")
+
     def __init__(self,
                  object_id=0,
                  factory_id=0,
@@ -5245,6 +6265,21 @@ class ObjectConnectionState(Packet):
         self.object_type = ObjectType(object_type)
         self.connected = connected
 
+    @classmethod
+    def unchecked(cls,
+                  object_id=0,
+                  factory_id=0,
+                  object_type=-1,
+                  connected=False):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xd0)
+        obj._object_id = object_id
+        obj._factory_id = factory_id
+        obj._object_type = ObjectType(object_type)
+        obj._connected = connected
+        return obj
+
     @property
     def object_id(self):
         return self._object_id
@@ -5298,15 +6333,17 @@ class ObjectConnectionState(Packet):
                 connected=self._connected)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._object_id, "L")
-        writer.write(self._factory_id, "L")
-        writer.write(self._object_type.value, "l")
-        writer.write(int(self._connected), "b")
+        writer.write_struct(
+            self._codec,
+            self._object_id,
+            self._factory_id,
+            self._object_type.value,
+            self._connected)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -5316,11 +6353,12 @@ class ObjectConnectionState(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        object_id = reader.read("L")
-        factory_id = reader.read("L")
-        object_type = reader.read("l")
-        connected = bool(reader.read("b"))
-        return cls(
+        values = reader.read_struct(cls._codec)
+        object_id = values[0]
+        factory_id = values[1]
+        object_type = values[2]
+        connected = bool(values[3])
+        return cls.unchecked(
             object_id=object_id,
             factory_id=factory_id,
             object_type=object_type,
@@ -5335,6 +6373,8 @@ class MotorCalibration(Packet):
         "_auto_started",  # bool
     )
 
+    _codec = struct.Struct("<Bbb")
+
     def __init__(self,
                  motor_id=0,
                  calib_started=False,
@@ -5344,6 +6384,19 @@ class MotorCalibration(Packet):
         self.calib_started = calib_started
         self.auto_started = auto_started
 
+    @classmethod
+    def unchecked(cls,
+                  motor_id=0,
+                  calib_started=False,
+                  auto_started=False):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xd1)
+        obj._motor_id = MotorID(motor_id)
+        obj._calib_started = calib_started
+        obj._auto_started = auto_started
+        return obj
+
     @property
     def motor_id(self) -> MotorID:
         return self._motor_id
@@ -5386,14 +6439,16 @@ class MotorCalibration(Packet):
                 auto_started=self._auto_started)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._motor_id.value, "B")
-        writer.write(int(self._calib_started), "b")
-        writer.write(int(self._auto_started), "b")
+        writer.write_struct(
+            self._codec,
+            self._motor_id.value,
+            self._calib_started,
+            self._auto_started)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -5403,10 +6458,11 @@ class MotorCalibration(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        motor_id = reader.read("B")
-        calib_started = bool(reader.read("b"))
-        auto_started = bool(reader.read("b"))
-        return cls(
+        values = reader.read_struct(cls._codec)
+        motor_id = values[0]
+        calib_started = bool(values[1])
+        auto_started = bool(values[2])
+        return cls.unchecked(
             motor_id=motor_id,
             calib_started=calib_started,
             auto_started=auto_started)
@@ -5420,6 +6476,8 @@ class ObjectUpAxisChanged(Packet):
         "_axis",  # UpAxis
     )
 
+    _codec = struct.Struct("<LLB")
+
     def __init__(self,
                  timestamp=0,
                  object_id=0,
@@ -5429,6 +6487,19 @@ class ObjectUpAxisChanged(Packet):
         self.object_id = object_id
         self.axis = UpAxis(axis)
 
+    @classmethod
+    def unchecked(cls,
+                  timestamp=0,
+                  object_id=0,
+                  axis=7):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xd7)
+        obj._timestamp = timestamp
+        obj._object_id = object_id
+        obj._axis = UpAxis(axis)
+        return obj
+
     @property
     def timestamp(self):
         return self._timestamp
@@ -5471,14 +6542,16 @@ class ObjectUpAxisChanged(Packet):
                 axis=self._axis)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._timestamp, "L")
-        writer.write(self._object_id, "L")
-        writer.write(self._axis.value, "B")
+        writer.write_struct(
+            self._codec,
+            self._timestamp,
+            self._object_id,
+            self._axis.value)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -5488,10 +6561,11 @@ class ObjectUpAxisChanged(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        timestamp = reader.read("L")
-        object_id = reader.read("L")
-        axis = reader.read("B")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        timestamp = values[0]
+        object_id = values[1]
+        axis = values[2]
+        return cls.unchecked(
             timestamp=timestamp,
             object_id=object_id,
             axis=axis)
@@ -5503,11 +6577,22 @@ class ButtonPressed(Packet):
         "_pressed",  # bool
     )
 
+    _codec = struct.Struct("<b")
+
     def __init__(self,
                  pressed=False):
         super().__init__(PacketType.COMMAND, packet_id=0xdb)
         self.pressed = pressed
 
+    @classmethod
+    def unchecked(cls,
+                  pressed=False):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xdb)
+        obj._pressed = pressed
+        return obj
+
     @property
     def pressed(self):
         return self._pressed
@@ -5527,12 +6612,14 @@ class ButtonPressed(Packet):
                 pressed=self._pressed)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(int(self._pressed), "b")
+        writer.write_struct(
+            self._codec,
+            self._pressed)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -5542,8 +6629,9 @@ class ButtonPressed(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        pressed = bool(reader.read("b"))
-        return cls(
+        values = reader.read_struct(cls._codec)
+        pressed = bool(values[0])
+        return cls.unchecked(
             pressed=pressed)
 
 
@@ -5553,11 +6641,22 @@ class FallingStarted(Packet):
         "_unknown",  # uint32
     )
 
+    _codec = struct.Struct("<L")
+
     def __init__(self,
                  unknown=0):
         super().__init__(PacketType.COMMAND, packet_id=0xdd)
         self.unknown = unknown
 
+    @classmethod
+    def unchecked(cls,
+                  unknown=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xdd)
+        obj._unknown = unknown
+        return obj
+
     @property
     def unknown(self):
         return self._unknown
@@ -5577,12 +6676,14 @@ class FallingStarted(Packet):
                 unknown=self._unknown)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._unknown, "L")
+        writer.write_struct(
+            self._codec,
+            self._unknown)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -5592,8 +6693,9 @@ class FallingStarted(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        unknown = reader.read("L")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        unknown = values[0]
+        return cls.unchecked(
             unknown=unknown)
 
 
@@ -5605,6 +6707,8 @@ class FallingStopped(Packet):
         "_impact_intensity",  # float
     )
 
+    _codec = struct.Struct("<LLf")
+
     def __init__(self,
                  unknown=0,
                  duration_ms=0,
@@ -5614,6 +6718,19 @@ class FallingStopped(Packet):
         self.duration_ms = duration_ms
         self.impact_intensity = impact_intensity
 
+    @classmethod
+    def unchecked(cls,
+                  unknown=0,
+                  duration_ms=0,
+                  impact_intensity=0.0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xde)
+        obj._unknown = unknown
+        obj._duration_ms = duration_ms
+        obj._impact_intensity = impact_intensity
+        return obj
+
     @property
     def unknown(self):
         return self._unknown
@@ -5655,14 +6772,16 @@ class FallingStopped(Packet):
                 impact_intensity=self._impact_intensity)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._unknown, "L")
-        writer.write(self._duration_ms, "L")
-        writer.write(self._impact_intensity, "f")
+        writer.write_struct(
+            self._codec,
+            self._unknown,
+            self._duration_ms,
+            self._impact_intensity)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -5672,10 +6791,11 @@ class FallingStopped(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        unknown = reader.read("L")
-        duration_ms = reader.read("L")
-        impact_intensity = reader.read("f")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        unknown = values[0]
+        duration_ms = values[1]
+        impact_intensity = values[2]
+        return cls.unchecked(
             unknown=unknown,
             duration_ms=duration_ms,
             impact_intensity=impact_intensity)
@@ -5689,6 +6809,8 @@ class BodyInfo(Packet):
         "_body_color",  # BodyColor
     )
 
+    _codec = struct.Struct("<LLl")
+
     def __init__(self,
                  serial_number=0,
                  body_hw_version=0,
@@ -5699,6 +6821,19 @@ class BodyInfo(Packet):
         self.body_hw_version = body_hw_version
         self.body_color = BodyColor(body_color)
 
+    @classmethod
+    def unchecked(cls,
+                  serial_number=0,
+                  body_hw_version=0,
+                  body_color=-1):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xed)
+        obj._serial_number = serial_number
+        obj._body_hw_version = body_hw_version
+        obj._body_color = BodyColor(body_color)
+        return obj
+
     @property
     def serial_number(self):
         return self._serial_number
@@ -5741,14 +6876,16 @@ class BodyInfo(Packet):
                 body_color=self._body_color)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._serial_number, "L")
-        writer.write(self._body_hw_version, "L")
-        writer.write(self._body_color.value, "l")
+        writer.write_struct(
+            self._codec,
+            self._serial_number,
+            self._body_hw_version,
+            self._body_color.value)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -5758,10 +6895,11 @@ class BodyInfo(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        serial_number = reader.read("L")
-        body_hw_version = reader.read("L")
-        body_color = reader.read("l")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        serial_number = values[0]
+        body_hw_version = values[1]
+        body_color = values[2]
+        return cls.unchecked(
             serial_number=serial_number,
             body_hw_version=body_hw_version,
             body_color=body_color)
@@ -5782,6 +6920,17 @@ class FirmwareSignature(Packet):
         self.unknown = unknown
         self.signature = signature
 
+    @classmethod
+    def unchecked(cls,
+                  unknown=0,
+                  signature=''):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xee)
+        obj._unknown = unknown
+        obj._signature = signature
+        return obj
+
     @property
     def unknown(self):
         return self._unknown
@@ -5812,7 +6961,7 @@ class FirmwareSignature(Packet):
                 signature=self._signature)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -5830,7 +6979,7 @@ class FirmwareSignature(Packet):
     def from_reader(cls, reader):
         unknown = reader.read("H")
         signature = reader.read_string("H")
-        return cls(
+        return cls.unchecked(
             unknown=unknown,
             signature=signature)
 
@@ -5843,6 +6992,8 @@ class FirmwareUpdateResult(Packet):
         "_status",  # uint8
     )
 
+    _codec = struct.Struct("<LHB")
+
     def __init__(self,
                  byte_count=0,
                  chunk_id=0,
@@ -5853,6 +7004,19 @@ class FirmwareUpdateResult(Packet):
         # 0=OK; 0x0a=complete?
         self.status = status
 
+    @classmethod
+    def unchecked(cls,
+                  byte_count=0,
+                  chunk_id=0,
+                  status=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.COMMAND, packet_id=0xef)
+        obj._byte_count = byte_count
+        obj._chunk_id = chunk_id
+        obj._status = status
+        return obj
+
     @property
     def byte_count(self):
         return self._byte_count
@@ -5894,14 +7058,16 @@ class FirmwareUpdateResult(Packet):
                 status=self._status)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._byte_count, "L")
-        writer.write(self._chunk_id, "H")
-        writer.write(self._status, "B")
+        writer.write_struct(
+            self._codec,
+            self._byte_count,
+            self._chunk_id,
+            self._status)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -5911,10 +7077,11 @@ class FirmwareUpdateResult(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        byte_count = reader.read("L")
-        chunk_id = reader.read("H")
-        status = reader.read("B")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        byte_count = values[0]
+        chunk_id = values[1]
+        status = values[2]
+        return cls.unchecked(
             byte_count=byte_count,
             chunk_id=chunk_id,
             status=status)
@@ -5948,6 +7115,8 @@ class RobotState(Packet):
         "_curr_path_segment",  # uint8
     )
 
+    _codec = struct.Struct("<LLLffffffffffffffffL4HHB")
+
     def __init__(self,
                  timestamp=0,
                  pose_frame_id=0,
@@ -5997,6 +7166,59 @@ class RobotState(Packet):
         self.backpack_touch_sensor_raw = backpack_touch_sensor_raw
         self.curr_path_segment = curr_path_segment
 
+    @classmethod
+    def unchecked(cls,
+                  timestamp=0,
+                  pose_frame_id=0,
+                  pose_origin_id=0,
+                  pose_x=0.0,
+                  pose_y=0.0,
+                  pose_z=0.0,
+                  pose_angle_rad=0.0,
+                  pose_pitch_rad=0.0,
+                  lwheel_speed_mmps=0.0,
+                  rwheel_speed_mmps=0.0,
+                  head_angle_rad=0.0,
+                  lift_height_mm=0.0,
+                  accel_x=0.0,
+                  accel_y=0.0,
+                  accel_z=0.0,
+                  gyro_x=0.0,
+                  gyro_y=0.0,
+                  gyro_z=0.0,
+                  battery_voltage=0.0,
+                  status=0,
+                  cliff_data_raw=(),
+                  backpack_touch_sensor_raw=0,
+                  curr_path_segment=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.EVENT, packet_id=0xf0)
+        obj._timestamp = timestamp
+        obj._pose_frame_id = pose_frame_id
+        obj._pose_origin_id = pose_origin_id
+        obj._pose_x = pose_x
+        obj._pose_y = pose_y
+        obj._pose_z = pose_z
+        obj._pose_angle_rad = pose_angle_rad
+        obj._pose_pitch_rad = pose_pitch_rad
+        obj._lwheel_speed_mmps = lwheel_speed_mmps
+        obj._rwheel_speed_mmps = rwheel_speed_mmps
+        obj._head_angle_rad = head_angle_rad
+        obj._lift_height_mm = lift_height_mm
+        obj._accel_x = accel_x
+        obj._accel_y = accel_y
+        obj._accel_z = accel_z
+        obj._gyro_x = gyro_x
+        obj._gyro_y = gyro_y
+        obj._gyro_z = gyro_z
+        obj._battery_voltage = battery_voltage
+        obj._status = status
+        obj._cliff_data_raw = cliff_data_raw
+        obj._backpack_touch_sensor_raw = backpack_touch_sensor_raw
+        obj._curr_path_segment = curr_path_segment
+        return obj
+
     @property
     def timestamp(self):
         return self._timestamp
@@ -6259,34 +7481,36 @@ class RobotState(Packet):
                 curr_path_segment=self._curr_path_segment)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._timestamp, "L")
-        writer.write(self._pose_frame_id, "L")
-        writer.write(self._pose_origin_id, "L")
-        writer.write(self._pose_x, "f")
-        writer.write(self._pose_y, "f")
-        writer.write(self._pose_z, "f")
-        writer.write(self._pose_angle_rad, "f")
-        writer.write(self._pose_pitch_rad, "f")
-        writer.write(self._lwheel_speed_mmps, "f")
-        writer.write(self._rwheel_speed_mmps, "f")
-        writer.write(self._head_angle_rad, "f")
-        writer.write(self._lift_height_mm, "f")
-        writer.write(self._accel_x, "f")
-        writer.write(self._accel_y, "f")
-        writer.write(self._accel_z, "f")
-        writer.write(self._gyro_x, "f")
-        writer.write(self._gyro_y, "f")
-        writer.write(self._gyro_z, "f")
-        writer.write(self._battery_voltage, "f")
-        writer.write(self._status, "L")
-        writer.write_farray(self._cliff_data_raw, "H", 4)
-        writer.write(self._backpack_touch_sensor_raw, "H")
-        writer.write(self._curr_path_segment, "B")
+        writer.write_struct(
+            self._codec,
+            self._timestamp,
+            self._pose_frame_id,
+            self._pose_origin_id,
+            self._pose_x,
+            self._pose_y,
+            self._pose_z,
+            self._pose_angle_rad,
+            self._pose_pitch_rad,
+            self._lwheel_speed_mmps,
+            self._rwheel_speed_mmps,
+            self._head_angle_rad,
+            self._lift_height_mm,
+            self._accel_x,
+            self._accel_y,
+            self._accel_z,
+            self._gyro_x,
+            self._gyro_y,
+            self._gyro_z,
+            self._battery_voltage,
+            self._status,
+            *self._cliff_data_raw,
+            self._backpack_touch_sensor_raw,
+            self._curr_path_segment)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -6296,30 +7520,31 @@ class RobotState(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        timestamp = reader.read("L")
-        pose_frame_id = reader.read("L")
-        pose_origin_id = reader.read("L")
-        pose_x = reader.read("f")
-        pose_y = reader.read("f")
-        pose_z = reader.read("f")
-        pose_angle_rad = reader.read("f")
-        pose_pitch_rad = reader.read("f")
-        lwheel_speed_mmps = reader.read("f")
-        rwheel_speed_mmps = reader.read("f")
-        head_angle_rad = reader.read("f")
-        lift_height_mm = reader.read("f")
-        accel_x = reader.read("f")
-        accel_y = reader.read("f")
-        accel_z = reader.read("f")
-        gyro_x = reader.read("f")
-        gyro_y = reader.read("f")
-        gyro_z = reader.read("f")
-        battery_voltage = reader.read("f")
-        status = reader.read("L")
-        cliff_data_raw = reader.read_farray("H", 4)
-        backpack_touch_sensor_raw = reader.read("H")
-        curr_path_segment = reader.read("B")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        timestamp = values[0]
+        pose_frame_id = values[1]
+        pose_origin_id = values[2]
+        pose_x = values[3]
+        pose_y = values[4]
+        pose_z = values[5]
+        pose_angle_rad = values[6]
+        pose_pitch_rad = values[7]
+        lwheel_speed_mmps = values[8]
+        rwheel_speed_mmps = values[9]
+        head_angle_rad = values[10]
+        lift_height_mm = values[11]
+        accel_x = values[12]
+        accel_y = values[13]
+        accel_z = values[14]
+        gyro_x = values[15]
+        gyro_y = values[16]
+        gyro_z = values[17]
+        battery_voltage = values[18]
+        status = values[19]
+        cliff_data_raw = values[20:24]
+        backpack_touch_sensor_raw = values[24]
+        curr_path_segment = values[25]
+        return cls.unchecked(
             timestamp=timestamp,
             pose_frame_id=pose_frame_id,
             pose_origin_id=pose_origin_id,
@@ -6340,7 +7565,7 @@ class RobotState(Packet):
             gyro_z=gyro_z,
             battery_voltage=battery_voltage,
             status=status,
-            cliff_data_raw=cliff_data_raw,
+            cliff_data_raw=list(cliff_data_raw),
             backpack_touch_sensor_raw=backpack_touch_sensor_raw,
             curr_path_segment=curr_path_segment)
 
@@ -6356,6 +7581,8 @@ class AnimationState(Packet):
         "_client_drop_count",  # uint8
     )
 
+    _codec = struct.Struct("<LllBBB")
+
     def __init__(self,
                  timestamp=0,
                  num_anim_bytes_played=0,
@@ -6372,6 +7599,25 @@ class AnimationState(Packet):
         # Not present in v2214 and older.
         self.client_drop_count = client_drop_count
 
+    @classmethod
+    def unchecked(cls,
+                  timestamp=0,
+                  num_anim_bytes_played=0,
+                  num_audio_frames_played=0,
+                  enabled_anim_tracks=0,
+                  tag=0,
+                  client_drop_count=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.EVENT, packet_id=0xf1)
+        obj._timestamp = timestamp
+        obj._num_anim_bytes_played = num_anim_bytes_played
+        obj._num_audio_frames_played = num_audio_frames_played
+        obj._enabled_anim_tracks = enabled_anim_tracks
+        obj._tag = tag
+        obj._client_drop_count = client_drop_count
+        return obj
+
     @property
     def timestamp(self):
         return self._timestamp
@@ -6446,17 +7692,19 @@ class AnimationState(Packet):
                 client_drop_count=self._client_drop_count)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._timestamp, "L")
-        writer.write(self._num_anim_bytes_played, "l")
-        writer.write(self._num_audio_frames_played, "l")
-        writer.write(self._enabled_anim_tracks, "B")
-        writer.write(self._tag, "B")
-        writer.write(self._client_drop_count, "B")
+        writer.write_struct(
+            self._codec,
+            self._timestamp,
+            self._num_anim_bytes_played,
+            self._num_audio_frames_played,
+            self._enabled_anim_tracks,
+            self._tag,
+            self._client_drop_count)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -6466,13 +7714,14 @@ class AnimationState(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        timestamp = reader.read("L")
-        num_anim_bytes_played = reader.read("l")
-        num_audio_frames_played = reader.read("l")
-        enabled_anim_tracks = reader.read("B")
-        tag = reader.read("B")
-        client_drop_count = reader.read("B")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        timestamp = values[0]
+        num_anim_bytes_played = values[1]
+        num_audio_frames_played = values[2]
+        enabled_anim_tracks = values[3]
+        tag = values[4]
+        client_drop_count = values[5]
+        return cls.unchecked(
             timestamp=timestamp,
             num_anim_bytes_played=num_anim_bytes_played,
             num_audio_frames_played=num_audio_frames_played,
@@ -6516,6 +7765,31 @@ class ImageChunk(Packet):
         self.status = status
         self.data = data
 
+    @classmethod
+    def unchecked(cls,
+                  frame_timestamp=0,
+                  image_id=0,
+                  chunk_debug=0,
+                  image_encoding=0,
+                  image_resolution=0,
+                  image_chunk_count=0,
+                  chunk_id=0,
+                  status=0,
+                  data=()):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.EVENT, packet_id=0xf2)
+        obj._frame_timestamp = frame_timestamp
+        obj._image_id = image_id
+        obj._chunk_debug = chunk_debug
+        obj._image_encoding = ImageEncoding(image_encoding)
+        obj._image_resolution = ImageResolution(image_resolution)
+        obj._image_chunk_count = image_chunk_count
+        obj._chunk_id = chunk_id
+        obj._status = status
+        obj._data = data
+        return obj
+
     @property
     def frame_timestamp(self):
         return self._frame_timestamp
@@ -6623,10 +7897,10 @@ class ImageChunk(Packet):
                 image_chunk_count=self._image_chunk_count,
                 chunk_id=self._chunk_id,
                 status=self._status,
-                data=self._data)
+                data=bytes(self._data))
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
@@ -6658,7 +7932,7 @@ class ImageChunk(Packet):
         chunk_id = reader.read("B")
         status = reader.read("H")
         data = reader.read_varray("B", "H")
-        return cls(
+        return cls.unchecked(
             frame_timestamp=frame_timestamp,
             image_id=image_id,
             chunk_debug=chunk_debug,
@@ -6678,6 +7952,8 @@ class ObjectAvailable(Packet):
         "_rssi",  # int8
     )
 
+    _codec = struct.Struct("<Llb")
+
     def __init__(self,
                  factory_id=0,
                  object_type=-1,
@@ -6687,6 +7963,19 @@ class ObjectAvailable(Packet):
         self.object_type = ObjectType(object_type)
         self.rssi = rssi
 
+    @classmethod
+    def unchecked(cls,
+                  factory_id=0,
+                  object_type=-1,
+                  rssi=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.EVENT, packet_id=0xf3)
+        obj._factory_id = factory_id
+        obj._object_type = ObjectType(object_type)
+        obj._rssi = rssi
+        return obj
+
     @property
     def factory_id(self):
         return self._factory_id
@@ -6729,14 +8018,16 @@ class ObjectAvailable(Packet):
                 rssi=self._rssi)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._factory_id, "L")
-        writer.write(self._object_type.value, "l")
-        writer.write(self._rssi, "b")
+        writer.write_struct(
+            self._codec,
+            self._factory_id,
+            self._object_type.value,
+            self._rssi)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -6746,10 +8037,11 @@ class ObjectAvailable(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        factory_id = reader.read("L")
-        object_type = reader.read("l")
-        rssi = reader.read("b")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        factory_id = values[0]
+        object_type = values[1]
+        rssi = values[2]
+        return cls.unchecked(
             factory_id=factory_id,
             object_type=object_type,
             rssi=rssi)
@@ -6765,6 +8057,8 @@ class ImageImuData(Packet):
         "_line_2_number",  # uint8
     )
 
+    _codec = struct.Struct("<LfffB")
+
     def __init__(self,
                  image_id=0,
                  rate_x=0.0,
@@ -6778,6 +8072,23 @@ class ImageImuData(Packet):
         self.rate_z = rate_z
         self.line_2_number = line_2_number
 
+    @classmethod
+    def unchecked(cls,
+                  image_id=0,
+                  rate_x=0.0,
+                  rate_y=0.0,
+                  rate_z=0.0,
+                  line_2_number=0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.EVENT, packet_id=0xf4)
+        obj._image_id = image_id
+        obj._rate_x = rate_x
+        obj._rate_y = rate_y
+        obj._rate_z = rate_z
+        obj._line_2_number = line_2_number
+        return obj
+
     @property
     def image_id(self):
         return self._image_id
@@ -6841,16 +8152,18 @@ class ImageImuData(Packet):
                 line_2_number=self._line_2_number)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._image_id, "L")
-        writer.write(self._rate_x, "f")
-        writer.write(self._rate_y, "f")
-        writer.write(self._rate_z, "f")
-        writer.write(self._line_2_number, "B")
+        writer.write_struct(
+            self._codec,
+            self._image_id,
+            self._rate_x,
+            self._rate_y,
+            self._rate_z,
+            self._line_2_number)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -6860,12 +8173,13 @@ class ImageImuData(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        image_id = reader.read("L")
-        rate_x = reader.read("f")
-        rate_y = reader.read("f")
-        rate_z = reader.read("f")
-        line_2_number = reader.read("B")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        image_id = values[0]
+        rate_x = values[1]
+        rate_y = values[2]
+        rate_z = values[3]
+        line_2_number = values[4]
+        return cls.unchecked(
             image_id=image_id,
             rate_x=rate_x,
             rate_y=rate_y,
@@ -6883,6 +8197,8 @@ class ObjectAccel(Packet):
         "_accel_z",  # float
     )
 
+    _codec = struct.Struct("<LLfff")
+
     def __init__(self,
                  timestamp=0,
                  object_id=0,
@@ -6896,6 +8212,23 @@ class ObjectAccel(Packet):
         self.accel_y = accel_y
         self.accel_z = accel_z
 
+    @classmethod
+    def unchecked(cls,
+                  timestamp=0,
+                  object_id=0,
+                  accel_x=0.0,
+                  accel_y=0.0,
+                  accel_z=0.0):
+        """ Constructs without argument validation. Arguments must be of valid types and ranges. """
+        obj = cls.__new__(cls)
+        Packet.__init__(obj, PacketType.EVENT, packet_id=0xf5)
+        obj._timestamp = timestamp
+        obj._object_id = object_id
+        obj._accel_x = accel_x
+        obj._accel_y = accel_y
+        obj._accel_z = accel_z
+        return obj
+
     @property
     def timestamp(self):
         return self._timestamp
@@ -6959,16 +8292,18 @@ class ObjectAccel(Packet):
                 accel_z=self._accel_z)
 
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
-        writer.write(self._timestamp, "L")
-        writer.write(self._object_id, "L")
-        writer.write(self._accel_x, "f")
-        writer.write(self._accel_y, "f")
-        writer.write(self._accel_z, "f")
+        writer.write_struct(
+            self._codec,
+            self._timestamp,
+            self._object_id,
+            self._accel_x,
+            self._accel_y,
+            self._accel_z)
 
     @classmethod
     def from_bytes(cls, buffer):
@@ -6978,12 +8313,13 @@ class ObjectAccel(Packet):
 
     @classmethod
     def from_reader(cls, reader):
-        timestamp = reader.read("L")
-        object_id = reader.read("L")
-        accel_x = reader.read("f")
-        accel_y = reader.read("f")
-        accel_z = reader.read("f")
-        return cls(
+        values = reader.read_struct(cls._codec)
+        timestamp = values[0]
+        object_id = values[1]
+        accel_x = values[2]
+        accel_y = values[3]
+        accel_z = values[4]
+        return cls.unchecked(
             timestamp=timestamp,
             object_id=object_id,
             accel_x=accel_x,
@@ -4,7 +4,7 @@ Cozmo protocol packet encoder code generator.
 
 """
 
-from typing import Tuple
+from typing import Optional, Tuple, List
 import os
 from collections import defaultdict
 
@@ -77,6 +77,32 @@ def get_enum_fmt(argument: protocol_declaration.EnumArgument) -> str:
     return data_fmt
 
 
+def get_fixed_layout(struct: protocol_declaration.Struct) -> Optional[List[Tuple[str, int]]]:
+    """
+    Figures out whether a structure has a fixed binary layout that can be encoded and decoded with a single
+    precompiled struct.Struct object. Returns (format, value count) pairs for each argument or None.
+    """
+    if not struct.arguments:
+        return None
+    layout = []
+    for argument in struct.arguments:
+        if isinstance(argument, protocol_declaration.EnumArgument):
+            layout.append((get_enum_fmt(argument), 1))
+        elif isinstance(argument, protocol_declaration.FArrayArgument):
+            if isinstance(argument.data_type, protocol_declaration.Struct):
+                return None
+            data_fmt = get_farray_fmt(argument)
+            if data_fmt == "B" and argument.length > 1:
+                # Byte arrays are decoded as zero-copy views by BinaryReader.
+                return None
+            layout.append(("{}{}".format(argument.length, data_fmt), argument.length))
+        elif isinstance(argument, (protocol_declaration.VArrayArgument, protocol_declaration.StringArgument)):
+            return None
+        else:
+            layout.append((get_fmt_by_type(argument), 1))
+    return layout
+
+
 def int_to_str(value: int, base: int = 10) -> str:
     if base == 8:
         res = "0o{:o}".format(value)
@@ -90,9 +116,21 @@ def int_to_str(value: int, base: int = 10) -> str:
 
 
 class ProtocolGenerator(object):
+    """
+    Protocol encoder code generator.
 
-    def __init__(self, f):
+    struct_codecs enables precompiled struct.Struct codecs for structures with a fixed layout. unchecked_decoding
+    enables construction of decoded objects without argument validation. Both can be disabled to generate the
+    field-by-field, validating code of earlier versions (e.g. for benchmarking).
+    """
+
+    def __init__(self, f, struct_codecs: bool = True, unchecked_decoding: bool = True):
         self.f = f
+        self.struct_codecs = struct_codecs
+        self.unchecked_decoding = unchecked_decoding
+
+    def get_fixed_layout(self, struct: protocol_declaration.Struct) -> Optional[List[Tuple[str, int]]]:
+        return get_fixed_layout(struct) if self.struct_codecs else None
 
     def generate_packet_slots(self, struct: protocol_declaration.Struct) -> None:
         for argument in struct.arguments:
@@ -308,7 +346,13 @@ class ProtocolGenerator(object):
             if struct.arguments:
                 for argument in struct.arguments:
                     argument_strs.append('"{name}={{{name}}}'.format(name=argument.name))
-                    arguments.append("{name}=self._{name}".format(name=argument.name))
+                    if isinstance(argument, (protocol_declaration.FArrayArgument,
+                                             protocol_declaration.VArrayArgument)) \
+                            and isinstance(argument.data_type, protocol_declaration.UInt8Argument):
+                        # Byte arrays may be memoryview objects.
+                        arguments.append("{name}=bytes(self._{name})".format(name=argument.name))
+                    else:
+                        arguments.append("{name}=self._{name}".format(name=argument.name))
             self.f.write('        return "{type}(" \\\n               ')
             self.f.write('{argument_strs})".format(\n                {arguments})\n'.format(
                 argument_strs=', " \\\n               '.join(argument_strs),
@@ -316,14 +360,19 @@ class ProtocolGenerator(object):
         else:
             self.f.write('        return "{type}()".format(type=type(self).__name__)\n')
 
-    def generate_argument_defaults(self, struct: protocol_declaration.Struct) -> None:
+    def generate_codec(self, struct: protocol_declaration.Struct) -> None:
+        layout = self.get_fixed_layout(struct)
+        if layout:
+            self.f.write('\n    _codec = struct.Struct("<{fmt}")\n'.format(fmt="".join(fmt for fmt, _ in layout)))
+
+    def generate_argument_defaults(self, struct: protocol_declaration.Struct, indent: int = 17) -> None:
         for argument in struct.arguments:
             if isinstance(argument.default, str):
-                self.f.write(
-                    ",\n                 {name}='{default}'".format(name=argument.name, default=argument.default))
+                self.f.write(",\n{indent}{name}='{default}'".format(
+                    indent=" " * indent, name=argument.name, default=argument.default))
             else:
-                self.f.write(
-                    ",\n                 {name}={default}".format(name=argument.name, default=argument.default))
+                self.f.write(",\n{indent}{name}={default}".format(
+                    indent=" " * indent, name=argument.name, default=argument.default))
 
     def generate_argument_assignments(self, struct: protocol_declaration.Struct) -> None:
         if struct.arguments:
@@ -338,6 +387,25 @@ class ProtocolGenerator(object):
         else:
             self.f.write("        pass\n")
 
+    def generate_unchecked_constructor(self, struct: protocol_declaration.Struct) -> None:
+        self.f.write("\n    @classmethod\n    def unchecked(cls")
+        self.generate_argument_defaults(struct, indent=18)
+        self.f.write("):\n")
+        self.f.write('        """ Constructs without argument validation. '
+                     'Arguments must be of valid types and ranges. """\n')
+        self.f.write("        obj = cls.__new__(cls)\n")
+        if isinstance(struct, protocol_declaration.Packet):
+            packet_id = "0x{:02x}".format(struct.id) if struct.id is not None else None
+            self.f.write("        Packet.__init__(obj, {type}, packet_id={id})\n".format(
+                type=struct.type, id=packet_id))
+        for argument in struct.arguments:
+            if isinstance(argument, protocol_declaration.EnumArgument):
+                self.f.write("        obj._{name} = {enum_type}({name})\n".format(
+                    name=argument.name, enum_type=argument.enum_type.name))
+            else:
+                self.f.write("        obj._{name} = {name}\n".format(name=argument.name))
+        self.f.write("        return obj\n")
+
     def generate_packet_argument_assignments(self, packet: protocol_declaration.Packet) -> None:
         packet_id = "0x{:02x}".format(packet.id) if packet.id is not None else None
         self.f.write("        super().__init__({type}, packet_id={id})\n".format(type=packet.type, id=packet_id))
@@ -346,13 +414,26 @@ class ProtocolGenerator(object):
     def generate_packet_encoding(self, struct: protocol_declaration.Struct) -> None:
         self.f.write(r"""
     def to_bytes(self):
-        writer = BinaryWriter()
+        writer = BinaryWriter(len(self))
         self.to_writer(writer)
         return writer.dumps()
 
     def to_writer(self, writer):
 """)
-        if struct.arguments:
+        layout = self.get_fixed_layout(struct)
+        if layout:
+            values = []
+            for argument in struct.arguments:
+                if isinstance(argument, protocol_declaration.EnumArgument):
+                    values.append("self._{name}.value".format(name=argument.name))
+                elif isinstance(argument, protocol_declaration.FArrayArgument):
+                    values.append("*self._{name}".format(name=argument.name))
+                else:
+                    values.append("self._{name}".format(name=argument.name))
+            self.f.write("        writer.write_struct(\n            self._codec,\n            ")
+            self.f.write(",\n            ".join(values))
+            self.f.write(")\n")
+        elif struct.arguments:
             for argument in struct.arguments:
                 if isinstance(argument, protocol_declaration.FloatArgument):
                     self.f.write('        writer.write(self._{name}, "f")\n'.format(name=argument.name))
@@ -409,7 +490,20 @@ class ProtocolGenerator(object):
     @classmethod
     def from_reader(cls, reader):
 """)
-        if struct.arguments:
+        layout = self.get_fixed_layout(struct)
+        if layout:
+            self.f.write("        values = reader.read_struct(cls._codec)\n")
+            index = 0
+            for argument, (_, count) in zip(struct.arguments, layout):
+                if isinstance(argument, protocol_declaration.BoolArgument):
+                    self.f.write("        {name} = bool(values[{index}])\n".format(name=argument.name, index=index))
+                elif isinstance(argument, protocol_declaration.FArrayArgument):
+                    self.f.write("        {name} = values[{start}:{end}]\n".format(
+                        name=argument.name, start=index, end=index + count))
+                else:
+                    self.f.write("        {name} = values[{index}]\n".format(name=argument.name, index=index))
+                index += count
+        elif struct.arguments:
             for argument in struct.arguments:
                 if isinstance(argument, protocol_declaration.FloatArgument):
                     self.f.write('        {name} = reader.read("f")\n'.format(name=argument.name))
@@ -455,10 +549,21 @@ class ProtocolGenerator(object):
                         argument.__class__.__name__, argument.name))
         else:
             self.f.write("        del reader\n")
-        self.f.write("        return cls(\n")
+        if self.unchecked_decoding:
+            # Decoded values have valid types and ranges. Enum values are validated by unchecked().
+            self.f.write("        return cls.unchecked(\n")
+        else:
+            self.f.write("        return cls(\n")
         arguments = []
         for argument in struct.arguments:
-            arguments.append("{name}={name}".format(name=argument.name))
+            if self.unchecked_decoding and \
+                    isinstance(argument, (protocol_declaration.FArrayArgument, protocol_declaration.VArrayArgument)) \
+                    and not isinstance(argument.data_type, (protocol_declaration.Struct,
+                                                            protocol_declaration.UInt8Argument)):
+                # Match the list type, produced by argument validation.
+                arguments.append("{name}=list({name})".format(name=argument.name))
+            else:
+                arguments.append("{name}={name}".format(name=argument.name))
         self.f.write("            ")
         self.f.write(",\n            ".join(arguments))
         self.f.write(")\n")
@@ -486,10 +591,13 @@ class {name}(Struct):
             self.f.write('    """ {} """\n'.format(struct.description))
         self.f.write("\n    __slots__ = (\n")
         self.generate_packet_slots(struct)
-        self.f.write("    )\n\n    def __init__(self")
+        self.f.write("    )\n")
+        self.generate_codec(struct)
+        self.f.write("\n    def __init__(self")
         self.generate_argument_defaults(struct)
         self.f.write("):\n")
         self.generate_argument_assignments(struct)
+        self.generate_unchecked_constructor(struct)
         self.generate_argument_methods(struct)
         self.generate_len_method(struct)
         self.generate_repr_method(struct)
@@ -505,10 +613,13 @@ class {name}(Packet):
             self.f.write('    """ {} """\n'.format(packet.description))
         self.f.write("\n    __slots__ = (\n")
         self.generate_packet_slots(packet)
-        self.f.write("    )\n\n    def __init__(self")
+        self.f.write("    )\n")
+        self.generate_codec(packet)
+        self.f.write("\n    def __init__(self")
         self.generate_argument_defaults(packet)
         self.f.write("):\n")
         self.generate_packet_argument_assignments(packet)
+        self.generate_unchecked_constructor(packet)
         self.generate_argument_methods(packet)
         self.generate_len_method(packet)
         self.generate_repr_method(packet)
@@ -552,6 +663,7 @@ Do not modify.
 """
 
 import enum
+import struct
 
 from .protocol_ast import PacketType
 from .protocol_base import Struct, Packet
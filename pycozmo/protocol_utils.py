@@ -4,7 +4,7 @@ Cozmo protocol encoding helper classes and functions.
 
 """
 
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Union
 import struct
 
 
@@ -77,7 +77,7 @@ def validate_object(name, value, expected_type):
 
 
 def validate_farray(name, value, length, element_validation):
-    if not isinstance(value, (bytes, bytearray)):
+    if not isinstance(value, (bytes, bytearray, memoryview)):
         try:
             value = tuple(value)
         except ValueError:
@@ -86,7 +86,7 @@ def validate_farray(name, value, length, element_validation):
         raise ValueError(("{name} must be a sequence of length {expected_length}. "
                           "Got a sequence of length {value_length}.").format(
             name=name, expected_length=length, value_length=len(value)))
-    if isinstance(value, (bytes, bytearray)):
+    if isinstance(value, (bytes, bytearray, memoryview)):
         # Do not validate byte arrays.
         res = value
     else:
@@ -95,7 +95,7 @@ def validate_farray(name, value, length, element_validation):
 
 
 def validate_varray(name, value, maximum_length, element_validation):
-    if not isinstance(value, (bytes, bytearray)):
+    if not isinstance(value, (bytes, bytearray, memoryview)):
         try:
             value = tuple(value)
         except ValueError:
@@ -104,7 +104,7 @@ def validate_varray(name, value, maximum_length, element_validation):
         raise ValueError(("{name} must be a sequence with length less than or equal to {maximum_length}. "
                           "Got a sequence of length {value_length}.").format(
             name=name, maximum_length=maximum_length, value_length=len(value)))
-    if isinstance(value, (bytes, bytearray)):
+    if isinstance(value, (bytes, bytearray, memoryview)):
         # Do not validate byte arrays.
         res = value
     else:
@@ -157,9 +157,13 @@ def get_object_farray_size(value, length):
 
 
 class BinaryReader(object):
-    """ Used to read in a stream of binary data, keeping track of the current position. """
+    """
+    Used to read in a stream of binary data, keeping track of the current position.
 
-    def __init__(self, buffer: bytes, offset: int = 0):
+    When reading from a memoryview, byte arrays are returned as views into the buffer, without copying.
+    """
+
+    def __init__(self, buffer: Union[bytes, bytearray, memoryview], offset: int = 0):
         self._buffer = buffer
         self._index = offset
 
@@ -198,12 +202,25 @@ class BinaryReader(object):
             result = self._buffer[self._index:self._index+length]
             self._index += length
         else:
-            reader = _get_struct(fmt, length)
-            if self._index + reader.size > len(self._buffer):
-                raise IndexError('Buffer not large enough to read serialized message. Received {0} bytes.'.format(
-                    len(self._buffer)))
-            result = reader.unpack_from(self._buffer, self._index)
-            self._index += reader.size
+            result = self.read_struct(_get_struct(fmt, length))
+        return result
+
+    def read_struct(self, reader: struct.Struct) -> tuple:
+        """ Reads in a sequence of values with the given precompiled format. """
+        if self._index + reader.size > len(self._buffer):
+            raise IndexError('Buffer not large enough to read serialized message. Received {0} bytes.'.format(
+                len(self._buffer)))
+        result = reader.unpack_from(self._buffer, self._index)
+        self._index += reader.size
+        return result
+
+    def read_bytes(self, length):
+        """ Reads in a byte sequence of the given length. Returns a view when reading from a memoryview. """
+        if self._index + length > len(self._buffer):
+            raise IndexError('Buffer not large enough to read serialized message. Received {0} bytes.'.format(
+                len(self._buffer)))
+        result = self._buffer[self._index:self._index+length]
+        self._index += length
         return result
 
     def read_varray(self, data_format, length_format):
@@ -241,23 +258,46 @@ class BinaryReader(object):
 
 
 class BinaryWriter(object):
-    """ Used to write out a stream of binary data. """
+    """
+    Used to write out a stream of binary data.
 
-    def __init__(self):
-        self._buffer = []
+    Values are packed into a single, reusable bytearray that grows on demand. Preallocate it by passing the expected
+    size of the output.
+    """
+
+    def __init__(self, size: int = 64):
+        self._buffer = bytearray(size)
+        self._index = 0
 
     def __len__(self):
-        return len(self._buffer)
+        return self._index
 
     def clear(self):
-        del self._buffer[:]
+        self._index = 0
 
     def dumps(self) -> bytes:
-        return b"".join(self._buffer)
+        return memoryview(self._buffer)[:self._index].tobytes()
+
+    def getbuffer(self) -> memoryview:
+        """
+        Returns a view of the data written so far, without copying.
+
+        The view must be released before writing to the writer again.
+        """
+        return memoryview(self._buffer)[:self._index]
+
+    def _reserve(self, size: int) -> int:
+        """ Makes room for the given number of bytes and returns the offset to write them at. """
+        offset = self._index
+        self._index += size
+        if self._index > len(self._buffer):
+            self._buffer.extend(bytes(max(self._index - len(self._buffer), len(self._buffer))))
+        return offset
 
     def write_bytes(self, value: bytes) -> None:
         """ Writes out a byte sequence. """
-        self._buffer.append(value)
+        offset = self._reserve(len(value))
+        self._buffer[offset:self._index] = value
 
     def write(self, value, fmt):
         """ Writes out a single value of the given format. """
@@ -265,13 +305,16 @@ class BinaryWriter(object):
 
     def write_farray(self, value, fmt, length):
         """ Writes out a fixed-length array of the given format and length. """
-        if fmt == "B" and isinstance(value, (bytes, bytearray)):
+        if fmt == "B" and isinstance(value, (bytes, bytearray, memoryview)):
             if len(value) != length:
                 raise ValueError('The given byte sequence has the wrong length.')
-            self._buffer.append(value)
+            self.write_bytes(value)
         else:
-            writer = _get_struct(fmt, length)
-            self._buffer.append(writer.pack(*value))
+            self.write_struct(_get_struct(fmt, length), *value)
+
+    def write_struct(self, writer: struct.Struct, *values) -> None:
+        """ Writes out a sequence of values with the given precompiled format. """
+        writer.pack_into(self._buffer, self._reserve(writer.size), *values)
 
     def write_varray(self, value, data_format, length_format):
         """ Writes out a variable-length array with the given length format and data format. """
@@ -0,0 +1,232 @@
+"""
+
+Queue implementations.
+
+"""
+
+from collections import deque, Counter
+from enum import Enum, IntEnum
+from queue import Empty
+from threading import Lock, Condition
+from typing import Optional, Callable, Any
+import time
+
+
+__all__ = [
+    "Priority",
+    "PriorityQueue",
+    "QueuePolicy",
+    "EventQueue",
+]
+
+
+class Priority(IntEnum):
+    """ Outgoing packet priority classes, from highest to lowest. """
+    # Safety and motion commands (e.g. StopAllMotors, DriveWheels).
+    CONTROL = 0
+    # Real-time animation frames (e.g. OutputAudio, DisplayImage).
+    REALTIME = 1
+    # Bulk traffic (e.g. NV storage writes, firmware chunks).
+    BULK = 2
+
+
+class PriorityQueue(object):
+    """
+    Multi-lane FIFO queue.
+
+    Items are put in a lane, based on their priority, and are taken from the highest priority non-empty lane. Items
+    in the same lane keep their order. To avoid starvation, a non-empty lane that has been bypassed starvation_limit
+    times in a row is served next, regardless of its priority.
+
+    Putting items is safe from any thread. Taking items must be serialized by the caller.
+    """
+
+    def __init__(self,
+                 classify: Optional[Callable[[Any], Priority]] = None,
+                 starvation_limit: int = 8) -> None:
+        if starvation_limit < 1:
+            raise ValueError("Invalid starvation limit.")
+        self.classify = classify
+        self.starvation_limit = starvation_limit
+        self.lanes = [deque() for _ in Priority]
+        # Number of times each lane was bypassed while not empty.
+        self.bypassed = [0 for _ in Priority]
+        # Number of items, taken out of priority order to avoid starvation.
+        self.starvation_items = 0
+
+    def append(self, item: Any, priority: Optional[Priority] = None) -> None:
+        """ Put an item in the queue. Without explicit priority, the classification function is used. """
+        if priority is None:
+            priority = self.classify(item) if self.classify else Priority.CONTROL
+        self.lanes[priority].append(item)
+
+    def popleft(self) -> Any:
+        """ Take the next item from the queue. Raises IndexError if the queue is empty. """
+        selected = None
+        for priority, lane in enumerate(self.lanes):
+            if not lane:
+                continue
+            if selected is None:
+                selected = priority
+            elif self.bypassed[priority] >= self.starvation_limit:
+                # A lower priority lane is served to avoid starvation.
+                self.bypassed[selected] += 1
+                selected = priority
+                self.starvation_items += 1
+                break
+            else:
+                self.bypassed[priority] += 1
+        if selected is None:
+            raise IndexError("pop from an empty queue")
+        self.bypassed[selected] = 0
+        return self.lanes[selected].popleft()
+
+    def clear(self) -> None:
+        for lane in self.lanes:
+            lane.clear()
+        self.bypassed = [0 for _ in Priority]
+
+    def get_lengths(self) -> list:
+        """ Get the number of items in each lane. """
+        return [len(lane) for lane in self.lanes]
+
+    def __len__(self) -> int:
+        return sum(len(lane) for lane in self.lanes)
+
+    def __bool__(self) -> bool:
+        return any(self.lanes)
+
+
+class QueuePolicy(Enum):
+    """ Event queue policies, applied when the number of queued events of a given class reaches its bound. """
+    # Wait for space in the queue.
+    BLOCK = 1
+    # Drop the oldest queued event of the class.
+    DROP_OLDEST = 2
+    # Replace the newest queued event of the class, keeping its place in the queue.
+    KEEP_LATEST = 3
+
+
+class EventQueue(object):
+    """
+    Bounded multi-producer, single-consumer FIFO event queue.
+
+    Events are put with a key (e.g. an event or packet class). Keys can have their own bound and policy, set with
+    set_policy(). Events with other keys are subject to a common bound with the BLOCK policy. A bound of 0 means no
+    bound. Dropped events are counted per key.
+
+    Events keep their order. Blocking put() calls give up after block_timeout seconds (None waits indefinitely) or
+    when the queue is closed, dropping the event.
+    """
+
+    def __init__(self, maxsize: int = 0, block_timeout: Optional[float] = None) -> None:
+        self.lock = Lock()
+        self.not_empty = Condition(self.lock)
+        self.not_full = Condition(self.lock)
+        self.maxsize = maxsize
+        self.block_timeout = block_timeout
+        # Queued entries - [key, item, live] lists. Entries, dropped by the DROP_OLDEST policy, are not live.
+        self.entries = deque()
+        # Number of live entries.
+        self.count = 0
+        # Key -> (policy, bound)
+        self.policies = {}
+        # Key -> deque of live entries, for keys with policies.
+        self.pending = {}
+        # Key -> number of dropped events.
+        self.dropped = Counter()
+        self.closed = False
+
+    def set_policy(self, key: Any, policy: QueuePolicy, maxsize: int = 1) -> None:
+        """ Set the bound and policy for events with a given key. """
+        if maxsize < 1:
+            raise ValueError("Invalid queue bound.")
+        with self.lock:
+            self.policies[key] = (policy, maxsize)
+            if key not in self.pending:
+                self.pending[key] = deque(entry for entry in self.entries if entry[2] and entry[0] == key)
+
+    def put(self, item: Any, key: Any = None) -> bool:
+        """ Put an event in the queue. Returns False if the event was dropped. """
+        with self.lock:
+            rule = self.policies.get(key)
+            pending = None
+            if rule is None:
+                if self.maxsize > 0 and not self._wait_not_full(lambda: self.count < self.maxsize):
+                    self.dropped[key] += 1
+                    return False
+            else:
+                policy, maxsize = rule
+                pending = self.pending[key]
+                if len(pending) >= maxsize:
+                    if policy == QueuePolicy.KEEP_LATEST:
+                        pending[-1][1] = item
+                        self.dropped[key] += 1
+                        return True
+                    elif policy == QueuePolicy.DROP_OLDEST:
+                        entry = pending.popleft()
+                        entry[2] = False
+                        entry[1] = None
+                        self.count -= 1
+                        self.dropped[key] += 1
+                    elif not self._wait_not_full(lambda: len(pending) < maxsize):
+                        self.dropped[key] += 1
+                        return False
+            entry = [key, item, True]
+            self.entries.append(entry)
+            if pending is not None:
+                pending.append(entry)
+            self.count += 1
+            self.not_empty.notify()
+            return True
+
+    def _wait_not_full(self, predicate: Callable[[], bool]) -> bool:
+        """ Wait for space in the queue. Must be called with the lock held. """
+        deadline = None if self.block_timeout is None else time.perf_counter() + self.block_timeout
+        while not predicate():
+            if self.closed:
+                return False
+            timeout = None if deadline is None else deadline - time.perf_counter()
+            if timeout is not None and timeout <= 0.0:
+                return False
+            self.not_full.wait(timeout)
+        return True
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """ Take the next event from the queue. Raises queue.Empty if no event is available in time. """
+        with self.lock:
+            if block:
+                if not self.not_empty.wait_for(lambda: self.count > 0, timeout):
+                    raise Empty
+            elif not self.count:
+                raise Empty
+            while True:
+                entry = self.entries.popleft()
+                if entry[2]:
+                    break
+            entry[2] = False
+            self.count -= 1
+            if entry[0] in self.pending:
+                self.pending[entry[0]].popleft()
+            self.not_full.notify_all()
+            return entry[1]
+
+    def get_nowait(self) -> Any:
+        return self.get(block=False)
+
+    def close(self) -> None:
+        """ Release blocked producers. Later puts to full queues are dropped. """
+        with self.lock:
+            self.closed = True
+            self.not_full.notify_all()
+
+    def qsize(self) -> int:
+        return self.count
+
+    def empty(self) -> bool:
+        return not self.count
+
+    def get_dropped(self) -> int:
+        """ Get the total number of dropped events. """
+        with self.lock:
+            return sum(self.dropped.values())
@@ -0,0 +1,104 @@
+"""
+
+Round-trip time estimation.
+
+Implements smoothed round-trip time (SRTT) and round-trip time variation (RTTVAR) tracking and retransmission timeout
+(RTO) calculation, as described in RFC 6298.
+
+"""
+
+from collections import deque
+from typing import Optional
+
+
+__all__ = [
+    "RttEstimator",
+]
+
+
+class RttEstimator(object):
+    """ Round-trip time estimator. All times are in seconds. """
+
+    # Smoothing factors.
+    ALPHA = 1.0 / 8.0
+    BETA = 1.0 / 4.0
+    # Variance multiplier.
+    K = 4.0
+    # Clock granularity.
+    G = 0.001
+    # Number of recent measurements, kept for percentile calculation.
+    HISTORY_SIZE = 256
+
+    def __init__(self,
+                 initial_rto: float = 3 * 1/30,
+                 min_rto: float = 0.05,
+                 max_rto: float = 1.0) -> None:
+        if not 0.0 < min_rto <= initial_rto <= max_rto:
+            raise ValueError("Invalid retransmission timeout limits.")
+        self.initial_rto = initial_rto
+        self.min_rto = min_rto
+        self.max_rto = max_rto
+        # Smoothed round-trip time or None if no measurements have been made.
+        self.srtt = None    # type: Optional[float]
+        # Round-trip time variation.
+        self.rttvar = 0.0
+        # Latest and minimum round-trip time measurements.
+        self.last_rtt = None    # type: Optional[float]
+        self.min_rtt = None     # type: Optional[float]
+        # Retransmission timeout.
+        self.rto = initial_rto
+        # Number of measurements.
+        self.samples = 0
+        # Number of consecutive retransmission timeout back-offs.
+        self.backoffs = 0
+        # Recent measurements.
+        self.history = deque(maxlen=self.HISTORY_SIZE)
+
+    def update(self, rtt: float) -> None:
+        """ Update the estimation with a new round-trip time measurement. """
+        if rtt < 0.0:
+            return
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2.0
+        else:
+            self.rttvar = (1.0 - self.BETA) * self.rttvar + self.BETA * abs(self.srtt - rtt)
+            self.srtt = (1.0 - self.ALPHA) * self.srtt + self.ALPHA * rtt
+        self.last_rtt = rtt
+        self.history.append(rtt)
+        self.min_rtt = rtt if self.min_rtt is None else min(self.min_rtt, rtt)
+        self.samples += 1
+        self.backoffs = 0
+        self._set_rto(self.srtt + max(self.G, self.K * self.rttvar))
+
+    def backoff(self) -> None:
+        """ Double the retransmission timeout after it expired. """
+        self.backoffs += 1
+        self._set_rto(self.rto * 2.0)
+
+    def reset(self) -> None:
+        """ Forget all measurements. """
+        self.srtt = None
+        self.rttvar = 0.0
+        self.last_rtt = None
+        self.min_rtt = None
+        self.rto = self.initial_rto
+        self.samples = 0
+        self.backoffs = 0
+        self.history.clear()
+
+    def get_percentile(self, percentile: float) -> Optional[float]:
+        """ Get a percentile (0-100) of recent round-trip time measurements or None if there are none. """
+        history = sorted(self.history.copy())
+        if not history:
+            return None
+        index = min(len(history) - 1, max(0, int(round(percentile / 100.0 * len(history))) - 1))
+        return history[index]
+
+    def _set_rto(self, rto: float) -> None:
+        self.rto = min(max(rto, self.min_rto), self.max_rto)
+
+    def __repr__(self) -> str:
+        return "{}(srtt={}, rttvar={:.04f}, rto={:.04f}, samples={})".format(
+            type(self).__name__, "{:.04f}".format(self.srtt) if self.srtt is not None else None, self.rttvar,
+            self.rto, self.samples)
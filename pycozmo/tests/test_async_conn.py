@@ -0,0 +1,161 @@
+import unittest
+import asyncio
+import json
+from threading import Event
+
+import pycozmo
+
+
+class TestAsyncConnection(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pycozmo.setup_basic_logging(log_level="DEBUG", protocol_log_level="DEBUG")
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.s_conn_e = Event()
+        # Bind to an ephemeral port and connect to the port, assigned by the OS.
+        self.s = pycozmo.conn.Connection(("127.0.0.1", 0), server=True)
+        self.s.add_handler(pycozmo.protocol_encoder.Connect, lambda cli, pkt: self.s_conn_e.set())
+        self.c = pycozmo.async_conn.AsyncConnection(self.s.sock.getsockname())
+
+    def tearDown(self):
+        # Let closed transports release their sockets.
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    async def wait_for(self, evt, timeout: float = 2.0):
+        fut = self.loop.create_future()
+        self.c.add_handler(evt, lambda cli, pkt: fut.done() or fut.set_result(pkt), one_shot=True)
+        return await asyncio.wait_for(fut, timeout)
+
+    def run_client(self, coro):
+        self.s.start()
+        try:
+            self.loop.run_until_complete(self.c.start())
+            try:
+                return self.loop.run_until_complete(coro)
+            finally:
+                self.c.stop()
+        finally:
+            self.s.stop()
+
+    def test_connect(self):
+        async def run():
+            self.c.connect()
+            await self.wait_for(pycozmo.protocol_encoder.Connect)
+            self.assertEqual(self.c.state, self.c.CONNECTED)
+            self.assertTrue(self.s_conn_e.wait(2.0))
+            self.c.disconnect()
+        self.run_client(run())
+
+    def test_ping(self):
+        async def run():
+            self.c.connect()
+            await self.wait_for(pycozmo.protocol_encoder.Connect)
+            pkt = await self.wait_for(pycozmo.protocol_encoder.Ping)
+            self.assertIsInstance(pkt, pycozmo.protocol_encoder.Ping)
+        self.run_client(run())
+
+    def test_send(self):
+        COUNT = 30
+        counts = []
+        done_e = Event()
+        self.s.add_handler(pycozmo.protocol_encoder.SetRobotVolume,
+                           lambda cli, pkt: (counts.append(pkt.level), (pkt.level < COUNT - 1) or done_e.set()))
+
+        async def run():
+            self.c.connect()
+            await self.wait_for(pycozmo.protocol_encoder.Connect)
+            for i in range(COUNT):
+                self.c.send(pycozmo.protocol_encoder.SetRobotVolume(i))
+            while not done_e.is_set():
+                await asyncio.sleep(0.01)
+        self.run_client(asyncio.wait_for(run(), 5.0))
+        self.assertEqual(counts, list(range(COUNT)))
+
+
+class TestConnectionHub(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.servers = [pycozmo.conn.Connection(("127.0.0.1", 0), server=True) for _ in range(2)]
+        self.addrs = [s.sock.getsockname() for s in self.servers]
+        self.hub = pycozmo.async_conn.ConnectionHub(("127.0.0.1", 0))
+
+    def tearDown(self):
+        # Server sockets are opened on construction. Sockets of stopped servers are already closed.
+        for s in self.servers:
+            s.sock.close()
+        # Let closed transports release their sockets.
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def test_connect_many(self):
+        for s in self.servers:
+            s.start()
+        self.loop.run_until_complete(self.hub.start())
+        try:
+            conns = [self.hub.add_connection(addr) for addr in self.addrs]
+
+            async def run():
+                futs = []
+                for c in conns:
+                    fut = self.loop.create_future()
+                    c.add_handler(pycozmo.protocol_encoder.Connect,
+                                  lambda cli, pkt, fut=fut: fut.done() or fut.set_result(cli), one_shot=True)
+                    futs.append(fut)
+                    c.connect()
+                return await asyncio.wait_for(asyncio.gather(*futs), 2.0)
+
+            res = self.loop.run_until_complete(run())
+            self.assertEqual(res, conns)
+            for c in conns:
+                self.assertEqual(c.state, c.CONNECTED)
+                self.assertIs(c.transport, self.hub.transport)
+        finally:
+            self.hub.stop()
+            for s in self.servers:
+                s.stop()
+        self.assertEqual(self.hub.get_connections(), [])
+
+    def test_client(self):
+        server = self.servers[0]
+        enable_e = Event()
+        server.add_handler(pycozmo.protocol_encoder.Enable, lambda cli, pkt: enable_e.set())
+        server.start()
+        self.loop.run_until_complete(self.hub.start())
+        try:
+            connection = self.hub.add_connection(self.addrs[0])
+            cli = pycozmo.Client(connection=connection, auto_initialize=False)
+            cli.start()
+
+            async def run():
+                cli.connect()
+                await asyncio.wait_for(connection.wait_for_async(pycozmo.protocol_encoder.Connect), 2.0)
+                signature = {"version": pycozmo.protocol_declaration.FIRMWARE_VERSION}
+                server.send(pycozmo.protocol_encoder.FirmwareSignature(signature=json.dumps(signature)))
+                server.send(pycozmo.protocol_encoder.BodyInfo(serial_number=0x12345678))
+                await cli.wait_for_robot_async(timeout=2.0)
+
+            self.loop.run_until_complete(run())
+            self.assertEqual(cli.serial_number, 0x12345678)
+            # The client responds to the firmware signature through the hub.
+            self.assertTrue(enable_e.wait(2.0))
+            cli.stop()
+            # The connection is owned by the hub.
+            self.assertEqual(self.hub.get_connections(), [connection])
+            self.assertIs(connection.transport, self.hub.transport)
+        finally:
+            self.hub.stop()
+            server.stop()
+
+    def test_duplicate_address(self):
+        self.hub.add_connection(self.addrs[0])
+        with self.assertRaises(ValueError):
+            self.hub.add_connection(self.addrs[0])
@@ -0,0 +1,199 @@
+
+import unittest
+import threading
+import time
+import io
+
+import numpy as np
+from PIL import Image
+
+from pycozmo import camera, protocol_encoder
+
+
+class TestMiniToJpeg(unittest.TestCase):
+
+    def test_header(self):
+        mini = np.array([0x00, 0x12, 0x34], dtype=np.uint8)
+        res = camera.minigray_to_jpeg(mini, 320, 240)
+        header_length = len(camera.MINIGRAY_HEADER)
+        self.assertEqual(res.dtype, np.uint8)
+        self.assertEqual(res[:0x5e].tolist(), camera.MINIGRAY_HEADER[:0x5e].tolist())
+        self.assertEqual(res[0x5e:0x62].tolist(), [0x00, 0xF0, 0x01, 0x40])
+        self.assertEqual(res[0x62:header_length].tolist(), camera.MINIGRAY_HEADER[0x62:].tolist())
+        self.assertEqual(res[header_length:].tolist(), [0x12, 0x34, 0xFF, 0xD9])
+
+    def test_color_header(self):
+        mini = np.array([0x01, 0x12], dtype=np.uint8)
+        res = camera.minicolor_to_jpeg(mini, 160, 240)
+        header_length = len(camera.MINICOLOR_HEADER)
+        self.assertEqual(res[0x5e:0x62].tolist(), [0x00, 0xF0, 0x00, 0xA0])
+        self.assertEqual(res[header_length:].tolist(), [0x12, 0xFF, 0xD9])
+
+    def test_byte_stuffing(self):
+        mini = bytes([0x00, 0xFF, 0x12, 0xFF, 0xFF, 0x34, 0xFF, 0xFF])
+        res = camera.minigray_to_jpeg(mini, 320, 240)
+        header_length = len(camera.MINIGRAY_HEADER)
+        self.assertEqual(res[header_length:].tolist(), [0xFF, 0x00, 0x12, 0xFF, 0x00, 0xFF, 0x00, 0x34, 0xFF, 0xD9])
+
+    def test_header_not_modified(self):
+        header = camera.MINIGRAY_HEADER.copy()
+        camera.minigray_to_jpeg(np.array([0x00, 0x12], dtype=np.uint8), 640, 480)
+        self.assertTrue(np.array_equal(camera.MINIGRAY_HEADER, header))
+
+
+class TestBufferPool(unittest.TestCase):
+
+    def test_reuse(self):
+        pool = camera.BufferPool(max_buffers=1)
+        buf = pool.get(protocol_encoder.ImageResolution.QVGA)
+        self.assertEqual(len(buf), 320 * 240 * 3)
+        pool.put(protocol_encoder.ImageResolution.QVGA, buf)
+        self.assertIs(pool.get(protocol_encoder.ImageResolution.QVGA), buf)
+        self.assertIsNot(pool.get(protocol_encoder.ImageResolution.QVGA), buf)
+        self.assertEqual(pool.allocated, 2)
+        self.assertEqual(pool.reused, 1)
+
+    def test_resolution(self):
+        pool = camera.BufferPool()
+        pool.put(protocol_encoder.ImageResolution.QVGA, pool.get(protocol_encoder.ImageResolution.QVGA))
+        buf = pool.get(protocol_encoder.ImageResolution.QQVGA)
+        self.assertEqual(len(buf), 160 * 120 * 3)
+        self.assertEqual(pool.reused, 0)
+
+    def test_max_buffers(self):
+        pool = camera.BufferPool(max_buffers=1)
+        bufs = [pool.get(protocol_encoder.ImageResolution.QVGA) for _ in range(3)]
+        for buf in bufs:
+            pool.put(protocol_encoder.ImageResolution.QVGA, buf)
+        self.assertEqual(len(pool.buffers[protocol_encoder.ImageResolution.QVGA]), 1)
+
+
+class TestDecodeWorker(unittest.TestCase):
+
+    def setUp(self):
+        self.release_e = threading.Event()
+        self.decoded = []
+        self.released = []
+        self.delivered = threading.Event()
+        self.worker = camera.DecodeWorker(self.decode, self.deliver, self.released.append)
+
+    def tearDown(self):
+        self.release_e.set()
+        self.worker.stop()
+
+    def decode(self, raw):
+        self.release_e.wait(2.0)
+        if raw.image_id < 0:
+            raise ValueError("Invalid image.")
+        return raw.image_id
+
+    def deliver(self, raw, image, latency):
+        self.decoded.append((image, latency))
+        self.delivered.set()
+
+    def get_raw_image(self, image_id):
+        return camera.RawImage(image_id, 0, protocol_encoder.ImageEncoding.JPEGGray,
+                               protocol_encoder.ImageResolution.QVGA, np.zeros(1, dtype=np.uint8), 1)
+
+    def test_decode(self):
+        self.release_e.set()
+        self.worker.start()
+        raw = self.get_raw_image(1)
+        self.worker.put(raw)
+        self.assertTrue(self.delivered.wait(2.0))
+        self.assertEqual(self.decoded[0][0], 1)
+        self.assertGreaterEqual(self.decoded[0][1], 0.0)
+        self.assertEqual(self.released, [raw])
+        self.assertEqual(self.worker.decoded, 1)
+        self.assertIsNotNone(self.worker.get_average_latency())
+
+    def test_keep_latest(self):
+        self.worker.start()
+        raws = [self.get_raw_image(i) for i in range(4)]
+        for raw in raws:
+            self.worker.put(raw)
+            # Make sure that the first image is picked up for decoding.
+            time.sleep(0.02)
+        self.release_e.set()
+        deadline = time.perf_counter() + 2.0
+        while len(self.decoded) < 2 and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        self.assertEqual([image for image, _ in self.decoded], [0, 3])
+        self.assertEqual(self.worker.dropped, 2)
+        self.assertCountEqual(self.released, raws)
+
+    def test_failure(self):
+        self.release_e.set()
+        self.worker.start()
+        raw = self.get_raw_image(-1)
+        self.worker.put(raw)
+        deadline = time.perf_counter() + 2.0
+        while not self.released and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.released, [raw])
+        self.assertEqual(self.worker.failed, 1)
+        self.assertFalse(self.decoded)
+
+    def test_stop_releases_pending(self):
+        raw = self.get_raw_image(1)
+        self.worker.put(raw)
+        self.worker.stop()
+        self.assertEqual(self.released, [raw])
+
+
+class TestCameraFrame(unittest.TestCase):
+
+    def setUp(self):
+        buf = io.BytesIO()
+        im = Image.new("L", (320, 240), 0)
+        im.paste(255, (0, 0, 160, 240))
+        im.save(buf, "JPEG")
+        self.jpeg = buf.getvalue()
+        self.frame = camera.CameraFrame(
+            np.frombuffer(self.jpeg, dtype=np.uint8), protocol_encoder.ImageEncoding.JPEGGray,
+            protocol_encoder.ImageResolution.QVGA, image_id=5, frame_timestamp=100)
+
+    def test_lazy(self):
+        self.assertFalse(self.frame._cache)
+        self.assertEqual(self.frame.gray.shape, (240, 320))
+        self.assertNotIn("image", self.frame._cache)
+        self.assertNotIn("rgb", self.frame._cache)
+
+    def test_cached(self):
+        self.assertIs(self.frame.image, self.frame.image)
+        self.assertIs(self.frame.gray, self.frame.gray)
+        self.assertIs(self.frame.jpeg, self.frame.jpeg)
+
+    def test_conversions(self):
+        self.assertEqual(self.frame.jpeg, self.jpeg)
+        self.assertEqual(self.frame.image.mode, "RGB")
+        self.assertEqual(self.frame.image.size, (320, 240))
+        self.assertEqual(self.frame.rgb.shape, (240, 320, 3))
+        self.assertGreater(self.frame.gray[120, 10], 200)
+        self.assertLess(self.frame.gray[120, 310], 50)
+
+    def test_read_only(self):
+        with self.assertRaises(ValueError):
+            self.frame.gray[0, 0] = 0
+        with self.assertRaises(ValueError):
+            self.frame.rgb[0, 0, 0] = 0
+
+    def test_mini(self):
+        frame = camera.CameraFrame(
+            np.array([0x00, 0x12, 0xFF, 0xFF], dtype=np.uint8), protocol_encoder.ImageEncoding.JPEGMinimizedGray,
+            protocol_encoder.ImageResolution.QVGA)
+        self.assertFalse(frame.is_color)
+        self.assertEqual(frame.jpeg_array[len(camera.MINIGRAY_HEADER):].tolist(), [0x12, 0xFF, 0xD9])
+
+    def test_from_raw_image(self):
+        buf = np.zeros(100, dtype=np.uint8)
+        buf[:3] = (1, 2, 3)
+        raw = camera.RawImage(7, 200, protocol_encoder.ImageEncoding.JPEGMinimizedGray,
+                              protocol_encoder.ImageResolution.QVGA, buf, 3)
+        frame = camera.CameraFrame.from_raw_image(raw)
+        self.assertEqual(frame.data.tolist(), [1, 2, 3])
+        self.assertFalse(np.shares_memory(frame.data, buf))
+        self.assertTrue(frame.is_color)
+        self.assertEqual(frame.image_id, 7)
+        self.assertEqual(frame.frame_timestamp, 200)
+        self.assertEqual(frame.receive_time, raw.receive_time)
@@ -0,0 +1,134 @@
+
+import unittest
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from pycozmo import camera, camera_recording, event, protocol_encoder
+
+
+class TestCameraRecording(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.fspec = tempfile.mkstemp(suffix=".pcr")
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.fspec)
+
+    def get_raw_image(self, i, t):
+        buf = np.zeros(1000, dtype=np.uint8)
+        buf[:10 + i] = i
+        return camera.RawImage(100 + i, 1000 + i * 66, protocol_encoder.ImageEncoding.JPEGMinimizedGray,
+                               protocol_encoder.ImageResolution.QVGA, buf, 10 + i, receive_time=t)
+
+    def record(self, count=5, close=True):
+        recorder = camera_recording.CameraRecorder(self.fspec)
+        for i in range(count):
+            recorder.write(self.get_raw_image(i, 10.0 + i * 0.01))
+        if close:
+            recorder.close()
+        else:
+            recorder.flush()
+        return recorder
+
+    def check_frames(self, recording, count=5):
+        self.assertEqual(len(recording), count)
+        for i, frame in enumerate(recording):
+            self.assertEqual(frame.image_id, 100 + i)
+            self.assertEqual(frame.frame_timestamp, 1000 + i * 66)
+            self.assertEqual(frame.encoding, protocol_encoder.ImageEncoding.JPEGMinimizedGray)
+            self.assertEqual(frame.resolution, protocol_encoder.ImageResolution.QVGA)
+            self.assertEqual(frame.data.tolist(), [i] * (10 + i))
+            self.assertAlmostEqual(frame.receive_time, i * 0.01)
+
+    def test_roundtrip(self):
+        self.record()
+        with camera_recording.CameraRecording(self.fspec) as recording:
+            self.check_frames(recording)
+            self.assertAlmostEqual(recording.get_duration(), 0.04)
+            self.assertEqual(recording.find(0.015), 2)
+            frame = recording[3]
+            self.assertEqual(frame.image_id, 103)
+            self.assertFalse(frame.data.flags.writeable)
+            self.assertEqual(len(frame.jpeg), len(camera.MINICOLOR_HEADER) + 12 + 2)
+
+    def test_no_index(self):
+        recorder = self.record(close=False)
+        try:
+            with camera_recording.CameraRecording(self.fspec) as recording:
+                self.check_frames(recording)
+        finally:
+            recorder.close()
+
+    def test_truncated(self):
+        recorder = self.record(close=False)
+        recorder.f.write(b"PCFR\x00")
+        recorder.f.flush()
+        try:
+            with camera_recording.CameraRecording(self.fspec) as recording:
+                self.check_frames(recording)
+        finally:
+            recorder.close()
+
+    def test_truncated_index(self):
+        self.record()
+        size = os.path.getsize(self.fspec)
+        with open(self.fspec, "r+b") as f:
+            f.truncate(size - 10)
+        with camera_recording.CameraRecording(self.fspec) as recording:
+            self.check_frames(recording)
+
+    def test_zero_length(self):
+        with self.assertRaises(ValueError):
+            camera_recording.CameraRecording(self.fspec)
+
+    def test_empty(self):
+        self.record(count=0)
+        with camera_recording.CameraRecording(self.fspec) as recording:
+            self.assertEqual(len(recording), 0)
+            self.assertEqual(recording.get_duration(), 0.0)
+
+    def test_dropped(self):
+        recorder = camera_recording.CameraRecorder(self.fspec, max_pending=0)
+        recorder.write(self.get_raw_image(0, 10.0))
+        recorder.close()
+        self.assertEqual(recorder.dropped, 1)
+        self.assertEqual(recorder.get_frame_count(), 0)
+
+    def test_write_closed(self):
+        recorder = self.record()
+        with self.assertRaises(ValueError):
+            recorder.write(self.get_raw_image(0, 10.0))
+
+    def test_invalid(self):
+        with open(self.fspec, "wb") as f:
+            f.write(b"\x00" * 100)
+        with self.assertRaises(ValueError):
+            camera_recording.CameraRecording(self.fspec)
+
+    def test_frame(self):
+        frame = camera.CameraFrame(np.arange(20, dtype=np.uint8), protocol_encoder.ImageEncoding.JPEGColor,
+                                   protocol_encoder.ImageResolution.QQVGA, image_id=1, frame_timestamp=2)
+        with camera_recording.CameraRecorder(self.fspec) as recorder:
+            recorder.write(frame)
+        with camera_recording.CameraRecording(self.fspec) as recording:
+            self.assertEqual(recording[0].data.tolist(), list(range(20)))
+            self.assertEqual(recording[0].resolution, protocol_encoder.ImageResolution.QQVGA)
+            self.assertEqual(recording[0].receive_time, 0.0)
+
+    def test_replay(self):
+        self.record()
+        dispatcher = event.Dispatcher()
+        frames = []
+        dispatcher.add_handler(event.EvtNewRawCameraImage, lambda cli, frame: frames.append(frame))
+        with camera_recording.CameraRecording(self.fspec) as recording:
+            start = time.perf_counter()
+            self.assertEqual(recording.replay(dispatcher, speed=1.0, start=1), 4)
+            self.assertGreaterEqual(time.perf_counter() - start, 0.03)
+            self.assertEqual([frame.image_id for frame in frames], [101, 102, 103, 104])
+            frames.clear()
+            self.assertEqual(recording.replay(dispatcher, speed=None, stop=2), 2)
+            self.assertEqual([frame.image_id for frame in frames], [100, 101])
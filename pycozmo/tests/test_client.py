@@ -0,0 +1,112 @@
+
+import unittest
+import io
+import os
+import tempfile
+
+import numpy as np
+from PIL import Image
+
+from pycozmo import camera, camera_recording, event, protocol_encoder
+from pycozmo.client import Client
+
+
+class TestClientCamera(unittest.TestCase):
+
+    def setUp(self):
+        self.cli = Client()
+        buf = io.BytesIO()
+        Image.new("L", (320, 240), 128).save(buf, "JPEG")
+        self.jpeg = buf.getvalue()
+
+    def tearDown(self):
+        self.cli.camera_decoder.stop()
+
+    def send_image(self, image_id=1, chunk_size=500, timeout=None):
+        chunks = [self.jpeg[i:i + chunk_size] for i in range(0, len(self.jpeg), chunk_size)]
+        for i, chunk in enumerate(chunks):
+            pkt = protocol_encoder.ImageChunk(
+                frame_timestamp=100, image_id=image_id, image_encoding=protocol_encoder.ImageEncoding.JPEGGray,
+                image_resolution=protocol_encoder.ImageResolution.QVGA, image_chunk_count=len(chunks), chunk_id=i,
+                data=chunk)
+            self.cli._on_image_chunk(self.cli, pkt)
+        evt, args, _ = self.cli.conn.queue.get(timeout=timeout) if timeout else self.cli.conn.queue.get_nowait()
+        self.assertEqual(evt, event.EvtNewRawCameraImage)
+        return args[1]
+
+    def test_frame(self):
+        frame = self.send_image()
+        self.assertIsInstance(frame, camera.CameraFrame)
+        self.assertEqual(frame.image_id, 1)
+        self.assertEqual(frame.frame_timestamp, 100)
+        self.assertGreater(frame.decode_latency, 0.0)
+        self.assertEqual(frame.jpeg, self.jpeg)
+        self.assertEqual(frame.gray.shape, (240, 320))
+
+    def test_pil(self):
+        self.cli.camera_image_format = camera.ImageFormat.PIL
+        image = self.send_image()
+        self.assertIsInstance(image, Image.Image)
+        self.assertEqual(image.size, (320, 240))
+        self.assertEqual(image.mode, "RGB")
+        self.assertEqual(self.cli.last_image_timestamp, 100)
+        self.assertEqual(image.info["image_id"], 1)
+        self.assertEqual(image.info["frame_timestamp"], 100)
+        self.assertGreater(image.info["decode_latency"], 0.0)
+
+    def test_decode_worker(self):
+        self.cli.camera_image_format = camera.ImageFormat.PIL
+        self.cli.camera_decoder.start()
+        image = self.send_image(timeout=2.0)
+        self.assertIsInstance(image, Image.Image)
+        self.assertEqual(self.cli.camera_decoder.decoded, 1)
+        self.assertEqual(image.info["decode_latency"], self.cli.camera_decoder.last_latency)
+
+    def test_jpeg(self):
+        self.cli.camera_image_format = camera.ImageFormat.JPEG
+        image = self.send_image()
+        self.assertEqual(image, self.jpeg)
+
+    def test_array(self):
+        self.cli.camera_image_format = camera.ImageFormat.ARRAY
+        image = self.send_image()
+        self.assertIsInstance(image, np.ndarray)
+        self.assertEqual(image.tobytes(), self.jpeg)
+        # Images do not share reassembly buffers.
+        image2 = self.send_image(image_id=2)
+        self.assertFalse(np.shares_memory(image, image2))
+        self.assertEqual(image.tobytes(), self.jpeg)
+
+    def test_buffer_reuse(self):
+        for image_id in range(3):
+            self.send_image(image_id=image_id)
+        self.assertEqual(self.cli.camera_buffers.allocated, 1)
+        self.assertEqual(self.cli.camera_buffers.reused, 2)
+
+    def test_missing_chunk(self):
+        chunks = [self.jpeg[i:i + 500] for i in range(0, len(self.jpeg), 500)]
+        for i in (0, 2):
+            pkt = protocol_encoder.ImageChunk(
+                image_id=1, image_encoding=protocol_encoder.ImageEncoding.JPEGGray,
+                image_resolution=protocol_encoder.ImageResolution.QVGA, image_chunk_count=len(chunks), chunk_id=i,
+                data=chunks[i])
+            self.cli._on_image_chunk(self.cli, pkt)
+        self.assertTrue(self.cli.conn.queue.empty())
+        # The buffer was returned to the pool.
+        self.send_image(image_id=2)
+        self.assertEqual(self.cli.camera_buffers.allocated, 1)
+
+    def test_recording(self):
+        fd, fspec = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            self.cli.start_camera_recording(fspec)
+            self.send_image(image_id=1)
+            self.send_image(image_id=2)
+            self.cli.stop_camera_recording()
+            self.send_image(image_id=3)
+            with camera_recording.CameraRecording(fspec) as recording:
+                self.assertEqual([frame.image_id for frame in recording], [1, 2])
+                self.assertEqual(recording[0].jpeg, self.jpeg)
+        finally:
+            os.remove(fspec)
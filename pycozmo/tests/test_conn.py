@@ -1,10 +1,283 @@
 
 import unittest
-from threading import Event
+import logging
+import socket
+import time
+from threading import Event, Thread
 
 import pycozmo
 
 
+class FakeSocket:
+
+    def __init__(self):
+        self.frames = []
+        self.e = Event()
+
+    def sendto(self, raw_frame, address):
+        self.frames.append((time.perf_counter(), pycozmo.Frame.from_bytes(bytes(raw_frame))))
+        self.e.set()
+
+
+class TestSendThread(unittest.TestCase):
+
+    def setUp(self):
+        self.sock = FakeSocket()
+        self.t = pycozmo.conn.SendThread(self.sock, ("127.0.0.1", 5551))
+        self.t.start()
+
+    def tearDown(self):
+        self.t.stop()
+
+    def test_idle(self):
+        self.assertFalse(self.sock.e.wait(0.1))
+        self.assertTrue(self.t.idle)
+
+    def test_send(self):
+        start = time.perf_counter()
+        self.t.send(pycozmo.protocol_encoder.SetRobotVolume(1))
+        self.assertTrue(self.sock.e.wait(1.0))
+        timestamp, frame = self.sock.frames[0]
+        self.assertLess(timestamp - start, 0.01)
+        self.assertEqual(len(frame.pkts), 1)
+        self.assertEqual(frame.first_seq, 0)
+
+    def test_resend(self):
+        self.t.ack(pycozmo.protocol_declaration.OOB_SEQ, 0)
+        self.t.send(pycozmo.protocol_encoder.SetRobotVolume(1))
+        time.sleep(self.t.ACK_TIMEOUT * 2.5)
+        self.assertGreaterEqual(len(self.sock.frames), 2)
+        self.assertEqual(self.sock.frames[1][1].first_seq, 0)
+        (t1, _), (t2, _) = self.sock.frames[:2]
+        self.assertGreaterEqual(t2 - t1, self.t.ACK_TIMEOUT * 0.9)
+
+    def test_ack_stops_resend(self):
+        self.t.send(pycozmo.protocol_encoder.SetRobotVolume(1))
+        self.assertTrue(self.sock.e.wait(1.0))
+        self.t.ack(0, 0)
+        time.sleep(self.t.ACK_TIMEOUT * 2.5)
+        self.assertEqual(len(self.sock.frames), 1)
+        self.assertTrue(self.t.idle)
+
+    def test_resend_unacknowledged_only(self):
+        self.t.ack(pycozmo.protocol_declaration.OOB_SEQ, 0)
+        self.t.send(pycozmo.protocol_encoder.SetRobotVolume(1))
+        self.t.send(pycozmo.protocol_encoder.SetRobotVolume(2))
+        self.assertTrue(self.sock.e.wait(1.0))
+        self.t.ack(0, 0)
+        time.sleep(self.t.ACK_TIMEOUT * 1.5)
+        self.assertGreaterEqual(len(self.sock.frames), 2)
+        frame = self.sock.frames[-1][1]
+        self.assertEqual(frame.first_seq, 1)
+        self.assertEqual(len(frame.pkts), 1)
+        self.assertGreaterEqual(self.t.resent_packets, 1)
+
+    def test_ack_rtt(self):
+        self.t.send(pycozmo.protocol_encoder.SetRobotVolume(1))
+        self.assertTrue(self.sock.e.wait(1.0))
+        time.sleep(0.02)
+        self.t.ack(0, 0)
+        self.assertEqual(self.t.rtt.samples, 1)
+        self.assertGreaterEqual(self.t.rtt.srtt, 0.02)
+        # Duplicate acknowledgements are not measured.
+        self.t.ack(0, 0)
+        self.assertEqual(self.t.rtt.samples, 1)
+
+    def test_send_priority(self):
+        with self.t.cond:
+            self.t.queue.append(pycozmo.protocol_encoder.OutputSilence())
+            self.t.queue.append(pycozmo.protocol_encoder.NvStorageOp())
+            self.t.queue.append(pycozmo.protocol_encoder.StopAllMotors())
+            self.t.cond.notify()
+        self.assertTrue(self.sock.e.wait(1.0))
+        frame = self.sock.frames[0][1]
+        self.assertEqual([pkt.__class__ for pkt in frame.pkts], [
+            pycozmo.protocol_encoder.StopAllMotors,
+            pycozmo.protocol_encoder.OutputSilence,
+            pycozmo.protocol_encoder.NvStorageOp])
+
+    def test_send_packets_sequence_gap(self):
+        pkt = pycozmo.protocol_encoder.SetRobotVolume(1)
+        self.t._send_packets([(0, pkt), (1, pkt), (3, pkt)], 0)
+        self.assertEqual(len(self.sock.frames), 2)
+        frame1, frame2 = self.sock.frames[0][1], self.sock.frames[1][1]
+        self.assertEqual((frame1.first_seq, frame1.seq, len(frame1.pkts)), (0, 1, 2))
+        self.assertEqual((frame2.first_seq, frame2.seq, len(frame2.pkts)), (3, 3, 1))
+
+
+class FakeSender(pycozmo.conn.Sender):
+    """ Sender, driven by a manual clock, that records sent frames. """
+
+    def __init__(self):
+        self.now = 1.0
+        super().__init__(("127.0.0.1", 5551), clock=lambda: self.now)
+        self.frames = []
+
+    def send(self, data, priority=None):
+        with self.lock:
+            self._enqueue(data, priority)
+
+    def _sendto(self, raw_frame, address):
+        self.frames.append(pycozmo.Frame.from_bytes(bytes(raw_frame)))
+
+    def flush(self):
+        with self.lock:
+            frame_due = self._get_frame_delay(self.now) == 0.0
+        self._send_due_packets(frame_due)
+
+
+class TestSender(unittest.TestCase):
+
+    def setUp(self):
+        self.s = FakeSender()
+        self.s.max_frame_delay = 0.0
+        self.s.ack(pycozmo.protocol_declaration.OOB_SEQ, 0)
+
+    def send(self, count):
+        for i in range(count):
+            self.s.send(pycozmo.protocol_encoder.SetRobotVolume(i))
+        self.s.flush()
+
+    def test_fast_retransmit(self):
+        self.send(2)
+        self.s.now += 0.01
+        self.s.ack(0, 0)
+        self.s.now += 0.02
+        for _ in range(self.s.DUP_ACK_THRESHOLD):
+            self.s.ack(0, 0)
+        # Resent before the retransmission timeout expires.
+        self.assertLess(0.02, self.s.rtt.rto)
+        self.s.flush()
+        self.assertEqual(self.s.fast_retransmits, 1)
+        self.assertEqual([(frame.first_seq, frame.seq) for frame in self.s.frames], [(0, 1), (1, 1)])
+        # Duplicate acknowledgements within a round trip of the resend do not trigger another one.
+        for _ in range(self.s.DUP_ACK_THRESHOLD):
+            self.s.ack(0, 0)
+        self.s.flush()
+        self.assertEqual(self.s.fast_retransmits, 1)
+        self.assertEqual(len(self.s.frames), 2)
+
+    def test_stale_acks(self):
+        self.send(1)
+        self.s.now += 0.1
+        self.s.ack(0, 0)
+        self.send(1)
+        # The receiver repeats its last acknowledgement until the new packet reaches it, a round trip later.
+        for _ in range(10):
+            self.s.now += 0.005
+            self.s.ack(0, 0)
+            self.s.flush()
+        self.assertEqual(self.s.fast_retransmits, 0)
+        self.assertEqual(self.s.resent_packets, 0)
+        self.assertEqual(len(self.s.frames), 2)
+
+    def test_send_coalescing(self):
+        self.s.max_frame_delay = 0.05
+        self.s.send(pycozmo.protocol_encoder.AnimHead(duration_ms=33))
+        self.s.send(pycozmo.protocol_encoder.AnimLift(duration_ms=33))
+        self.s.now += 0.04
+        self.s.send(pycozmo.protocol_encoder.AnimBackpackLights(colors=(0, 0, 0, 0, 0)))
+        self.s.flush()
+        self.assertEqual(self.s.frames, [])
+        with self.s.lock:
+            self.assertAlmostEqual(self.s._get_send_timeout(self.s.now), 0.01)
+        self.s.now += 0.01
+        self.s.flush()
+        self.assertEqual([len(frame.pkts) for frame in self.s.frames], [3])
+        self.assertEqual(self.s.data_frames, 1)
+        self.assertGreater(self.s.get_frame_fill(), 0.0)
+
+    def test_send_coalescing_full_frame(self):
+        self.s.max_frame_delay = 1.0
+        for _ in range(3):
+            self.s.send(pycozmo.protocol_encoder.OutputAudio(samples=bytes(744)))
+        self.s.flush()
+        self.assertGreaterEqual(len(self.s.frames), 1)
+
+    def test_send_control_immediately(self):
+        self.s.max_frame_delay = 0.05
+        self.s.send(pycozmo.protocol_encoder.AnimHead(duration_ms=33))
+        self.s.send(pycozmo.protocol_encoder.StopAllMotors())
+        self.s.flush()
+        # Control packets close the frame.
+        self.assertEqual([[pkt.__class__ for pkt in frame.pkts] for frame in self.s.frames], [[
+            pycozmo.protocol_encoder.StopAllMotors, pycozmo.protocol_encoder.AnimHead]])
+
+    def test_disconnect_last(self):
+        # Enough packets to promote the bulk lane ahead of the control lane.
+        for i in range(10):
+            self.s.send(pycozmo.protocol_encoder.SetRobotVolume(i))
+        self.s.send(pycozmo.protocol_encoder.Disconnect())
+        self.s.send(pycozmo.protocol_encoder.StopAllMotors())
+        self.s.flush()
+        pkts = [pkt for frame in self.s.frames for pkt in frame.pkts]
+        self.assertEqual([pkt.__class__ for pkt in pkts],
+                         [pycozmo.protocol_encoder.SetRobotVolume] * 10 + [
+                             pycozmo.protocol_encoder.StopAllMotors, pycozmo.protocol_encoder.Disconnect])
+        self.assertEqual([pkt.level for pkt in pkts[:10]], list(range(10)))
+        # Nothing is sent after a disconnect.
+        self.s.send(pycozmo.protocol_encoder.SetRobotVolume(0))
+        self.s.flush()
+        self.assertEqual(len([pkt for frame in self.s.frames for pkt in frame.pkts]), 12)
+
+
+class TestReceiveThread(unittest.TestCase):
+
+    def setUp(self):
+        self.rsock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.rsock.bind(("127.0.0.1", 0))
+        self.rsock.setblocking(False)
+        self.ssock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.t = pycozmo.conn.ReceiveThread(self.rsock, None, None, lambda pkt: None, buffer_count=4)
+
+    def tearDown(self):
+        self.ssock.close()
+        self.rsock.close()
+
+    def send(self, count):
+        for i in range(count):
+            self.ssock.sendto(bytes([i]) * (i + 1), self.rsock.getsockname())
+        time.sleep(0.05)
+
+    def test_receive_datagrams(self):
+        self.send(3)
+        datagrams = self.t._receive_datagrams()
+        self.assertEqual([bytes(raw_frame) for raw_frame, _, _ in datagrams], [b"\x00", b"\x01\x01", b"\x02\x02\x02"])
+        self.assertEqual(datagrams[0][1][1], self.ssock.getsockname()[1])
+        self.assertEqual(self.t._receive_datagrams(), [])
+        # Receive times are only taken when profiling.
+        self.assertIsNone(datagrams[0][2])
+
+    def test_receive_times(self):
+        self.t.profiler = pycozmo.metrics.LatencyProfiler()
+        self.send(3)
+        recv_times = [recv_time for _, _, recv_time in self.t._receive_datagrams()]
+        self.assertEqual(len(recv_times), 3)
+        # Each datagram is timestamped when read.
+        self.assertEqual(recv_times, sorted(recv_times))
+        self.assertEqual(len(set(recv_times)), 3)
+
+    def test_receive_datagrams_batch_limit(self):
+        self.send(6)
+        self.assertEqual(len(self.t._receive_datagrams()), 4)
+        self.assertEqual(len(self.t._receive_datagrams()), 2)
+
+    def test_receive_buffer_reuse(self):
+        self.send(1)
+        for raw_frame, _, _ in self.t._receive_datagrams():
+            raw_frame.release()
+        self.send(1)
+        raw_frame = self.t._receive_datagrams()[0][0]
+        self.assertEqual(self.t.replaced_buffers, 0)
+        # Views that are still referenced prevent reuse of the buffer.
+        data = raw_frame[:1]
+        raw_frame.release()
+        self.send(2)
+        self.t._receive_datagrams()
+        self.assertEqual(self.t.replaced_buffers, 1)
+        self.assertEqual(data, b"\x00")
+
+
 class TestConnection(unittest.TestCase):
 
     @classmethod
@@ -65,3 +338,131 @@ class TestConnection(unittest.TestCase):
         self.assertTrue(self.s_e.wait(5.0))
         self.assertEqual(counts, list(range(COUNT)))
         self.stop()
+
+
+class TestLazyDecoding(unittest.TestCase):
+
+    def setUp(self):
+        self.c = pycozmo.conn.Connection(("127.0.0.1", 5551))
+        self.c._add_protocol_handlers()
+        self.pkts = []
+
+    def get_pkt(self, data):
+        pkt_class = pycozmo.protocol_encoder.SetRobotVolume
+        return pycozmo.protocol_base.LazyPacket(pkt_class, pkt_class().type, pkt_class().id, data)
+
+    def tearDown(self):
+        self.c.sock.close()
+
+    def test_no_handlers(self):
+        # Invalid packet data is not decoded.
+        pkt = self.get_pkt(b"")
+        self.c.dispatch(pycozmo.event.EvtPacketReceived, pkt)
+        self.assertFalse(pkt.is_decoded())
+
+    def test_handler(self):
+        self.c.add_handler(pycozmo.protocol_encoder.SetRobotVolume, lambda cli, pkt: self.pkts.append(pkt))
+        pkt = self.get_pkt(pycozmo.protocol_encoder.SetRobotVolume(level=100).to_bytes())
+        self.c.dispatch(pycozmo.event.EvtPacketReceived, pkt)
+        self.assertEqual(len(self.pkts), 1)
+        self.assertIsInstance(self.pkts[0], pycozmo.protocol_encoder.SetRobotVolume)
+        self.assertEqual(self.pkts[0].level, 100)
+
+    def test_child_handler(self):
+        child = pycozmo.event.Dispatcher()
+        child.add_handler(pycozmo.protocol_encoder.SetRobotVolume, lambda cli, pkt: self.pkts.append(pkt))
+        self.c.add_child_dispatcher(child)
+        pkt = self.get_pkt(pycozmo.protocol_encoder.SetRobotVolume(level=100).to_bytes())
+        self.c.dispatch(pycozmo.event.EvtPacketReceived, pkt)
+        self.assertEqual(len(self.pkts), 1)
+
+    def test_decode_failure(self):
+        self.c.add_handler(pycozmo.protocol_encoder.SetRobotVolume, lambda cli, pkt: self.pkts.append(pkt))
+        pkt = self.get_pkt(b"")
+        self.c.dispatch(pycozmo.event.EvtPacketReceived, pkt)
+        self.assertEqual(self.pkts, [])
+
+    def test_packet_received_handler(self):
+        self.c.add_handler(pycozmo.event.EvtPacketReceived, lambda pkt: self.pkts.append(pkt))
+        pkt = self.get_pkt(pycozmo.protocol_encoder.SetRobotVolume(level=100).to_bytes())
+        self.c._dispatch_event(pycozmo.event.EvtPacketReceived, pkt)
+        self.assertEqual(len(self.pkts), 1)
+        self.assertNotIsInstance(self.pkts[0], pycozmo.protocol_base.LazyPacket)
+        self.assertEqual(self.pkts[0].level, 100)
+
+    def test_protocol_handler_only(self):
+        # Protocol debug logging decodes packets.
+        level = pycozmo.logger_protocol.level
+        pycozmo.logger_protocol.setLevel(logging.INFO)
+        self.addCleanup(pycozmo.logger_protocol.setLevel, level)
+        pkt = self.get_pkt(pycozmo.protocol_encoder.SetRobotVolume(level=100).to_bytes())
+        self.c._dispatch_event(pycozmo.event.EvtPacketReceived, pkt)
+        self.assertFalse(pkt.is_decoded())
+
+
+class TestReceiveFilter(unittest.TestCase):
+
+    def setUp(self):
+        self.c = pycozmo.conn.Connection(("127.0.0.1", 5551))
+        self.c._add_protocol_handlers()
+        self.pkt = pycozmo.protocol_encoder.SetRobotVolume(level=100)
+
+    def tearDown(self):
+        self.c.sock.close()
+
+    def test_no_handlers(self):
+        self.assertTrue(self.c._filter_packet(self.pkt))
+        self.c._on_packet(self.pkt)
+        self.assertTrue(self.c.queue.empty())
+        self.assertEqual(self.c.filtered_packets, 2)
+
+    def test_protocol_packets(self):
+        self.assertFalse(self.c._filter_packet(pycozmo.protocol_encoder.Ping()))
+        self.assertFalse(self.c._filter_packet(pycozmo.protocol_encoder.Connect()))
+        self.assertFalse(self.c._filter_packet(pycozmo.protocol_base.UnknownEvent(0xfe)))
+
+    def test_handler(self):
+        handler = self.c.add_handler(pycozmo.protocol_encoder.SetRobotVolume, lambda cli, pkt: None)
+        self.assertFalse(self.c._filter_packet(self.pkt))
+        self.c._on_packet(self.pkt)
+        self.assertFalse(self.c.queue.empty())
+        self.c.del_handler(pycozmo.protocol_encoder.SetRobotVolume, handler)
+        self.assertTrue(self.c._filter_packet(self.pkt))
+
+    def test_one_shot_handler(self):
+        self.c.add_handler(pycozmo.protocol_encoder.SetRobotVolume, lambda cli, pkt: None, one_shot=True)
+        self.assertFalse(self.c._filter_packet(self.pkt))
+        self.c.dispatch(pycozmo.protocol_encoder.SetRobotVolume, self.c, self.pkt)
+        self.assertTrue(self.c._filter_packet(self.pkt))
+
+    def test_child_handler(self):
+        parent = pycozmo.event.Dispatcher()
+        child = pycozmo.event.Dispatcher()
+        self.c.add_child_dispatcher(parent)
+        parent.add_child_dispatcher(child)
+        self.assertTrue(self.c._filter_packet(self.pkt))
+        child.add_handler(pycozmo.protocol_encoder.SetRobotVolume, lambda cli, pkt: None)
+        self.assertFalse(self.c._filter_packet(self.pkt))
+        self.c.del_child_dispatcher(parent)
+        self.assertTrue(self.c._filter_packet(self.pkt))
+
+    def test_packet_received_handler(self):
+        # Handlers for all packets disable filtering.
+        handler = self.c.add_handler(pycozmo.event.EvtPacketReceived, lambda pkt: None)
+        self.assertFalse(self.c._filter_packet(self.pkt))
+        self.c.del_handler(pycozmo.event.EvtPacketReceived, handler)
+        self.assertTrue(self.c._filter_packet(self.pkt))
+
+    def test_concurrent_handler_changes(self):
+        def run():
+            for _ in range(200):
+                handler = self.c.add_handler(pycozmo.protocol_encoder.SetRobotVolume, lambda cli, pkt: None)
+                self.c.del_handler(pycozmo.protocol_encoder.SetRobotVolume, handler)
+        threads = [Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        self.c.add_handler(pycozmo.protocol_encoder.SetRobotVolume, lambda cli, pkt: None)
+        for thread in threads:
+            thread.join()
+        # The filter reflects the final set of handlers.
+        self.assertFalse(self.c._filter_packet(self.pkt))
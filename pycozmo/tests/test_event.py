@@ -0,0 +1,208 @@
+
+import unittest
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pycozmo.event import Dispatcher
+from pycozmo import exception
+
+
+class Evt(object):
+    pass
+
+
+class TestDispatcherExecutor(unittest.TestCase):
+
+    def setUp(self):
+        self.d = Dispatcher()
+        self.executor = ThreadPoolExecutor(max_workers=4)
+
+    def tearDown(self):
+        self.executor.shutdown(wait=True)
+
+    def test_inline(self):
+        threads = []
+        self.d.add_handler(Evt, lambda: threads.append(threading.current_thread()))
+        self.d.dispatch(Evt)
+        self.assertEqual(threads, [threading.current_thread()])
+
+    def test_executor_ordering(self):
+        values = []
+        done = threading.Event()
+
+        def handler(i):
+            # Earlier calls take longer. Ordering must still be preserved.
+            time.sleep(0.001 * (10 - i))
+            values.append(i)
+            if i == 9:
+                done.set()
+
+        self.d.add_handler(Evt, handler, executor=self.executor)
+        for i in range(10):
+            self.d.dispatch(Evt, i)
+        self.assertTrue(done.wait(2.0))
+        self.assertEqual(values, list(range(10)))
+
+    def test_executor_does_not_block(self):
+        release = threading.Event()
+        inline = []
+        self.d.add_handler(Evt, lambda: release.wait(2.0), executor=self.executor)
+        self.d.add_handler(Evt, lambda: inline.append(1))
+        start = time.perf_counter()
+        self.d.dispatch(Evt)
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(inline, [1])
+        release.set()
+
+    def test_executor_stats(self):
+        handler = self.d.add_handler(Evt, lambda fail: 1 / (not fail), executor=self.executor)
+        self.d.dispatch(Evt, False)
+        self.d.dispatch(Evt, True)
+        self.d.dispatch(Evt, False)
+        deadline = time.perf_counter() + 2.0
+        while handler.calls < 3 and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        calls, errors, run_time, latency = handler.get_stats()
+        self.assertEqual(calls, 3)
+        self.assertEqual(errors, 1)
+        self.assertEqual(handler.get_pending(), 0)
+        self.assertGreaterEqual(latency, run_time)
+
+    def test_executor_shutdown(self):
+        handler = self.d.add_handler(Evt, lambda: None, executor=self.executor)
+        self.executor.shutdown(wait=True)
+        self.d.dispatch(Evt)
+        self.assertFalse(handler.busy)
+        self.assertEqual(handler.get_pending(), 0)
+
+
+class TestDispatchTable(unittest.TestCase):
+
+    def setUp(self):
+        self.parent = Dispatcher()
+        self.child = Dispatcher()
+        self.grandchild = Dispatcher()
+        self.parent.add_child_dispatcher(self.child)
+        self.child.add_child_dispatcher(self.grandchild)
+
+    def test_flattened_order(self):
+        calls = []
+        self.grandchild.add_handler(Evt, lambda: calls.append(3))
+        self.child.add_handler(Evt, lambda: calls.append(2))
+        self.parent.add_handler(Evt, lambda: calls.append(1))
+        self.parent.dispatch(Evt)
+        self.assertEqual(calls, [1, 2, 3])
+        self.assertEqual(len(self.parent.get_dispatch_table(Evt)), 3)
+
+    def test_cached(self):
+        self.grandchild.add_handler(Evt, lambda: None)
+        table = self.parent.get_dispatch_table(Evt)
+        self.assertIs(self.parent.get_dispatch_table(Evt), table)
+
+    def test_invalidated(self):
+        calls = []
+        self.parent.dispatch(Evt)
+        self.assertFalse(self.parent.has_handlers(Evt))
+        handler = self.grandchild.add_handler(Evt, lambda: calls.append(1))
+        self.assertTrue(self.parent.has_handlers(Evt))
+        self.parent.dispatch(Evt)
+        self.grandchild.del_handler(Evt, handler)
+        self.parent.dispatch(Evt)
+        self.assertEqual(calls, [1])
+        self.grandchild.add_handler(Evt, lambda: calls.append(2))
+        self.parent.del_child_dispatcher(self.child)
+        self.parent.dispatch(Evt)
+        self.assertEqual(calls, [1])
+
+    def test_one_shot(self):
+        calls = []
+        self.child.add_handler(Evt, lambda: calls.append(1), one_shot=True)
+        self.child.add_handler(Evt, lambda: calls.append(2), one_shot=True)
+        self.child.add_handler(Evt, lambda: calls.append(3))
+        self.parent.dispatch(Evt)
+        self.parent.dispatch(Evt)
+        self.assertEqual(calls, [1, 2, 3, 3])
+        self.assertEqual(self.parent.count_handlers()[Evt], 1)
+
+    def test_one_shot_reentrant(self):
+        calls = []
+
+        def handler():
+            calls.append(1)
+            self.parent.dispatch(Evt)
+
+        self.child.add_handler(Evt, handler, one_shot=True)
+        self.child.add_handler(Evt, lambda: calls.append(2), one_shot=True)
+        self.parent.dispatch(Evt)
+        self.assertEqual(calls, [1, 2])
+
+    def test_one_shot_concurrent(self):
+        calls = []
+        self.child.add_handler(Evt, lambda: calls.append(1), one_shot=True)
+        entries = self.parent.get_dispatch_table(Evt)
+        threads = [threading.Thread(target=self.parent.dispatch, args=(Evt, )) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(calls, [1])
+        self.assertEqual(len(entries), 1)
+        self.assertFalse(self.parent.has_handlers(Evt))
+
+
+class TestDispatcherAsync(unittest.TestCase):
+
+    def setUp(self):
+        self.d = Dispatcher()
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def dispatch_later(self, *args, delay=0.01):
+        timer = threading.Timer(delay, self.d.dispatch, args=args)
+        timer.start()
+        return timer
+
+    def test_wait_for_async(self):
+        self.dispatch_later(Evt, self, 42)
+        value = self.loop.run_until_complete(self.d.wait_for_async(Evt, timeout=2.0))
+        self.assertEqual(value, 42)
+        self.assertFalse(self.d.has_handlers(Evt))
+
+    def test_wait_for_async_timeout(self):
+        with self.assertRaises(exception.Timeout):
+            self.loop.run_until_complete(self.d.wait_for_async(Evt, timeout=0.01))
+        self.assertFalse(self.d.has_handlers(Evt))
+
+    def test_events(self):
+        async def consume():
+            values = []
+            async with self.d.events(Evt) as stream:
+                self.assertTrue(self.d.has_handlers(Evt))
+                self.dispatch_later(Evt, self, 1)
+                self.dispatch_later(Evt, self, 2, 3, delay=0.02)
+                async for value in stream:
+                    values.append(value)
+                    if len(values) == 2:
+                        break
+            return values
+
+        self.assertEqual(self.loop.run_until_complete(consume()), [1, (2, 3)])
+        self.assertFalse(self.d.has_handlers(Evt))
+
+    def test_events_bounded(self):
+        async def consume():
+            stream = self.d.events(Evt, maxsize=2)
+            for i in range(5):
+                self.d.dispatch(Evt, self, i)
+            # Let queued callbacks run.
+            await asyncio.sleep(0.01)
+            stream.close()
+            return [value async for value in stream], stream.dropped
+
+        values, dropped = self.loop.run_until_complete(consume())
+        self.assertEqual(values, [3, 4])
+        self.assertEqual(dropped, 3)
@@ -2,6 +2,10 @@
 import unittest
 
 from pycozmo.frame import Frame
+from pycozmo.protocol_ast import FrameType
+from pycozmo.protocol_base import LazyPacket
+from pycozmo.protocol_declaration import OOB_SEQ
+from pycozmo.protocol_encoder import ImageChunk, Ping
 
 
 class TestFrame(unittest.TestCase):
@@ -30,6 +34,57 @@ class TestFrame(unittest.TestCase):
         actual = f.to_bytes()
         self.assertEqual(expected, actual)
 
+    def test_from_memoryview(self):
+        expected = \
+            b'COZ\x03RE\x01\x07\x9d\n\xa0\n\x8f\x00\x04\x01\x00\x8f\x04\x1d\x00\x97\x1a\x00\x15\xb0\xaa\x9c' \
+            b'\xac\xb2@\xa8\xba^\xac\xb2@\x02\xb4\xa2\xa0\xb0\xaa@\xac\xb2`\xb0\xaa\x1b\x04 \x00\x03\x1f\x80' \
+            b'\x1f\x80\t\x00\x00\x00\x00\x00\x1f\x80\x1f\x80\t\x00\x00\x00\x00\x00\x1f\x80\x1f\x80\t\x00\x00' \
+            b'\x00\x00\x00\x00\x04\x16\x00\x11\x1f\x80\x1f\x80\t\x00\x00\x00\x00\x00\x1f\x80\x1f\x80\t\x00' \
+            b'\x00\x00\x00\x00\x00'
+        buffer = bytearray(2048)
+        buffer[:len(expected)] = expected
+        f = Frame.from_bytes(memoryview(buffer)[:len(expected)])
+        self.assertEqual(len(f.pkts), 4)
+        self.assertEqual(f.to_bytes(), expected)
+
+    def test_zero_copy_byte_arrays(self):
+        data = bytes(range(200))
+        expected = Frame(FrameType.ROBOT, OOB_SEQ, OOB_SEQ, 0, [ImageChunk(image_id=1, data=data)]).to_bytes()
+        buffer = bytearray(expected)
+        f = Frame.from_bytes(memoryview(buffer))
+        pkt = f.pkts[0]
+        self.assertIsInstance(pkt.data, memoryview)
+        self.assertIs(pkt.data.obj, buffer)
+        self.assertEqual(pkt.data, data)
+        self.assertIn("data={}".format(data), repr(pkt))
+        self.assertEqual(f.to_bytes(), expected)
+
+    def test_len(self):
+        f = Frame.from_bytes(
+            b'COZ\x03RE\x01\x07\x9d\n\xa0\n\x8f\x00\x04\x01\x00\x8f\x04\x1d\x00\x97\x1a\x00\x15\xb0\xaa\x9c'
+            b'\xac\xb2@\xa8\xba^\xac\xb2@\x02\xb4\xa2\xa0\xb0\xaa@\xac\xb2`\xb0\xaa\x1b\x04 \x00\x03\x1f\x80'
+            b'\x1f\x80\t\x00\x00\x00\x00\x00\x1f\x80\x1f\x80\t\x00\x00\x00\x00\x00\x1f\x80\x1f\x80\t\x00\x00'
+            b'\x00\x00\x00\x00\x04\x16\x00\x11\x1f\x80\x1f\x80\t\x00\x00\x00\x00\x00\x1f\x80\x1f\x80\t\x00'
+            b'\x00\x00\x00\x00\x00')
+        self.assertEqual(len(f), len(f.to_bytes()))
+        f = Frame(FrameType.PING, OOB_SEQ, OOB_SEQ, 0, [Ping(0.0, 1, 0, 0)])
+        self.assertEqual(len(f), len(f.to_bytes()))
+
+    def test_lazy(self):
+        expected = Frame(FrameType.ROBOT, OOB_SEQ, OOB_SEQ, 0, [ImageChunk(image_id=5, data=b"\x01\x02")]).to_bytes()
+        f = Frame.from_bytes(expected, lazy=True)
+        pkt = f.pkts[0]
+        self.assertIsInstance(pkt, LazyPacket)
+        self.assertIs(pkt.packet_class, ImageChunk)
+        self.assertEqual(pkt.id, ImageChunk().id)
+        self.assertFalse(pkt.is_decoded())
+        self.assertEqual(f.to_bytes(), expected)
+        self.assertEqual(pkt.image_id, 5)
+        self.assertTrue(pkt.is_decoded())
+        self.assertIsInstance(pkt.decode(), ImageChunk)
+        self.assertEqual(pkt.decode().seq, pkt.seq)
+        self.assertEqual(f.to_bytes(), expected)
+
     def test_ignore_decode_failures(self):
         # v2214 AnimationState packet with no client_drop_count field is ignored.
         f = Frame.from_bytes(
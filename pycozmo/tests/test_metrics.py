@@ -0,0 +1,189 @@
+
+import unittest
+import time
+import urllib.request
+import urllib.error
+
+import pycozmo
+from pycozmo.metrics import ConnectionStats, Histogram, LatencyProfiler, format_prometheus, \
+    format_prometheus_histograms, MetricsServer
+
+
+class TestConnectionStats(unittest.TestCase):
+
+    def setUp(self):
+        self.c = pycozmo.conn.Connection(("127.0.0.1", 5551))
+
+    def tearDown(self):
+        self.c.sock.close()
+
+    def test_get_stats(self):
+        self.c.send(pycozmo.protocol_encoder.SetRobotVolume(level=100))
+        self.c.post_event("test")
+        stats = self.c.get_stats()
+        self.assertEqual(stats.outgoing_packets, 0)
+        self.assertEqual(stats.send_queue_depth, 1)
+        self.assertEqual(stats.event_queue_depth, 1)
+        self.assertEqual(stats.send_window_occupancy, 0.0)
+        self.assertIsNone(stats.rtt)
+        self.assertIsNone(stats.rtt_p50)
+        self.assertEqual(stats.interval, 0)
+
+    def test_dropped_events(self):
+        for _ in range(3):
+            self.c.post_event(pycozmo.event.EvtNewRawCameraImage, None, None)
+        stats = self.c.get_stats()
+        self.assertEqual(stats.event_queue_depth, 1)
+        self.assertEqual(stats.dropped_events, 2)
+
+    def test_rates(self):
+        stats1 = self.c.get_stats()
+        self.c.receiver.received_bytes += 1000
+        self.c.sender.add_rtt_sample(0.02)
+        time.sleep(0.01)
+        stats2 = self.c.get_stats(stats1)
+        self.assertAlmostEqual(stats2.interval, stats2.timestamp - stats1.timestamp)
+        self.assertAlmostEqual(stats2.received_bytes_rate, 1000 / stats2.interval)
+        self.assertEqual(stats2.sent_bytes_rate, 0.0)
+        self.assertAlmostEqual(stats2.rtt, 0.02)
+        self.assertAlmostEqual(stats2.rtt_p99, 0.02)
+
+    def test_independent_consumers(self):
+        stats1 = self.c.get_stats()
+        self.c.receiver.received_bytes += 1000
+        time.sleep(0.01)
+        # Snapshots without a baseline do not affect rates of other consumers.
+        self.assertEqual(self.c.get_stats().received_bytes_rate, 0)
+        stats2 = self.c.get_stats(stats1)
+        self.assertAlmostEqual(stats2.received_bytes_rate, 1000 / (stats2.timestamp - stats1.timestamp))
+
+
+class TestHistogram(unittest.TestCase):
+
+    def setUp(self):
+        self.h = Histogram()
+
+    def test_empty(self):
+        self.assertEqual(self.h.count, 0)
+        self.assertIsNone(self.h.get_percentile(50))
+        self.assertIsNone(self.h.get_mean())
+
+    def test_buckets(self):
+        for value in (0.0, 0.000001, 0.000015, 0.000016, 0.000017, 0.000018, 1.0, 1000000.0):
+            index = Histogram.get_index(value)
+            self.assertLessEqual(value, Histogram.get_upper_bound(index))
+            if value < 100.0:
+                self.assertGreater(Histogram.get_upper_bound(index), value)
+        self.assertEqual(Histogram.get_index(0.000016), Histogram.get_index(0.000017))
+        self.assertNotEqual(Histogram.get_index(0.000017), Histogram.get_index(0.000018))
+
+    def test_percentile(self):
+        for i in range(1, 101):
+            self.h.record(i / 1000.0)
+        self.assertEqual(self.h.count, 100)
+        self.assertAlmostEqual(self.h.get_mean(), 0.0505)
+        self.assertAlmostEqual(self.h.min, 0.001)
+        self.assertAlmostEqual(self.h.max, 0.1)
+        p50 = self.h.get_percentile(50)
+        self.assertGreaterEqual(p50, 0.05)
+        self.assertLessEqual(p50, 0.05 * 1.125)
+        self.assertAlmostEqual(self.h.get_percentile(100), 0.1)
+
+    def test_count_below(self):
+        self.h.record(0.001)
+        self.h.record(0.01)
+        self.h.record(0.1)
+        self.assertEqual(self.h.get_count_below(0.0005), 0)
+        self.assertEqual(self.h.get_count_below(0.005), 1)
+        self.assertEqual(self.h.get_count_below(1.0), 3)
+        self.assertEqual(sum(count for _, count in self.h.get_buckets()), 3)
+
+
+class TestLatencyProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.c = pycozmo.conn.Connection(("127.0.0.1", 5551))
+        self.c._add_protocol_handlers()
+        self.profiler = self.c.enable_profiling()
+
+    def tearDown(self):
+        self.c.sock.close()
+
+    def receive(self, pkt):
+        oob_seq = pycozmo.protocol_declaration.OOB_SEQ
+        frame = pycozmo.Frame(pycozmo.protocol_declaration.FrameType.ENGINE, oob_seq, oob_seq, oob_seq, [pkt])
+        self.c.receiver.handle_datagram(frame.to_bytes(), self.c.robot_addr)
+
+    def test_stages(self):
+        self.c.add_handler(pycozmo.protocol_encoder.RobotState, lambda cli, pkt: None)
+        pkt = pycozmo.protocol_encoder.RobotState
+        self.receive(pkt.from_bytes(bytes(pkt._codec.size)))
+        evt, args, kwargs = self.c.queue.get_nowait()
+        self.c.dispatch(evt, *args, **kwargs)
+        histograms = self.profiler.get_histograms()
+        self.assertEqual(set(histograms), {
+            (LatencyProfiler.DECODE, "RobotState"),
+            (LatencyProfiler.DELIVER, "RobotState"),
+            (LatencyProfiler.HANDLE, "RobotState"),
+        })
+        self.assertLessEqual(histograms[(LatencyProfiler.DECODE, "RobotState")].max,
+                             histograms[(LatencyProfiler.HANDLE, "RobotState")].max)
+        self.assertIn("RobotState", self.profiler.format_report())
+        text = format_prometheus_histograms([({"robot": "r"}, self.profiler)])
+        self.assertIn('pycozmo_packet_latency_seconds_count{robot="r",stage="handle",packet="RobotState"} 1', text)
+
+    def test_disable(self):
+        self.c.disable_profiling()
+        self.assertIsNone(self.c.receiver.profiler)
+        pkt = pycozmo.protocol_encoder.RobotState
+        self.receive(pkt.from_bytes(bytes(pkt._codec.size)))
+        self.assertEqual(self.profiler.get_histograms(), {})
+
+
+class TestPrometheus(unittest.TestCase):
+
+    def test_format(self):
+        stats = ConnectionStats(received_bytes=10, rtt=None, rto=0.1)
+        text = format_prometheus([({"robot": "127.0.0.1:5551"}, stats)])
+        self.assertIn("# TYPE pycozmo_received_bytes_total counter\n", text)
+        self.assertIn('pycozmo_received_bytes_total{robot="127.0.0.1:5551"} 10.0\n', text)
+        self.assertIn('pycozmo_rto_seconds{robot="127.0.0.1:5551"} 0.1\n', text)
+        self.assertNotIn("pycozmo_rtt_seconds{", text)
+
+    def test_invalid_stats(self):
+        with self.assertRaises(TypeError):
+            ConnectionStats(unknown=1)
+
+
+class TestMetricsServer(unittest.TestCase):
+
+    def setUp(self):
+        self.c = pycozmo.conn.Connection(("127.0.0.1", 5551))
+        self.server = MetricsServer([self.c], ("127.0.0.1", 0))
+        self.server.start()
+        self.url = "http://127.0.0.1:{}".format(self.server.server_address[1])
+
+    def tearDown(self):
+        self.server.stop()
+        self.c.sock.close()
+
+    def test_metrics(self):
+        with urllib.request.urlopen(self.url + "/metrics", timeout=5.0) as response:
+            self.assertEqual(response.status, 200)
+            text = response.read().decode("utf-8")
+        self.assertIn('pycozmo_sent_frames_total{robot="127.0.0.1:5551"} 0.0', text)
+
+    def test_rates(self):
+        stats1 = self.c.get_stats()
+        self.c.receiver.received_bytes += 1000
+        time.sleep(0.01)
+        # Requests do not affect rates of other statistics consumers.
+        self.server.get_metrics()
+        stats2 = self.c.get_stats(stats1)
+        self.assertAlmostEqual(stats2.received_bytes_rate, 1000 / (stats2.timestamp - stats1.timestamp))
+
+    def test_not_found(self):
+        with self.assertRaises(urllib.error.HTTPError) as cm:
+            urllib.request.urlopen(self.url + "/", timeout=5.0)
+        self.assertEqual(cm.exception.code, 404)
+        cm.exception.close()
@@ -0,0 +1,107 @@
+import unittest
+import struct
+import io
+
+from pycozmo.protocol_utils import BinaryReader, BinaryWriter
+from pycozmo.protocol_ast import PacketType
+from pycozmo.protocol_encoder import DriveWheels, RobotState, OutputAudio, ImageChunk, ImageEncoding
+from pycozmo.protocol_generator import ProtocolGenerator
+
+
+class TestBinaryWriter(unittest.TestCase):
+
+    def test_write(self):
+        writer = BinaryWriter()
+        writer.write_bytes(b"COZ")
+        writer.write(1, "B")
+        writer.write(0x1234, "H")
+        writer.write_farray(b"\x05\x06", "B", 2)
+        writer.write_string("abc", "B")
+        self.assertEqual(len(writer), 12)
+        self.assertEqual(writer.dumps(), b"COZ\x01\x34\x12\x05\x06\x03abc")
+
+    def test_grow(self):
+        writer = BinaryWriter(2)
+        writer.write_farray(range(100), "L", 100)
+        writer.write_bytes(bytes(1000))
+        self.assertEqual(len(writer), 1400)
+        reader = BinaryReader(writer.dumps())
+        self.assertEqual(reader.read_farray("L", 100), tuple(range(100)))
+
+    def test_clear(self):
+        writer = BinaryWriter(16)
+        writer.write(1, "L")
+        writer.clear()
+        writer.write(2, "H")
+        self.assertEqual(writer.dumps(), b"\x02\x00")
+
+    def test_getbuffer(self):
+        writer = BinaryWriter(16)
+        writer.write(0x01020304, "L")
+        with writer.getbuffer() as view:
+            self.assertEqual(view, b"\x04\x03\x02\x01")
+        writer.write_bytes(bytes(100))
+        self.assertEqual(len(writer.getbuffer()), 104)
+
+    def test_write_struct(self):
+        writer = BinaryWriter(4)
+        writer.write_struct(struct.Struct("<BHf"), 1, 2, 0.5)
+        self.assertEqual(writer.dumps(), b"\x01\x02\x00\x00\x00\x00\x3f")
+
+
+class TestBinaryReader(unittest.TestCase):
+
+    def test_read_struct(self):
+        reader = BinaryReader(b"\x00\x01\x02\x00\x00\x00\x00\x3f")
+        reader.seek_set(1)
+        self.assertEqual(reader.read_struct(struct.Struct("<BHf")), (1, 2, 0.5))
+        self.assertEqual(reader.tell(), 8)
+        with self.assertRaises(IndexError):
+            reader.read_struct(struct.Struct("<B"))
+
+    def test_read_farray_memoryview(self):
+        buffer = bytearray(b"\x03\x01\x02\x03")
+        reader = BinaryReader(memoryview(buffer))
+        res = reader.read_varray("B", "B")
+        self.assertIsInstance(res, memoryview)
+        self.assertEqual(res, b"\x01\x02\x03")
+
+
+class TestPacketCodecs(unittest.TestCase):
+
+    def test_fixed_layout(self):
+        self.assertIsNotNone(getattr(RobotState, "_codec", None))
+        pkt = DriveWheels(lwheel_speed_mmps=10.0, rwheel_speed_mmps=-20.0, lwheel_accel_mmps2=1.0)
+        self.assertEqual(len(pkt.to_bytes()), DriveWheels._codec.size)
+        pkt2 = DriveWheels.from_bytes(pkt.to_bytes())
+        self.assertEqual(pkt2.lwheel_speed_mmps, 10.0)
+        self.assertEqual(pkt2.rwheel_speed_mmps, -20.0)
+        self.assertEqual(pkt2.lwheel_accel_mmps2, 1.0)
+
+    def test_fixed_layout_arrays(self):
+        raw = bytes(range(RobotState._codec.size))
+        pkt = RobotState.from_bytes(raw)
+        self.assertEqual(list(pkt.cliff_data_raw), [0x5150, 0x5352, 0x5554, 0x5756])
+        self.assertEqual(pkt.to_bytes(), raw)
+
+    def test_unchecked(self):
+        samples = bytes(range(248)) * 3
+        pkt = OutputAudio.unchecked(samples=samples)
+        self.assertEqual(pkt.type, PacketType.COMMAND)
+        self.assertEqual(pkt.id, 0x8e)
+        self.assertEqual(pkt.to_bytes(), OutputAudio(samples=samples).to_bytes())
+        pkt = ImageChunk.unchecked(image_encoding=8, data=b"\x01\x02")
+        self.assertEqual(pkt.image_encoding, ImageEncoding.JPEGMinimizedGray)
+        self.assertEqual(pkt.to_bytes(), ImageChunk(image_encoding=8, data=b"\x01\x02").to_bytes())
+
+    def test_per_field_generation(self):
+        buf = io.StringIO()
+        ProtocolGenerator(buf, struct_codecs=False, unchecked_decoding=False).generate()
+        code = buf.getvalue()
+        self.assertNotIn("read_struct(", code)
+        self.assertNotIn("write_struct(", code)
+        self.assertNotIn("return cls.unchecked(", code)
+        namespace = {"__name__": "pycozmo.protocol_encoder_per_field", "__package__": "pycozmo"}
+        exec(compile(code, namespace["__name__"], "exec"), namespace)
+        raw = bytes(range(RobotState._codec.size))
+        self.assertEqual(namespace["RobotState"].from_bytes(raw).to_bytes(), raw)
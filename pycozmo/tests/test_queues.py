@@ -0,0 +1,130 @@
+
+import unittest
+import threading
+import time
+from queue import Empty
+
+from pycozmo.queues import Priority, PriorityQueue, QueuePolicy, EventQueue
+
+
+class TestPriorityQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.q = PriorityQueue(lambda item: item[0], starvation_limit=3)
+
+    def test_empty(self):
+        self.assertFalse(self.q)
+        self.assertEqual(len(self.q), 0)
+        with self.assertRaises(IndexError):
+            self.q.popleft()
+
+    def test_priority_order(self):
+        self.q.append((Priority.BULK, 1))
+        self.q.append((Priority.REALTIME, 2))
+        self.q.append((Priority.CONTROL, 3))
+        self.q.append((Priority.REALTIME, 4))
+        self.assertEqual(len(self.q), 4)
+        self.assertEqual(self.q.get_lengths(), [1, 2, 1])
+        self.assertEqual([self.q.popleft()[1] for _ in range(4)], [3, 2, 4, 1])
+        self.assertFalse(self.q)
+
+    def test_explicit_priority(self):
+        self.q.append((Priority.BULK, 1))
+        self.q.append((Priority.BULK, 2), Priority.CONTROL)
+        self.assertEqual(self.q.popleft()[1], 2)
+
+    def test_starvation(self):
+        self.q.append((Priority.BULK, 0))
+        for i in range(1, 8):
+            self.q.append((Priority.CONTROL, i))
+        order = [self.q.popleft()[1] for _ in range(8)]
+        self.assertEqual(order, [1, 2, 3, 0, 4, 5, 6, 7])
+        self.assertEqual(self.q.starvation_items, 1)
+
+    def test_clear(self):
+        self.q.append((Priority.BULK, 0))
+        self.q.clear()
+        self.assertFalse(self.q)
+
+    def test_invalid_starvation_limit(self):
+        with self.assertRaises(ValueError):
+            PriorityQueue(starvation_limit=0)
+
+
+class TestEventQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.q = EventQueue()
+
+    def get_all(self):
+        res = []
+        while not self.q.empty():
+            res.append(self.q.get_nowait())
+        return res
+
+    def test_fifo(self):
+        for i in range(3):
+            self.q.put(i, "a")
+        self.assertEqual(self.q.qsize(), 3)
+        self.assertEqual(self.get_all(), [0, 1, 2])
+        with self.assertRaises(Empty):
+            self.q.get(timeout=0.01)
+
+    def test_keep_latest(self):
+        self.q.set_policy("state", QueuePolicy.KEEP_LATEST)
+        self.q.put("s1", "state")
+        self.q.put("e1", "event")
+        self.q.put("s2", "state")
+        self.q.put("s3", "state")
+        self.assertEqual(self.get_all(), ["s3", "e1"])
+        self.assertEqual(self.q.dropped["state"], 2)
+        self.q.put("s4", "state")
+        self.assertEqual(self.get_all(), ["s4"])
+
+    def test_drop_oldest(self):
+        self.q.set_policy("a", QueuePolicy.DROP_OLDEST, 2)
+        self.q.put("a1", "a")
+        self.q.put("b1", "b")
+        self.q.put("a2", "a")
+        self.q.put("a3", "a")
+        self.assertEqual(self.q.qsize(), 3)
+        self.assertEqual(self.get_all(), ["b1", "a2", "a3"])
+        self.assertEqual(self.q.get_dropped(), 1)
+
+    def test_set_policy_with_queued_events(self):
+        self.q.put("a1", "a")
+        self.q.set_policy("a", QueuePolicy.DROP_OLDEST, 1)
+        self.q.put("a2", "a")
+        self.assertEqual(self.get_all(), ["a2"])
+
+    def test_block(self):
+        self.q.set_policy("a", QueuePolicy.BLOCK, 1)
+        self.q.put("a1", "a")
+        t = threading.Thread(target=self.q.put, args=("a2", "a"))
+        t.start()
+        time.sleep(0.05)
+        self.assertTrue(t.is_alive())
+        self.assertEqual(self.q.get(), "a1")
+        t.join(1.0)
+        self.assertFalse(t.is_alive())
+        self.assertEqual(self.q.get(), "a2")
+
+    def test_block_timeout(self):
+        q = EventQueue(maxsize=1, block_timeout=0.01)
+        self.assertTrue(q.put(1))
+        self.assertFalse(q.put(2))
+        self.assertEqual(q.get_dropped(), 1)
+
+    def test_close(self):
+        q = EventQueue(maxsize=1)
+        q.put(1)
+        t = threading.Thread(target=q.put, args=(2, ))
+        t.start()
+        q.close()
+        t.join(1.0)
+        self.assertFalse(t.is_alive())
+        self.assertEqual(q.qsize(), 1)
+
+    def test_invalid_bound(self):
+        with self.assertRaises(ValueError):
+            self.q.set_policy("a", QueuePolicy.KEEP_LATEST, 0)
@@ -0,0 +1,65 @@
+
+import unittest
+
+from pycozmo.rtt import RttEstimator
+
+
+class TestRttEstimator(unittest.TestCase):
+
+    def setUp(self):
+        self.e = RttEstimator(initial_rto=0.1, min_rto=0.01, max_rto=1.0)
+
+    def test_initial(self):
+        self.assertIsNone(self.e.srtt)
+        self.assertEqual(self.e.rto, 0.1)
+
+    def test_first_sample(self):
+        self.e.update(0.02)
+        self.assertAlmostEqual(self.e.srtt, 0.02)
+        self.assertAlmostEqual(self.e.rttvar, 0.01)
+        self.assertAlmostEqual(self.e.rto, 0.02 + 4 * 0.01)
+
+    def test_update(self):
+        self.e.update(0.02)
+        self.e.update(0.04)
+        self.assertAlmostEqual(self.e.rttvar, 0.75 * 0.01 + 0.25 * 0.02)
+        self.assertAlmostEqual(self.e.srtt, 0.875 * 0.02 + 0.125 * 0.04)
+        self.assertAlmostEqual(self.e.min_rtt, 0.02)
+        self.assertAlmostEqual(self.e.last_rtt, 0.04)
+        self.assertEqual(self.e.samples, 2)
+
+    def test_limits(self):
+        self.e.update(0.0)
+        self.assertEqual(self.e.rto, 0.01)
+        self.e.update(10.0)
+        self.assertEqual(self.e.rto, 1.0)
+
+    def test_backoff(self):
+        self.e.backoff()
+        self.assertAlmostEqual(self.e.rto, 0.2)
+        for _ in range(10):
+            self.e.backoff()
+        self.assertEqual(self.e.rto, 1.0)
+        self.e.update(0.02)
+        self.assertEqual(self.e.backoffs, 0)
+        self.assertAlmostEqual(self.e.rto, 0.06)
+
+    def test_reset(self):
+        self.e.update(0.02)
+        self.e.reset()
+        self.assertIsNone(self.e.srtt)
+        self.assertEqual(self.e.rto, 0.1)
+        self.assertEqual(self.e.samples, 0)
+
+    def test_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            RttEstimator(initial_rto=0.01, min_rto=0.1)
+
+    def test_percentile(self):
+        self.assertIsNone(self.e.get_percentile(50))
+        for i in range(1, 101):
+            self.e.update(i / 1000.0)
+        self.assertAlmostEqual(self.e.get_percentile(50), 0.05)
+        self.assertAlmostEqual(self.e.get_percentile(99), 0.099)
+        self.assertAlmostEqual(self.e.get_percentile(100), 0.1)
+        self.assertAlmostEqual(self.e.get_percentile(0), 0.001)
@@ -217,6 +217,13 @@ class TestSendWindow(unittest.TestCase):
         self.assertFalse(self.w.is_out_of_order(0))
         self.assertTrue(self.w.is_out_of_order(1))
 
+    def test_is_empty(self):
+        self.assertTrue(self.w.is_empty())
+        self.w.put("x")
+        self.assertFalse(self.w.is_empty())
+        self.w.acknowledge(0)
+        self.assertTrue(self.w.is_empty())
+
     def test_is_full(self):
         self.assertFalse(self.w.is_full())
         self.w.put("w")
@@ -307,3 +314,42 @@ class TestSendWindow(unittest.TestCase):
         self.w.put("y")
         self.w.put("z")
         self.assertEqual(self.w.get(), [(6, "x"), (7, "y"), (0, "z")])
+
+    def test_get_expired(self):
+        self.w.put("x", 1.0)
+        self.w.put("y", 3.0)
+        self.w.put("z", 2.0)
+        self.assertEqual(self.w.get_expired(0.5), [])
+        self.assertEqual(self.w.get_expired(2.0), [(0, "x"), (2, "z")])
+        self.w.acknowledge(0)
+        self.assertEqual(self.w.get_expired(2.0), [(2, "z")])
+
+    def test_get_oldest_time(self):
+        self.assertIsNone(self.w.get_oldest_time())
+        self.w.put("x", 2.0)
+        self.w.put("y", 1.0)
+        self.assertEqual(self.w.get_oldest_time(), 1.0)
+        self.w.set_time(1, 3.0)
+        self.assertEqual(self.w.get_time(1), 3.0)
+        self.assertEqual(self.w.get_oldest_time(), 2.0)
+
+    def test_get_oldest_time_wrapped(self):
+        self.w.expected_seq = 6
+        self.w.next_seq = 6
+        self.w.put("x", 3.0)
+        self.w.put("y", 2.0)
+        self.w.put("z", 1.0)
+        self.assertEqual(self.w.get_oldest_time(), 1.0)
+        self.w.acknowledge(7)
+        self.assertEqual(self.w.get_expired(1.0), [(0, "z")])
+
+    def test_get_count(self):
+        self.assertEqual(self.w.get_count(), 0)
+        self.w.expected_seq = 6
+        self.w.next_seq = 6
+        self.w.put("x")
+        self.w.put("y")
+        self.w.put("z")
+        self.assertEqual(self.w.get_count(), 3)
+        self.w.acknowledge(6)
+        self.assertEqual(self.w.get_count(), 2)
@@ -113,12 +113,16 @@ class SendWindow(BaseWindow):
     When packets are sent, they are put in the window using the put() method which returns a sequence number.
 
     Packets are removed from the window when they are acknowledged with the acknowledge() method.
+
+    The window keeps the last send time of each packet, allowing unacknowledged packets to be resent individually.
     """
 
     def __init__(self, seq_bits: int, size: Optional[int] = None, max_seq: Optional[int] = None) -> None:
         """ Crate a window by specifying either sequence number bits or size of the window. """
         super().__init__(seq_bits, size, max_seq)
         self.next_seq = 0
+        # Last send times.
+        self.times = [0.0 for _ in range(self.size)]
 
     def is_out_of_order(self, seq: int) -> bool:
         """ Check whether a sequence number is outside the current window (assuming it is valid). """
@@ -128,6 +132,10 @@ class SendWindow(BaseWindow):
             res = seq < self.expected_seq or seq >= self.next_seq
         return res
 
+    def is_empty(self) -> bool:
+        """ Check whether the window is empty. """
+        return self.expected_seq == self.next_seq
+
     def is_full(self) -> bool:
         """ Check whether the window is full. """
         if self.expected_seq > self.next_seq:
@@ -136,11 +144,16 @@ class SendWindow(BaseWindow):
             res = (self.next_seq - self.expected_seq) >= self.size
         return res
 
-    def put(self, data: Any) -> int:
+    def get_count(self) -> int:
+        """ Get the number of unacknowledged entries in the window. """
+        return (self.next_seq - self.expected_seq) % self.max_seq
+
+    def put(self, data: Any, timestamp: float = 0.0) -> int:
         """ Add data to the window. Raises NoSpace exception if the window is full. """
         if self.is_full():
             raise exception.NoSpace("Send window full.")
         self.window[self.next_seq % self.size] = data
+        self.times[self.next_seq % self.size] = timestamp
         seq = self.next_seq
         self.next_seq = (self.next_seq + 1) % self.max_seq
         return seq
@@ -167,7 +180,39 @@ class SendWindow(BaseWindow):
             seq = (seq + 1) % self.max_seq
         return res
 
+    def get_expired(self, deadline: float) -> List[Tuple[int, Any]]:
+        """
+        Get unacknowledged data, last sent before a deadline, as a list of tuples (sequence number, data).
+        """
+        res = []
+        seq = self.expected_seq
+        while seq != self.next_seq:
+            if self.times[seq % self.size] <= deadline:
+                res.append((seq, self.window[seq % self.size]))
+            seq = (seq + 1) % self.max_seq
+        return res
+
+    def get_oldest_time(self) -> Optional[float]:
+        """ Get the oldest send time of unacknowledged data or None if the window is empty. """
+        if self.is_empty():
+            return None
+        res = self.times[self.expected_seq % self.size]
+        seq = (self.expected_seq + 1) % self.max_seq
+        while seq != self.next_seq:
+            res = min(res, self.times[seq % self.size])
+            seq = (seq + 1) % self.max_seq
+        return res
+
+    def get_time(self, seq: int) -> float:
+        """ Get the last send time for a sequence number (assuming it is in the window). """
+        return self.times[seq % self.size]
+
+    def set_time(self, seq: int, timestamp: float) -> None:
+        """ Set the last send time for a sequence number (assuming it is in the window). """
+        self.times[seq % self.size] = timestamp
+
     def reset(self):
         """ Reset the window. """
         super().reset()
         self.next_seq = 0
+        self.times = [0.0 for _ in range(self.size)]
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+"""
+
+PyCozmo performance benchmarks.
+
+Examples:
+
+- compare end-to-end packet encoding and decoding with precompiled per-packet struct codecs and with the earlier
+  field-by-field generated code
+
+    pycozmo_benchmark.py protocol
+
+- compare vectorized camera image conversion with the per-byte implementation
+
+    pycozmo_benchmark.py camera
+
+"""
+
+import sys
+import io
+import types
+import argparse
+import timeit
+
+import numpy as np
+
+import pycozmo
+
+
+PROTOCOL_PACKETS = ("RobotState", "DriveWheels", "AnimHead", "Ping")
+# Camera frame sizes, typical for mini JPEG images.
+CAMERA_FRAMES = (("QVGA gray", 320, 240, False, 10000), ("QVGA color", 160, 240, True, 16000))
+
+
+def load_per_field_encoder() -> types.ModuleType:
+    """
+    Generate and load packet encoder classes with the field-by-field, validating encoding and decoding code of
+    protocol_generator.py before precompiled struct codecs.
+    """
+    buf = io.StringIO()
+    gen = pycozmo.protocol_generator.ProtocolGenerator(buf, struct_codecs=False, unchecked_decoding=False)
+    gen.generate()
+    module = types.ModuleType("pycozmo.protocol_encoder_per_field")
+    module.__package__ = "pycozmo"
+    exec(compile(buf.getvalue(), module.__name__, "exec"), module.__dict__)
+    return module
+
+
+def report(name: str, operation: str, baseline: float, optimized: float) -> None:
+    print("{:<16} {:<8} {:>10.2f} us {:>10.2f} us {:>8.2f}x".format(
+        name, operation, baseline * 1e6, optimized * 1e6, baseline / optimized))
+
+
+def measure(stmt, number: int) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number
+
+
+def do_protocol(args) -> None:
+    number = args.number
+    per_field_encoder = load_per_field_encoder()
+    print("{:<16} {:<8} {:>13} {:>13} {:>9}".format("Packet", "Op", "Per field", "Struct", "Speedup"))
+    for name in PROTOCOL_PACKETS:
+        pkt_class = getattr(pycozmo.protocol_encoder, name)
+        per_field_class = getattr(per_field_encoder, name)
+        if not hasattr(pkt_class, "_codec"):
+            print("ERROR: Packet '{}' does not have a fixed layout.".format(name))
+            sys.exit(1)
+
+        raw = bytes(pkt_class._codec.size)
+        pkt = pkt_class.from_bytes(raw)
+        per_field_pkt = per_field_class.from_bytes(raw)
+        assert pkt.to_bytes() == per_field_pkt.to_bytes() == raw
+
+        baseline = measure(per_field_pkt.to_bytes, number)
+        optimized = measure(pkt.to_bytes, number)
+        report(name, "encode", baseline, optimized)
+
+        baseline = measure(lambda: per_field_class.from_bytes(raw), number)
+        optimized = measure(lambda: pkt_class.from_bytes(raw), number)
+        report(name, "decode", baseline, optimized)
+
+
+def mini_to_jpeg_loop(mini, width, height, header):
+    """ Per-byte mini*ToJpeg format to normal JPEG format conversion, as done before vectorization. """
+    buffer_in = mini.tolist()
+    curr_len = len(mini)
+
+    header_length = len(header)
+    buffer_out = np.array([0] * (curr_len * 2 + header_length), dtype=np.uint8)
+
+    for i in range(header_length):
+        buffer_out[i] = header[i]
+
+    buffer_out[0x5e] = height >> 8
+    buffer_out[0x5f] = height & 0xff
+    buffer_out[0x60] = width >> 8
+    buffer_out[0x61] = width & 0xff
+    while buffer_in[curr_len - 1] == 0xff:
+        curr_len -= 1
+
+    off = header_length
+    for i in range(curr_len - 1):
+        buffer_out[off] = buffer_in[i + 1]
+        off += 1
+        if buffer_in[i + 1] == 0xff:
+            buffer_out[off] = 0
+            off += 1
+
+    buffer_out[off] = 0xff
+    off += 1
+    buffer_out[off] = 0xD9
+
+    return buffer_out
+
+
+def get_mini_image(size: int, color: bool) -> np.ndarray:
+    """ Generate a random mini JPEG image with entropy-coded data statistics and end padding. """
+    rng = np.random.RandomState(0)
+    mini = rng.randint(0, 256, size, dtype=np.uint8)
+    mini[0] = 1 if color else 0
+    mini[-3:] = 0xff
+    return mini
+
+
+def do_camera(args) -> None:
+    number = args.number
+    print("{:<16} {:<8} {:>13} {:>13} {:>9} {:>10}".format(
+        "Frame", "Op", "Per byte", "Vectorized", "Speedup", "Max fps"))
+    for name, width, height, color, size in CAMERA_FRAMES:
+        mini = get_mini_image(size, color)
+        header = pycozmo.camera.MINICOLOR_HEADER if color else pycozmo.camera.MINIGRAY_HEADER
+        optimized_res = pycozmo.camera.mini_to_jpeg_helper(mini, width, height, header)
+        baseline_res = mini_to_jpeg_loop(mini, width, height, header)
+        assert np.array_equal(baseline_res[:len(optimized_res)], optimized_res)
+
+        baseline = measure(lambda: mini_to_jpeg_loop(mini, width, height, header), max(1, number // 100))
+        optimized = measure(lambda: pycozmo.camera.mini_to_jpeg_helper(mini, width, height, header), number)
+        print("{:<16} {:<8} {:>10.2f} us {:>10.2f} us {:>8.2f}x {:>10.0f}".format(
+            name, "convert", baseline * 1e6, optimized * 1e6, baseline / optimized, 1.0 / optimized))
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="cmd", required=True)
+
+    subparser = subparsers.add_parser(
+        "protocol", help="compare packet encoding and decoding with struct codecs and with field-by-field code")
+    subparser.add_argument("-n", "--number", type=int, default=10000, help="number of iterations")
+
+    subparser = subparsers.add_parser(
+        "camera", help="compare vectorized camera image conversion with the per-byte implementation")
+    subparser.add_argument("-n", "--number", type=int, default=1000, help="number of iterations")
+
+    args = parser.parse_args()
+    return args
+
+
+def main():
+    args = parse_arguments()
+    cmd_func = getattr(sys.modules[__name__], "do_" + args.cmd)
+    cmd_func(args)
+
+
+if __name__ == '__main__':
+    main()